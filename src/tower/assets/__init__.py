@@ -0,0 +1,135 @@
+"""
+Game assets.
+
+Sounds are decoded once and the resulting pygame.mixer.Sound objects are shared by every entity
+playing them, so spawning an enemy or building a tower never touches the disk. Fonts are
+resolved the same way, once per name and size.
+"""
+
+from os import listdir
+from os.path import dirname, join
+from typing import Dict, Iterable, Optional, Tuple
+import pygame
+
+ASSETS_DIR = dirname(__file__)
+SOUND_DIRECTORIES = ("sounds", "musics")
+
+
+class SoundCache:
+    """
+    Process-wide cache of decoded sounds, keyed by their path relative to the assets directory.
+
+    Sounds can only be decoded once the mixer is initialized; until then, or when no audio device
+    is available, lookups return None and nothing is cached.
+
+    Attributes:
+        _sounds (dict): The decoded sounds indexed by path (e.g. "sounds/crystal_bubble_small.wav").
+    """
+
+    _sounds: Dict[str, pygame.mixer.Sound] = {}
+
+    @classmethod
+    def get(cls, name: str) -> Optional[pygame.mixer.Sound]:
+        """
+        Retrieves a sound, decoding it on first use.
+
+        Args:
+            name (str): The path of the sound relative to the assets directory.
+
+        Returns:
+            pygame.mixer.Sound: The shared sound, or None if audio is not available.
+        """
+        sound = cls._sounds.get(name)
+        if sound is None and pygame.mixer.get_init():
+            try:
+                sound = pygame.mixer.Sound(join(ASSETS_DIR, *name.split("/")))
+            except (pygame.error, FileNotFoundError):
+                return None
+            cls._sounds[name] = sound
+        return sound
+
+    @classmethod
+    def preload(cls, names: Optional[Iterable[str]] = None) -> int:
+        """
+        Decodes sounds ahead of time, typically at startup once the mixer is initialized.
+
+        Args:
+            names (iterable): The paths of the sounds to load, defaults to every WAV file of the
+                sound and music directories.
+
+        Returns:
+            int: The number of sounds available in the cache.
+        """
+        if names is None:
+            names = [
+                f"{directory}/{file_name}"
+                for directory in SOUND_DIRECTORIES
+                for file_name in sorted(listdir(join(ASSETS_DIR, directory)))
+                if file_name.endswith(".wav")
+            ]
+        for name in names:
+            cls.get(name)
+        return cls.size()
+
+    @classmethod
+    def size(cls) -> int:
+        """
+        Gets the number of cached sounds.
+
+        Returns:
+            int: The number of decoded sounds.
+        """
+        return len(cls._sounds)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drops every cached sound, required after the mixer is shut down."""
+        cls._sounds.clear()
+
+
+class FontRegistry:
+    """
+    Process-wide registry of fonts, keyed by system font name and size.
+
+    Looking up and loading a system font is slow, so each (name, size) is resolved once and the
+    resulting pygame.font.Font is shared by every user.
+
+    Attributes:
+        _fonts (dict): The loaded fonts indexed by (name, size).
+    """
+
+    _fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+
+    @classmethod
+    def get(cls, name: Optional[str], size: int) -> pygame.font.Font:
+        """
+        Retrieves a font, loading it on first use.
+
+        Args:
+            name (str): The system font name, None for the default pygame font.
+            size (int): The size of the font in points.
+
+        Returns:
+            pygame.font.Font: The shared font.
+        """
+        key = (name, size)
+        font = cls._fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(name, size)
+            cls._fonts[key] = font
+        return font
+
+    @classmethod
+    def size(cls) -> int:
+        """
+        Gets the number of loaded fonts.
+
+        Returns:
+            int: The number of fonts in the registry.
+        """
+        return len(cls._fonts)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drops every loaded font, required after the font module is shut down."""
+        cls._fonts.clear()
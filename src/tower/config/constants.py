@@ -4,6 +4,8 @@ STARTING_LIVES = 20
 
 # Window and Display Settings
 TITLE = "Tower Defense"  # Title of the game window
+RENDER_FPS = 60  # Target rendering frame rate, independent of the simulation tick rate
+RENDER_INTERPOLATION = True  # Whether to interpolate enemy positions between simulation steps when rendering
 CELL_SIZE = 20  # Size of each grid cell in pixels
 
 # Board Dimensions
@@ -12,17 +14,28 @@ BOARD_HEIGHT = 400  # Height of the game board in pixels
 UI_WIDTH = 150  # Width of the user interface area in pixels
 WINDOW_WIDTH = BOARD_WIDTH + UI_WIDTH  # Total width of the game window
 WINDOW_HEIGHT = BOARD_HEIGHT  # Total height of the game window
+HUD_HEIGHT = 80  # Height of the strip at the top of the board where scores are displayed
 
 # Grid Dimensions
 GRID_WIDTH = BOARD_WIDTH // CELL_SIZE  # Number of grid columns
 GRID_HEIGHT = BOARD_HEIGHT // CELL_SIZE  # Number of grid rows
 
+# Simulation Timing
+SIMULATION_TICK_RATE = 60  # Number of simulation steps per second
+FIXED_TIMESTEP = 1000 / SIMULATION_TICK_RATE  # Duration of a simulation step in milliseconds
+MAX_STEPS_PER_FRAME = 5  # Maximum number of catch-up steps per rendered frame before the game slows down
+TIME_SCALES = (1, 2, 4)  # Game speeds selectable with the number keys (1x, 2x, 4x)
+WAVE_TRANSITION_DELAY = 3000  # Pause between two waves in milliseconds of game time
+
 # Game Track Settings
 TRACK_WIDTH = 2  # Width of the enemy path in grid cells
 
 # Tower Properties
 TOUR_RANGE = 50  # Default attack range of towers in pixels
 ATTACK_DURATION = 500  # Duration of tower attacks in milliseconds
+TARGETING_STRATEGIES = ("weakest", "strongest", "first", "closest")  # How towers pick their target in range
+# Minimum ready towers x enemies pairs for which a NumPy distance matrix beats the spatial index
+COMBAT_VECTORIZE_THRESHOLD = 16
 
 # Normal Tower Properties
 NORMAL_TOWER_RANGE = 50  # Attack range of normal towers in pixels
@@ -44,7 +57,9 @@ POWER_TOWER_COST = 150  # Cost of power towers in game points
 
 # Enemy Properties
 ENEMY_RADIUS = 10  # Base size of enemy units in pixels
-ENEMY_SPEED = 2  # Base movement speed of enemies in pixels per frame
+ENEMY_SPEED = 120  # Base movement speed of enemies in pixels per second
+# Minimum wave size for which moving the enemies through NumPy arrays beats moving them one by one
+ENEMY_STORE_THRESHOLD = 80
 
 # Normal Enemy Properties
 NORMAL_ENEMY_HEALTH = 150  # Health points of normal enemies
@@ -87,6 +102,29 @@ ENEMY_HEALTH_GRADIENT_STEPS = 10  # Number of steps in the health gradient
 PARTICLE_COLOR_VARIATION = 20  # Maximum color variation for particles
 PARTICLE_SIZE_MIN = 2  # Minimum particle size
 PARTICLE_SIZE_MAX = 4  # Maximum particle size
-PARTICLE_LIFETIME_MIN = 25  # Minimum particle lifetime
-PARTICLE_LIFETIME_MAX = 35  # Maximum particle lifetime
-PARTICLE_SPEED = 1.5  # Base particle movement speed
+PARTICLE_LIFETIME_MIN = 400  # Minimum particle lifetime in milliseconds
+PARTICLE_LIFETIME_MAX = 600  # Maximum particle lifetime in milliseconds
+PARTICLE_SPEED = 90  # Base particle movement speed in pixels per second
+PARTICLE_FADE_DURATION = 500  # Remaining lifetime in milliseconds below which particles fade out
+PARTICLE_BURST_COUNT = 8  # Number of particles emitted when an enemy dies
+PARTICLE_POOL_SIZE = 512  # Maximum number of particles alive at the same time
+PARTICLE_ALPHA_BUCKETS = 8  # Number of pre-baked transparency levels per particle sprite
+
+# Audio Settings
+MUSIC_CHANNELS = 1  # Mixer channels reserved for music, never used by sound effects
+SOUND_VOICE_LIMITS = {"attack": 4, "death": 6}  # Maximum concurrent voices per sound effect category
+SHARED_SOUND_CHANNELS = 2  # Unreserved channels left for one-off sounds such as jingles
+
+# User Interface Settings
+TEXT_CACHE_SIZE = 256  # Maximum number of rendered texts kept by the text cache
+ENTITY_FONT_SIZE = 12  # Size of the font used to label enemies and towers
+SPINNER_SPEED = 360  # Rotation of the login spinner in degrees per second
+
+# Persistence Settings
+PLAYER_STORAGE = "json"  # Storage backend of the players, "json" (players.json) or "sqlite" (players.db)
+SAVE_DELAY = 2.0  # Seconds without changes to the players before they are written in the background
+JOURNAL_COMPACT_SIZE = 100  # Changes appended to the journal before it is folded into the save file
+LEADERBOARD_SIZE = 10  # Players kept in the in-memory index of the best scores
+
+# Account Settings
+BCRYPT_ROUNDS = 12  # Work factor of new password hashes, each step doubles the hashing time
@@ -0,0 +1,81 @@
+from typing import Optional, Tuple
+import pygame
+from pygame.surface import Surface
+from tower.design.grid import Grid
+from tower.design.track import Track
+from tower.config.color import BLACK
+from tower.config.constants import BOARD_WIDTH, BOARD_HEIGHT
+
+
+class BoardBackground:
+    """
+    Pre-rendered static layer of the board: the empty cells of the grid and the track.
+
+    Neither changes during a wave, so the layer is drawn once and blitted every frame. It is
+    rebuilt only when the grid or the track is replaced, or when their version changes (a tower
+    is added or removed, a new track is generated).
+
+    Attributes:
+        surface (pygame.Surface): The pre-rendered background.
+        _source (tuple): The grid, track and their versions the surface was rendered from.
+    """
+
+    def __init__(self, size: Tuple[int, int] = (BOARD_WIDTH, BOARD_HEIGHT)):
+        """
+        Initializes the BoardBackground instance.
+
+        Args:
+            size (tuple): The size of the board in pixels.
+        """
+        self.size = size
+        self.surface: Optional[Surface] = None
+        self._source: Optional[tuple] = None
+
+    def is_stale(self, grid: Grid, track: Track) -> bool:
+        """
+        Checks if the background must be rebuilt for a grid and a track.
+
+        Args:
+            grid (Grid): The current grid.
+            track (Track): The current track.
+
+        Returns:
+            bool: True if the pre-rendered surface does not match the grid and the track.
+        """
+        if self._source is None:
+            return True
+        source_grid, grid_version, source_track, track_version = self._source
+        return not (
+            source_grid is grid
+            and grid_version == grid.version
+            and source_track is track
+            and track_version == track.version
+        )
+
+    def get(self, grid: Grid, track: Track) -> Surface:
+        """
+        Retrieves the background, rebuilding it if the grid or the track changed.
+
+        Args:
+            grid (Grid): The current grid.
+            track (Track): The current track.
+
+        Returns:
+            pygame.Surface: The pre-rendered background.
+        """
+        if self.is_stale(grid, track):
+            if self.surface is None:
+                self.surface = pygame.Surface(self.size)
+            self.surface.fill(BLACK)
+            grid.render_cells(self.surface)
+            track.render(self.surface)
+            self._source = (grid, grid.version, track, track.version)
+        return self.surface
+
+    def invalidate(self) -> None:
+        """Forces the background to be rebuilt on next use."""
+        self._source = None
+
+
+# Background shared by the game screen
+board_background = BoardBackground()
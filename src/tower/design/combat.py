@@ -0,0 +1,146 @@
+"""
+Combat resolution for all the towers of a grid.
+
+Instead of every tower scanning the enemies on its own, the resolver advances the attack timers of
+all towers, gathers the towers ready to fire and resolves their attacks together. With NumPy, the
+distances between the ready towers and the enemies are computed as a single matrix; without it,
+the towers query a shared spatial index. The matrix only pays off once enough towers fire at enough
+enemies, so by default small steps still go through the index.
+"""
+
+from typing import Iterable, List, Optional
+from tower.config.constants import COMBAT_VECTORIZE_THRESHOLD
+from tower.design.spatial_index import SpatialHash
+from tower.entities.enemy_base import EnemyBase
+from tower.entities.tour_base import TourBase
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the installation
+    np = None
+
+HAS_NUMPY = np is not None
+
+
+class CombatResolver:
+    """
+    Resolves the attacks of every tower for a simulation step.
+
+    Attacks are applied in tower order, so an enemy killed by a tower is no longer a valid target
+    for the following ones, exactly as when towers update one by one. Both paths break ties in favor
+    of the enemy spawned first, so they always pick the same targets.
+
+    Attributes:
+        vectorized (bool): Whether distances can be computed with NumPy.
+        threshold (int): The minimum number of ready tower and enemy pairs for which distances are
+            computed with NumPy.
+    """
+
+    def __init__(self, vectorized: Optional[bool] = None):
+        """
+        Initializes a CombatResolver instance.
+
+        Args:
+            vectorized (bool): Whether distances are always computed with NumPy. Defaults to using NumPy,
+                when it is installed, only for steps with at least COMBAT_VECTORIZE_THRESHOLD pairs.
+
+        Raises:
+            RuntimeError: If vectorized resolution is requested without NumPy.
+        """
+        threshold = 0
+        if vectorized is None:
+            vectorized = HAS_NUMPY
+            threshold = COMBAT_VECTORIZE_THRESHOLD
+        if vectorized and not HAS_NUMPY:
+            raise RuntimeError("Vectorized combat requires NumPy.")
+        self.vectorized = vectorized
+        self.threshold = threshold
+
+    def resolve(self, dt: float, towers: Iterable[TourBase], enemies: List[EnemyBase]) -> None:
+        """
+        Advances every tower by one simulation step and applies their attacks.
+
+        Args:
+            dt (float): The elapsed simulation time in milliseconds.
+            towers (iterable): The towers of the grid, in attack order.
+            enemies (list): The list of active enemies in the game.
+        """
+        towers = list(towers)
+        for tower in towers:
+            tower.time_since_last_attack += dt
+
+        ready = [tower for tower in towers if tower.is_ready()]
+        # Most steps have no tower ready, the enemies are only scanned when one is
+        if ready:
+            targets = [enemy for enemy in enemies if enemy.visible and enemy.health > 0]
+            if targets and self.vectorized and len(ready) * len(targets) >= self.threshold:
+                self.fire_vectorized(ready, targets)
+            elif targets:
+                self.fire_indexed(ready, targets)
+
+        for tower in towers:
+            tower.update_attack_animation()
+
+    def fire_indexed(self, towers: List[TourBase], enemies: List[EnemyBase]) -> None:
+        """
+        Fires the ready towers, finding the enemies in range through a spatial index.
+
+        Ties are broken in favor of the enemy spawned first.
+
+        Args:
+            towers (list): The towers ready to fire.
+            enemies (list): The alive and visible enemies, in spawn order.
+        """
+        enemy_index = SpatialHash(enemies)
+        # The index returns enemies grouped by cell, they are put back in spawn order for the tie-break
+        spawn_order = {id(enemy): order for order, enemy in enumerate(enemies)}
+        for tower in towers:
+            center_x, center_y = tower.get_center()
+            in_range = enemy_index.query(center_x, center_y, tower.attack_range)
+            in_range.sort(key=lambda enemy: spawn_order[id(enemy)])
+            target = tower.select_target(in_range)
+            if target is not None:
+                tower.fire(target)
+
+    def fire_vectorized(self, towers: List[TourBase], enemies: List[EnemyBase]) -> None:
+        """
+        Fires the ready towers from a tower-to-enemy distance matrix.
+
+        Ties are broken in favor of the enemy spawned first.
+
+        Args:
+            towers (list): The towers ready to fire.
+            enemies (list): The alive and visible enemies, in spawn order.
+        """
+        enemy_positions = np.array([(enemy.x, enemy.y) for enemy in enemies], dtype=np.float64)
+        tower_positions = np.array([tower.get_center() for tower in towers], dtype=np.float64)
+        ranges = np.array([tower.attack_range for tower in towers], dtype=np.float64)
+
+        offsets = tower_positions[:, np.newaxis, :] - enemy_positions[np.newaxis, :, :]
+        distances_squared = np.einsum("tek,tek->te", offsets, offsets)
+        in_range = distances_squared <= (ranges * ranges)[:, np.newaxis]
+        health = np.array([enemy.health for enemy in enemies], dtype=np.float64)
+        progress: Optional[np.ndarray] = None
+
+        for index in np.flatnonzero(in_range.any(axis=1)).tolist():
+            tower = towers[index]
+            candidates = in_range[index] & (health > 0)
+            if not candidates.any():
+                continue
+
+            # Every strategy is expressed as a score to minimize
+            if tower.targeting == "strongest":
+                scores = -health
+            elif tower.targeting == "first":
+                if progress is None:
+                    progress = np.array([enemy.distance for enemy in enemies], dtype=np.float64)
+                scores = -progress
+            elif tower.targeting == "closest":
+                scores = distances_squared[index]
+            else:
+                scores = health
+            target_index = int(np.argmin(np.where(candidates, scores, np.inf)))
+
+            target = enemies[target_index]
+            tower.fire(target)
+            health[target_index] = target.health
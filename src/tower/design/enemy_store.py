@@ -0,0 +1,245 @@
+"""
+Struct-of-arrays storage of the enemies of a wave.
+
+Positions, distances along the track, speeds and health of every enemy live in NumPy arrays
+indexed by slot, so a whole wave moves with a handful of vectorized operations instead of one
+Python call per enemy. The EnemyBase instances handed to towers, the spatial index and the renderer are thin
+views whose state attributes read and write these arrays.
+
+NumPy is optional: HAS_NUMPY tells whether the store is available, waves fall back to moving
+their enemies one by one otherwise.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple, Type
+from pygame.surface import Surface
+from tower.design.track import TrackPath
+from tower.entities.enemy_base import EnemyBase
+from tower.game.game_manager import GameManager
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the installation
+    np = None
+
+HAS_NUMPY = np is not None
+
+
+def _stored_attribute(name: str) -> property:
+    """
+    Creates a property reading and writing an enemy's value in one of the store's arrays.
+
+    Args:
+        name (str): The name of the array, which is also the name of the attribute.
+
+    Returns:
+        property: The attribute redirected to the enemy's slot of the array.
+    """
+
+    def getter(self: "StoredEnemy") -> Any:
+        return getattr(self._store, name).item(self._slot)
+
+    def setter(self: "StoredEnemy", value: Any) -> None:
+        getattr(self._store, name)[self._slot] = value
+
+    return property(getter, setter, doc=f"The enemy's {name}, stored in the enemy store.")
+
+
+class StoredEnemy:
+    """
+    Mixin turning an enemy class into a view over a slot of an EnemyStore.
+
+    The view classes are built by the store for each enemy class, with the mixin first so its
+    properties take precedence over the enemy's own slots.
+    """
+
+    __slots__ = ()
+
+    x = _stored_attribute("x")
+    y = _stored_attribute("y")
+    previous_x = _stored_attribute("previous_x")
+    previous_y = _stored_attribute("previous_y")
+    distance = _stored_attribute("distance")
+    current_point_index = _stored_attribute("current_point_index")
+    health = _stored_attribute("health")
+    speed = _stored_attribute("speed")
+    reached_end = _stored_attribute("reached_end")
+
+
+class EnemyStore:
+    """
+    NumPy arrays holding the moving state of the enemies of a wave.
+
+    Slots are assigned in spawn order and never reused, so a wave of N enemies needs a store of
+    capacity N and enemies kept by towers after leaving the wave still read their own final state.
+
+    Attributes:
+        capacity (int): The maximum number of enemies the store can hold.
+        count (int): The number of enemies spawned so far.
+        path (TrackPath): The pixel polyline of the track.
+        waypoints (numpy.ndarray): The pixel centers of the track cells, one row per track point.
+        directions (numpy.ndarray): The unit direction of each segment, one row per segment.
+        starts (numpy.ndarray): The distance from the start of the track to each waypoint.
+        x (numpy.ndarray): The x-coordinates of the enemies.
+        y (numpy.ndarray): The y-coordinates of the enemies.
+        previous_x (numpy.ndarray): The x-coordinates before the last simulation step.
+        previous_y (numpy.ndarray): The y-coordinates before the last simulation step.
+        distance (numpy.ndarray): The distances covered along the track.
+        current_point_index (numpy.ndarray): The index of the track point each enemy moves towards.
+        health (numpy.ndarray): The health of the enemies.
+        speed (numpy.ndarray): The speed of the enemies in pixels per second.
+        reached_end (numpy.ndarray): Whether each enemy has reached the end of the track.
+        in_wave (numpy.ndarray): Whether each enemy is still part of the wave.
+        enemies (list): The enemy views, indexed by slot.
+    """
+
+    _view_classes: Dict[type, type] = {}
+
+    def __init__(self, path: TrackPath, capacity: int):
+        """
+        Initializes an EnemyStore instance.
+
+        Args:
+            path (TrackPath): The pixel polyline of the track.
+            capacity (int): The maximum number of enemies the store can hold.
+
+        Raises:
+            RuntimeError: If NumPy is not installed.
+        """
+        if not HAS_NUMPY:
+            raise RuntimeError("The enemy store requires NumPy.")
+
+        self.capacity = capacity
+        self.count = 0
+        self.path = path
+        self.waypoints = np.array(path.waypoints, dtype=np.float64).reshape(-1, 2)
+        self.directions = np.array(path.directions, dtype=np.float64).reshape(-1, 2)
+        self.starts = np.array(path.starts, dtype=np.float64)
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.previous_x = np.zeros(capacity, dtype=np.float64)
+        self.previous_y = np.zeros(capacity, dtype=np.float64)
+        self.distance = np.zeros(capacity, dtype=np.float64)
+        self.current_point_index = np.zeros(capacity, dtype=np.int64)
+        self.health = np.zeros(capacity, dtype=np.int64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.reached_end = np.zeros(capacity, dtype=bool)
+        self.in_wave = np.zeros(capacity, dtype=bool)
+        self.enemies: List[EnemyBase] = []
+
+    @classmethod
+    def get_view_class(cls, enemy_class: Type[EnemyBase]) -> type:
+        """
+        Retrieves the view class of an enemy class, creating it on first use.
+
+        Args:
+            enemy_class (Type): The enemy class.
+
+        Returns:
+            type: A subclass of the enemy class whose state lives in an EnemyStore.
+        """
+        view_class = cls._view_classes.get(enemy_class)
+        if view_class is None:
+            view_class = type(
+                f"Stored{enemy_class.__name__}",
+                (StoredEnemy, enemy_class),
+                {"__slots__": ("_store", "_slot")},
+            )
+            cls._view_classes[enemy_class] = view_class
+        return view_class
+
+    def spawn(
+        self,
+        enemy_class: Type[EnemyBase],
+        screen: Optional[Surface],
+        track_points: List[Tuple[int, int]],
+        game_manager: GameManager,
+    ) -> EnemyBase:
+        """
+        Creates an enemy stored in the next free slot.
+
+        Args:
+            enemy_class (Type): The class of the enemy.
+            screen (pygame.Surface): The game screen, forwarded to the enemy.
+            track_points (list): The points defining the track for enemy movement.
+            game_manager (GameManager): The game manager handling game state.
+
+        Returns:
+            EnemyBase: A view of the enemy, usable wherever an enemy is expected.
+
+        Raises:
+            IndexError: If the store is full.
+        """
+        if self.count >= self.capacity:
+            raise IndexError("The enemy store is full.")
+
+        view_class = self.get_view_class(enemy_class)
+        enemy = view_class.__new__(view_class)
+        # The slot must be known before the dataclass initializer assigns the stored attributes
+        enemy._store = self
+        enemy._slot = self.count
+        enemy.__init__(screen, track_points, game_manager, self.path)
+
+        self.in_wave[self.count] = True
+        self.enemies.append(enemy)
+        self.count += 1
+        return enemy
+
+    def step(self, dt: float) -> "np.ndarray":
+        """
+        Advances every active enemy by one simulation step, like EnemyBase.update does for one enemy.
+
+        Args:
+            dt (float): The elapsed simulation time in milliseconds.
+
+        Returns:
+            numpy.ndarray: The slots of the enemies that left the wave during the step, killed or
+            having reached the end of the track.
+        """
+        count = self.count
+        in_wave = self.in_wave[:count]
+        # Enemies leave the wave at the end of the step that finishes them, so only those killed by
+        # the towers since the last step are still in the wave without being active
+        alive = self.health[:count] > 0
+        active = (in_wave & alive).nonzero()[0]
+        killed = (in_wave & ~alive).nonzero()[0]
+
+        self.previous_x[active] = self.x[active]
+        self.previous_y[active] = self.y[active]
+
+        # Same operations as EnemyBase.move so both paths compute identical positions
+        distance = self.distance[active] + self.speed[active] * dt / 1000
+        moving_slots = active
+        ended_slots = active[:0]
+        ended = distance >= self.path.total_length
+        if ended.any():
+            ended_slots = active[ended]
+            self.distance[ended_slots] = self.path.total_length
+            self.x[ended_slots] = self.waypoints[-1, 0]
+            self.y[ended_slots] = self.waypoints[-1, 1]
+            self.current_point_index[ended_slots] = len(self.waypoints)
+            self.reached_end[ended_slots] = True
+            moving = ~ended
+            moving_slots = active[moving]
+            distance = distance[moving]
+
+        segment = self.starts[:-1].searchsorted(distance, side="right") - 1
+        offset = distance - self.starts[segment]
+        self.distance[moving_slots] = distance
+        self.x[moving_slots] = self.waypoints[segment, 0] + self.directions[segment, 0] * offset
+        self.y[moving_slots] = self.waypoints[segment, 1] + self.directions[segment, 1] * offset
+        self.current_point_index[moving_slots] = segment + 1
+
+        if not (killed.size or ended_slots.size):
+            return killed
+        finished = np.concatenate((killed, ended_slots))
+        in_wave[finished] = False
+        return finished
+
+    def get_enemies(self) -> List[EnemyBase]:
+        """
+        Gets the enemies still part of the wave.
+
+        Returns:
+            list: The enemy views, in spawn order.
+        """
+        return [self.enemies[slot] for slot in np.flatnonzero(self.in_wave[: self.count]).tolist()]
@@ -1,9 +1,12 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import pygame
-import random
 from pygame.surface import Surface
 from tower.game.game_manager import GameManager
 from tower.entities.enemy_base import EnemyBase
+from tower.config.constants import ENEMY_STORE_THRESHOLD
+from tower.design.enemy_store import EnemyStore, HAS_NUMPY
+from tower.design.track import TrackPath
+from tower.effects.particle import particle_system
 from tower.entities.enemies.enemy_normal import EnemyNormal
 from tower.entities.enemies.enemy_big import EnemyBig
 from tower.entities.enemies.enemy_small import EnemySmall
@@ -17,12 +20,14 @@ class EnemyWave:
     Attributes:
         screen (pygame.Surface): The game screen where enemies are drawn.
         track_points (list): The points defining the track for enemy movement.
+        path (TrackPath): The pixel polyline of the track, shared by every enemy of the wave.
         num_enemies (int): The total number of enemies in the wave.
         spawn_delay (int): The delay (in milliseconds) between enemy spawns.
         game_manager (GameManager): The game manager handling game state.
         enemies (list): The list of active enemies in the wave.
         enemies_spawned (int): The number of enemies spawned so far.
-        last_spawn_time (int): The time (in milliseconds) when the last enemy was spawned.
+        time_since_last_spawn (float): The simulation time (in milliseconds) elapsed since the last spawn.
+        store (EnemyStore): The arrays holding the enemies' state when the wave is vectorized, None otherwise.
     """
 
     def __init__(
@@ -32,6 +37,7 @@ class EnemyWave:
         num_enemies: int,
         spawn_delay: int,
         game_manager: GameManager,
+        vectorized: Optional[bool] = False,
     ):
         """
         Initializes the EnemyWave instance.
@@ -42,48 +48,104 @@ class EnemyWave:
             num_enemies (int): The total number of enemies in the wave.
             spawn_delay (int): The delay (in milliseconds) between enemy spawns.
             game_manager (GameManager): The game manager handling game state.
+            vectorized (bool): Whether the enemies are moved all at once through an EnemyStore,
+                which requires NumPy. None uses the store, when NumPy is installed, only for waves of
+                at least ENEMY_STORE_THRESHOLD enemies: below that, its fixed cost per step outweighs
+                the per-enemy savings.
         """
         self.screen = screen
         self.track_points = track_points
+        self.path = TrackPath(track_points)
         self.num_enemies = num_enemies
         self.spawn_delay = spawn_delay
         self.game_manager = game_manager
 
         self.enemies = []
         self.enemies_spawned = 0
-        self.last_spawn_time = 0
+        # The first enemy spawns on the first update
+        self.time_since_last_spawn = float(spawn_delay)
+        if vectorized is None:
+            vectorized = HAS_NUMPY and num_enemies >= ENEMY_STORE_THRESHOLD
+        self.store: Optional[EnemyStore] = EnemyStore(self.path, num_enemies) if vectorized else None
 
-    def update(self) -> None:
+    def update(self, dt: float) -> None:
         """
-        Updates the state of the enemy wave.
+        Advances the enemy wave by one simulation step.
 
-        Handles enemy spawning, movement, drawing, and removal of inactive enemies.
-        Also updates the game manager when an enemy reaches the end of the track.
-        """
-        current_time = pygame.time.get_ticks()
+        Handles enemy spawning, movement, and removal of inactive enemies, then updates
+        the shared particle system. Also updates the game manager when an enemy reaches
+        the end of the track.
 
-        if self.enemies_spawned < self.num_enemies and current_time - self.last_spawn_time >= self.spawn_delay:
-            enemy_class = random.choice([EnemyNormal, EnemyBig, EnemySmall, EnemySlow])
-            enemy = enemy_class(self.screen, self.track_points, self.game_manager)
+        Args:
+            dt (float): The elapsed simulation time in milliseconds.
+        """
+        self.time_since_last_spawn += dt
+
+        if self.enemies_spawned < self.num_enemies and self.time_since_last_spawn >= self.spawn_delay:
+            enemy_class = self.game_manager.rng.gameplay.choice([EnemyNormal, EnemyBig, EnemySmall, EnemySlow])
+            if self.store is not None:
+                enemy = self.store.spawn(enemy_class, self.screen, self.track_points, self.game_manager)
+            else:
+                enemy = enemy_class(self.screen, self.track_points, self.game_manager, self.path)
             self.enemies.append(enemy)
             self.enemies_spawned += 1
-            self.last_spawn_time = current_time
+            self.time_since_last_spawn = 0
+
+        if self.store is not None:
+            self.update_stored_enemies(dt)
+        else:
+            self.update_enemies(dt)
+
+        particle_system.update(dt)
 
-        enemies_to_remove = []
+    def update_enemies(self, dt: float) -> None:
+        """
+        Moves the enemies one by one and removes the inactive ones.
 
+        Args:
+            dt (float): The elapsed simulation time in milliseconds.
+        """
+        active_enemies = []
         for enemy in self.enemies:
+            enemy.update(dt)
+
             if enemy.is_active():
-                enemy.move()
-            enemy.draw()
+                active_enemies.append(enemy)
+            elif enemy.reached_end:
+                self.game_manager.lose_life()
+        self.enemies = active_enemies
+
+    def update_stored_enemies(self, dt: float) -> None:
+        """
+        Moves every enemy at once through the store and removes the inactive ones.
+
+        Args:
+            dt (float): The elapsed simulation time in milliseconds.
+        """
+        finished = self.store.step(dt)
+        if finished.size:
+            for _ in range(int(self.store.reached_end[finished].sum())):
+                self.game_manager.lose_life()
+            self.enemies = self.store.get_enemies()
+
+    def render(self, surface: Surface, interpolation: float = 1.0) -> List[pygame.Rect]:
+        """
+        Draws the enemies of the wave and the shared particle system.
 
-            if not enemy.is_active():
-                if enemy.reached_end:
-                    self.game_manager.lose_life()
-                if not enemy.particles:
-                    enemies_to_remove.append(enemy)
+        Args:
+            surface (pygame.Surface): The surface where the enemies are drawn.
+            interpolation (float): How far rendering is between the previous and the current simulation step (0-1).
 
-        for enemy in enemies_to_remove:
-            self.enemies.remove(enemy)
+        Returns:
+            list: The regions covered by the enemies and the particles.
+        """
+        dirty_rects = []
+        for enemy in self.enemies:
+            enemy_rect = enemy.render(surface, interpolation)
+            if enemy_rect is not None:
+                dirty_rects.append(enemy_rect)
+        dirty_rects.extend(particle_system.draw(surface))
+        return dirty_rects
 
     def is_wave_complete(self) -> bool:
         """
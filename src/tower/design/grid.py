@@ -1,8 +1,8 @@
-from typing import List
+from typing import List, Optional, Tuple
 import pygame
 from pygame.surface import Surface
-from tower.game.game_manager import GameManager
 from tower.entities.enemy_base import EnemyBase
+from tower.design.combat import CombatResolver
 from tower.config.color import WHITE, DARK_GRAY
 from tower.config.constants import CELL_SIZE, BOARD_WIDTH, BOARD_HEIGHT
 from tower.entities.tours.tour_normal import TourNormal
@@ -20,6 +20,8 @@ class Grid:
         grid_color (tuple): The color of the grid lines.
         grid (list): A 2D list representing the grid cells.
         towers (dict): A dictionary mapping grid positions to tower instances.
+        version (int): Incremented whenever a tower is added or removed.
+        combat (CombatResolver): Resolves the attacks of the towers every simulation step.
     """
 
     def __init__(self, screen: Surface):
@@ -34,6 +36,8 @@ class Grid:
         self.grid_color = WHITE
         self.grid = []
         self.towers = {}
+        self.version = 0
+        self.combat = CombatResolver()
 
         # Create the grid as a 2D list
         for row in range(0, (BOARD_HEIGHT // self.cell_size)):
@@ -61,6 +65,7 @@ class Grid:
 
         self.towers[(row, column)] = tower
         self.grid[row][column] = tower_type
+        self.version += 1
 
     def remove_tower(self, row: int, column: int) -> None:
         """
@@ -73,21 +78,33 @@ class Grid:
         if (row, column) in self.towers:
             del self.towers[(row, column)]
             self.grid[row][column] = 0
+            self.version += 1
 
-    def draw(self, enemies: List[EnemyBase], game_manager: GameManager) -> None:
+    def update(self, dt: float, enemies: List[EnemyBase]) -> None:
         """
-        Draws the grid and towers on the screen.
+        Advances every tower by one simulation step.
 
         Args:
+            dt (float): The elapsed simulation time in milliseconds.
             enemies (list): The list of active enemies in the game.
-            game_manager (GameManager): The game manager handling game state.
         """
-        # Draw the grid cells
+        self.combat.resolve(dt, self.towers.values(), enemies)
+
+    def render_cells(self, surface: Surface) -> None:
+        """
+        Draws the outlines of the empty cells.
+
+        They only change when a tower is added or removed, so this is usually drawn once into the
+        board background rather than every frame.
+
+        Args:
+            surface (pygame.Surface): The surface where the grid is drawn.
+        """
         for row in range(0, (BOARD_HEIGHT // self.cell_size)):
             for column in range(0, (BOARD_WIDTH // self.cell_size)):
                 if self.grid[row][column] == 0:
                     pygame.draw.rect(
-                        self.screen,
+                        surface,
                         DARK_GRAY,
                         (
                             self.cell_size * column,
@@ -98,9 +115,32 @@ class Grid:
                         1,
                     )
 
-        # Draw the towers
-        for tower in self.towers.values():
-            tower.draw(enemies, game_manager)
+    def render(
+        self,
+        surface: Surface,
+        show_ranges: bool = False,
+        hovered_cell: Optional[Tuple[int, int]] = None,
+    ) -> List[pygame.Rect]:
+        """
+        Draws the towers.
+
+        Args:
+            surface (pygame.Surface): The surface where the towers are drawn.
+            show_ranges (bool): Whether to display the shooting ranges of every tower.
+            hovered_cell (tuple): The cell (row, column) under the mouse; the range of a tower there is displayed.
+
+        Returns:
+            list: The regions that change from frame to frame (attack beams, hovered range).
+        """
+        dirty_rects = []
+        for position, tower in self.towers.items():
+            hovered = position == hovered_cell
+            beam_rect: Optional[pygame.Rect] = tower.render(surface, show_ranges or hovered)
+            if beam_rect is not None:
+                dirty_rects.append(beam_rect)
+            if hovered and not show_ranges:
+                dirty_rects.append(tower.get_range_rect())
+        return dirty_rects
 
     def get_grid(self) -> List[List[int]]:
         """
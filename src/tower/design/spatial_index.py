@@ -0,0 +1,81 @@
+from typing import Dict, Iterable, List, Tuple
+from tower.entities.enemy_base import EnemyBase
+from tower.config.constants import CELL_SIZE
+
+
+class SpatialHash:
+    """
+    Uniform-grid spatial index of enemies, rebuilt once per frame.
+
+    Enemies are bucketed by the grid cell containing their position so that range queries only
+    examine the enemies of nearby cells instead of every enemy of the wave.
+
+    Attributes:
+        cell_size (int): The size of a bucket in pixels.
+        buckets (dict): The enemies indexed by bucket (column, row).
+    """
+
+    def __init__(self, enemies: Iterable[EnemyBase] = (), cell_size: int = CELL_SIZE):
+        """
+        Initializes the SpatialHash instance.
+
+        Args:
+            enemies (iterable): The enemies to index.
+            cell_size (int): The size of a bucket in pixels.
+        """
+        self.cell_size = cell_size
+        self.buckets: Dict[Tuple[int, int], List[EnemyBase]] = {}
+        self.build(enemies)
+
+    def build(self, enemies: Iterable[EnemyBase]) -> None:
+        """
+        Replaces the content of the index.
+
+        Args:
+            enemies (iterable): The enemies to index.
+        """
+        self.buckets.clear()
+        cell_size = self.cell_size
+        for enemy in enemies:
+            key = (int(enemy.x // cell_size), int(enemy.y // cell_size))
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                self.buckets[key] = [enemy]
+            else:
+                bucket.append(enemy)
+
+    def query(self, x: float, y: float, radius: float) -> List[EnemyBase]:
+        """
+        Finds the enemies within a circular range.
+
+        Args:
+            x (float): The x-coordinate of the range center.
+            y (float): The y-coordinate of the range center.
+            radius (float): The radius of the range in pixels.
+
+        Returns:
+            list: The enemies whose position lies within the range.
+        """
+        cell_size = self.cell_size
+        radius_squared = radius * radius
+        found = []
+        for column in range(int((x - radius) // cell_size), int((x + radius) // cell_size) + 1):
+            for row in range(int((y - radius) // cell_size), int((y + radius) // cell_size) + 1):
+                bucket = self.buckets.get((column, row))
+                if bucket is None:
+                    continue
+                for enemy in bucket:
+                    dx = enemy.x - x
+                    dy = enemy.y - y
+                    if dx * dx + dy * dy <= radius_squared:
+                        found.append(enemy)
+        return found
+
+    def __len__(self) -> int:
+        """
+        Gets the number of indexed enemies.
+
+        Returns:
+            int: The number of enemies in the index.
+        """
+        return sum(len(bucket) for bucket in self.buckets.values())
@@ -1,10 +1,83 @@
-from typing import List, Tuple
+import random
+from itertools import pairwise
+from typing import List, Optional, Tuple
 import pygame
 from pygame.surface import Surface
 from tower.config.color import YELLOW
 from tower.config.constants import TRACK_WIDTH, CELL_SIZE, BOARD_WIDTH, BOARD_HEIGHT
 
 
+class TrackPath:
+    """
+    Pixel polyline of a track, parameterized by arc length.
+
+    Waypoints, segment directions and cumulative lengths are computed once, so a position along
+    the track is described by a single distance from the start and turned back into coordinates
+    with one multiply-add per axis.
+
+    Attributes:
+        waypoints (list): The pixel centers of the track cells (x, y).
+        directions (list): The unit direction of each segment (x, y).
+        starts (list): The distance from the start of the track to each waypoint.
+        total_length (float): The length of the whole track in pixels.
+    """
+
+    def __init__(self, track_points: List[Tuple[int, int]]):
+        """
+        Initializes a TrackPath instance.
+
+        Args:
+            track_points (list): The track points (row, column).
+        """
+        self.waypoints: List[Tuple[float, float]] = [
+            (float(col * CELL_SIZE + CELL_SIZE // 2), float(row * CELL_SIZE + CELL_SIZE // 2))
+            for row, col in track_points
+        ]
+        self.directions: List[Tuple[float, float]] = []
+        self.starts: List[float] = [0.0] if self.waypoints else []
+        for (x1, y1), (x2, y2) in pairwise(self.waypoints):
+            length = ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
+            self.directions.append(((x2 - x1) / length, (y2 - y1) / length) if length > 0 else (0.0, 0.0))
+            self.starts.append(self.starts[-1] + length)
+        self.total_length = self.starts[-1] if self.starts else 0.0
+
+    def get_segment(self, distance: float, hint: int = 0) -> int:
+        """
+        Finds the segment containing a distance along the track.
+
+        The search walks forward from the hint, so callers moving forward along the track pass
+        their previous segment and the lookup takes constant time.
+
+        Args:
+            distance (float): The distance from the start of the track, below total_length.
+            hint (int): A segment at or before the one containing the distance.
+
+        Returns:
+            int: The index of the segment, which starts at waypoint index and ends at index + 1.
+        """
+        segment = hint
+        last_segment = len(self.directions) - 1
+        while segment < last_segment and self.starts[segment + 1] <= distance:
+            segment += 1
+        return segment
+
+    def get_position(self, distance: float, segment: int) -> Tuple[float, float]:
+        """
+        Computes the coordinates of a distance along the track.
+
+        Args:
+            distance (float): The distance from the start of the track.
+            segment (int): The segment containing the distance, as returned by get_segment().
+
+        Returns:
+            tuple: The position (x, y) in pixels.
+        """
+        x, y = self.waypoints[segment]
+        direction_x, direction_y = self.directions[segment]
+        offset = distance - self.starts[segment]
+        return x + direction_x * offset, y + direction_y * offset
+
+
 class Track:
     """
     Represents the track for enemy movement in the game.
@@ -14,6 +87,8 @@ class Track:
         line_width (int): The width of the track lines.
         track_color (tuple): The color of the track lines.
         track (list): A list of tuples representing the track points (row, column).
+        path (TrackPath): The pixel polyline of the track, computed when the track is generated.
+        version (int): Incremented whenever a new track is generated.
     """
 
     def __init__(self, screen: Surface):
@@ -27,20 +102,25 @@ class Track:
         self.line_width = TRACK_WIDTH
         self.track_color = YELLOW
         self.track = []
+        self.path = TrackPath(self.track)
+        self.version = 0
 
-    def generate_random_track(self) -> None:
+    def generate_random_track(self, rng: Optional[random.Random] = None) -> None:
         """
         Generates a random track for enemy movement.
 
         The track starts at the middle of the first column and progresses
         randomly to the right while avoiding revisiting cells.
 
-        Uses:
-            random: To randomly select the next move.
-
         The track is stored as a list of tuples representing grid positions.
+
+        Args:
+            rng (random.Random): The generator used to select the next move, usually the game's
+                gameplay stream. A fresh unseeded generator is used if None.
         """
-        import random
+        if rng is None:
+            rng = random.Random()
+        self.version += 1
 
         row = (BOARD_HEIGHT // CELL_SIZE) // 2
         col = 0
@@ -56,21 +136,24 @@ class Track:
                 moves.append((0, 1))  # Move right
             if not moves:
                 break
-            move = random.choice(moves)
+            move = rng.choice(moves)
             row += move[0]
             col += move[1]
             self.track.append((row, col))
             visited.add((row, col))
+        self.path = TrackPath(self.track)
 
-    def draw(self) -> None:
+    def render(self, surface: Surface) -> None:
         """
-        Draws the track on the game screen.
+        Draws the track.
 
         The track is drawn as a series of connected lines between the track points.
+
+        Args:
+            surface (pygame.Surface): The surface where the track is drawn.
         """
-        if len(self.track) > 1:
-            points = [(col * CELL_SIZE + CELL_SIZE // 2, row * CELL_SIZE + CELL_SIZE // 2) for row, col in self.track]
-            pygame.draw.lines(self.screen, self.track_color, False, points, self.line_width)
+        if len(self.path.waypoints) > 1:
+            pygame.draw.lines(surface, self.track_color, False, self.path.waypoints, self.line_width)
 
     def get_track(self) -> List[Tuple[int, int]]:
         """
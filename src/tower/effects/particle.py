@@ -1,7 +1,9 @@
-from typing import Tuple
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
 import pygame
 from pygame.surface import Surface
 import random
+from tower.effects.sprite_cache import SpriteCache
 from tower.config.constants import (
     PARTICLE_COLOR_VARIATION,
     PARTICLE_SIZE_MIN,
@@ -9,109 +11,306 @@ from tower.config.constants import (
     PARTICLE_LIFETIME_MIN,
     PARTICLE_LIFETIME_MAX,
     PARTICLE_SPEED,
+    PARTICLE_FADE_DURATION,
+    PARTICLE_POOL_SIZE,
+    PARTICLE_ALPHA_BUCKETS,
 )
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the installation
+    np = None
 
-class Particle:
+HAS_NUMPY = np is not None
+
+
+class ParticleSystem:
     """
-    Represents a particle used for visual effects in the game.
+    Pooled particle system used for visual effects in the game.
+
+    Particles live in preallocated arrays indexed by slot. Dead slots go back to a free list and are
+    recycled by the next emission, so emitting and expiring particles never allocates. Particles are
+    drawn from pre-baked sprites, one per (color, radius, alpha bucket).
+
+    With NumPy, the arrays are NumPy arrays and every live particle is moved and aged by a few
+    array-wide operations per update. Without it, they are standard library arrays updated slot by
+    slot.
 
     Attributes:
-        x (float): The x-coordinate of the particle.
-        y (float): The y-coordinate of the particle.
-        color (tuple): The color of the particle (RGB format).
-        radius (int): The radius of the particle.
-        lifetime (int): The remaining lifetime of the particle.
-        dx (float): The horizontal velocity of the particle.
-        dy (float): The vertical velocity of the particle.
-        alpha (int): The opacity of the particle (0-255).
+        capacity (int): The maximum number of particles alive at the same time.
+        vectorized (bool): Whether the particles are stored and updated with NumPy.
+        x (array): The x-coordinates of the particles.
+        y (array): The y-coordinates of the particles.
+        dx (array): The horizontal velocities of the particles in pixels per second.
+        dy (array): The vertical velocities of the particles in pixels per second.
+        lifetime (array): The remaining lifetimes of the particles in milliseconds.
+        radius (array): The radii of the particles.
+        color_index (array): The index of each particle's color in the palette.
+        rng (random.Random): The generator used when an emission does not provide one.
+        palette (list): The distinct particle colors (RGB format).
+        active (list): The slots holding live particles.
+        free_slots (list): The slots available for new particles.
     """
 
-    def __init__(self, x: float, y: float, color: Tuple[int, int, int]):
+    def __init__(self, capacity: int = PARTICLE_POOL_SIZE, vectorized: Optional[bool] = None):
         """
-        Initializes a Particle instance.
+        Initializes a ParticleSystem instance.
 
         Args:
-            x (float): The initial x-coordinate of the particle.
-            y (float): The initial y-coordinate of the particle.
-            color (tuple): The color of the particle (RGB format).
+            capacity (int): The maximum number of particles alive at the same time.
+            vectorized (bool): Whether the particles use NumPy, defaults to whether it is installed.
+
+        Raises:
+            RuntimeError: If vectorized particles are requested without NumPy.
         """
-        self.x = x
-        self.y = y
-        # Create a smoother color variation
-        color_variation = random.randint(-PARTICLE_COLOR_VARIATION, PARTICLE_COLOR_VARIATION)
-        self.color = (
-            max(0, min(255, color[0] + color_variation)),
-            max(0, min(255, color[1] + color_variation)),
-            max(0, min(255, color[2] + color_variation)),
-        )
-        self.radius = random.randint(PARTICLE_SIZE_MIN, PARTICLE_SIZE_MAX)
-        self.lifetime = random.randint(PARTICLE_LIFETIME_MIN, PARTICLE_LIFETIME_MAX)
-        self.dx = random.uniform(-PARTICLE_SPEED, PARTICLE_SPEED)
-        self.dy = random.uniform(-PARTICLE_SPEED, PARTICLE_SPEED)
-        self.alpha = 255  # Opacity of the particle
+        if vectorized is None:
+            vectorized = HAS_NUMPY
+        if vectorized and not HAS_NUMPY:
+            raise RuntimeError("Vectorized particles require NumPy.")
+        self.capacity = capacity
+        self.vectorized = vectorized
+        if vectorized:
+            self.x = np.zeros(capacity, dtype=np.float64)
+            self.y = np.zeros(capacity, dtype=np.float64)
+            self.dx = np.zeros(capacity, dtype=np.float64)
+            self.dy = np.zeros(capacity, dtype=np.float64)
+            self.lifetime = np.zeros(capacity, dtype=np.float64)
+            self.radius = np.zeros(capacity, dtype=np.uint8)
+            self.color_index = np.zeros(capacity, dtype=np.uint16)
+        else:
+            self.x = array("d", [0.0]) * capacity
+            self.y = array("d", [0.0]) * capacity
+            self.dx = array("d", [0.0]) * capacity
+            self.dy = array("d", [0.0]) * capacity
+            self.lifetime = array("d", [0.0]) * capacity
+            self.radius = array("B", [0]) * capacity
+            self.color_index = array("H", [0]) * capacity
+        self.rng = random.Random()
+        self.palette: List[Tuple[int, int, int]] = []
+        self._palette_lookup: Dict[Tuple[int, int, int], int] = {}
+        self.active: List[int] = []
+        self.free_slots: List[int] = list(range(capacity - 1, -1, -1))
 
-    def update(self) -> None:
+    def _get_color_index(self, color: Tuple[int, int, int]) -> int:
         """
-        Updates the particle's position, lifetime, and opacity.
+        Gets the palette index of a color, adding it to the palette if needed.
+
+        Args:
+            color (tuple): The color to look up (RGB format).
 
-        The particle moves based on its velocity and its lifetime decreases.
-        The opacity is adjusted proportionally to the remaining lifetime.
+        Returns:
+            int: The index of the color in the palette.
         """
-        self.x += self.dx
-        self.y += self.dy
-        self.lifetime -= 1
-        self.alpha = int((self.lifetime / 30) * 255)
+        index = self._palette_lookup.get(color)
+        if index is None:
+            index = len(self.palette)
+            self.palette.append(color)
+            self._palette_lookup[color] = index
+        return index
 
-    def draw(self, screen: Surface) -> None:
+    def emit(
+        self,
+        x: float,
+        y: float,
+        color: Tuple[int, int, int],
+        count: int,
+        rng: Optional[random.Random] = None,
+    ) -> None:
         """
-        Draws the particle on the screen with a neon effect.
+        Emits a burst of particles.
+
+        Particles that do not fit in the pool are dropped.
 
         Args:
-            screen (pygame.Surface): The surface where the particle is drawn.
-        """
-        if self.lifetime > 0:
-            # Ensure alpha is in valid range (0-255)
-            self.alpha = max(0, min(255, int(self.alpha)))
-
-            # Draw the main body of the particle
-            particle_color = (
-                max(0, min(255, int(self.color[0]))),
-                max(0, min(255, int(self.color[1]))),
-                max(0, min(255, int(self.color[2]))),
-                self.alpha,
+            x (float): The x-coordinate of the burst.
+            y (float): The y-coordinate of the burst.
+            color (tuple): The base color of the particles (RGB format).
+            count (int): The number of particles to emit.
+            rng (random.Random): The generator of the particles' variations, usually the game's cosmetic stream.
+        """
+        if rng is None:
+            rng = self.rng
+        for _ in range(count):
+            if not self.free_slots:
+                return
+            slot = self.free_slots.pop()
+
+            # Create a smoother color variation, limited to three shades to keep the sprite atlas small
+            color_variation = rng.choice((-PARTICLE_COLOR_VARIATION, 0, PARTICLE_COLOR_VARIATION))
+            varied_color = (
+                max(0, min(255, color[0] + color_variation)),
+                max(0, min(255, color[1] + color_variation)),
+                max(0, min(255, color[2] + color_variation)),
             )
 
-            # Create surface for the particle
-            size = max(1, int(self.radius * 2))
-            particle_surface = pygame.Surface((size, size), pygame.SRCALPHA)
+            self.x[slot] = x
+            self.y[slot] = y
+            self.dx[slot] = rng.uniform(-PARTICLE_SPEED, PARTICLE_SPEED)
+            self.dy[slot] = rng.uniform(-PARTICLE_SPEED, PARTICLE_SPEED)
+            self.lifetime[slot] = rng.uniform(PARTICLE_LIFETIME_MIN, PARTICLE_LIFETIME_MAX)
+            self.radius[slot] = rng.randint(PARTICLE_SIZE_MIN, PARTICLE_SIZE_MAX)
+            self.color_index[slot] = self._get_color_index(varied_color)
+            self.active.append(slot)
 
-            # Draw the particle
-            pygame.draw.circle(
-                particle_surface,
-                particle_color,
-                (size // 2, size // 2),
-                max(1, int(self.radius)),
-            )
+    def update(self, dt: float) -> None:
+        """
+        Updates every live particle.
 
-            # Add a bright point at the center
-            highlight_radius = max(1, int(self.radius * 0.5))
-            highlight_color = (255, 255, 255, self.alpha // 2)
-            pygame.draw.circle(
-                particle_surface,
-                highlight_color,
-                (size // 2, size // 2),
-                highlight_radius,
-            )
+        Particles move based on their velocity and their lifetime decreases. Expired particles
+        release their slot to the free list.
+
+        Args:
+            dt (float): The elapsed simulation time in milliseconds.
+        """
+        if self.vectorized:
+            self.update_vectorized(dt)
+            return
+
+        x, y, dx, dy, lifetime = self.x, self.y, self.dx, self.dy, self.lifetime
+        seconds = dt / 1000
+        alive = []
+        for slot in self.active:
+            lifetime[slot] -= dt
+            if lifetime[slot] > 0:
+                x[slot] += dx[slot] * seconds
+                y[slot] += dy[slot] * seconds
+                alive.append(slot)
+            else:
+                self.free_slots.append(slot)
+        self.active = alive
+
+    def update_vectorized(self, dt: float) -> None:
+        """
+        Updates every live particle with array-wide NumPy operations.
+
+        Computes the same values as the slot by slot update, in the same order.
+
+        Args:
+            dt (float): The elapsed simulation time in milliseconds.
+        """
+        if not self.active:
+            return
+
+        active = np.array(self.active, dtype=np.intp)
+        self.lifetime[active] -= dt
+        alive = self.lifetime[active] > 0
+        moving = active[alive]
+        seconds = dt / 1000
+        self.x[moving] += self.dx[moving] * seconds
+        self.y[moving] += self.dy[moving] * seconds
+
+        self.free_slots.extend(active[~alive].tolist())
+        self.active = moving.tolist()
+
+    def gather(self, values: Any, slots: List[int]) -> list:
+        """
+        Reads the values of some slots of one of the particle arrays.
+
+        Args:
+            values (array): The particle array.
+            slots (list): The slots to read.
+
+        Returns:
+            list: The values of the slots as Python numbers, in the order of the slots.
+        """
+        if self.vectorized:
+            return values[np.array(slots, dtype=np.intp)].tolist()
+        return [values[slot] for slot in slots]
 
-            # Draw the particle on the screen
-            screen.blit(particle_surface, (int(self.x - size // 2), int(self.y - size // 2)))
+    @staticmethod
+    def get_alpha(lifetime: float) -> int:
+        """
+        Computes the opacity of a particle from its remaining lifetime.
+
+        Args:
+            lifetime (float): The remaining lifetime of the particle in milliseconds.
 
-    def is_alive(self) -> bool:
+        Returns:
+            int: The opacity of the particle (0-255).
         """
-        Checks if the particle is still alive.
+        return max(0, min(255, int((lifetime / PARTICLE_FADE_DURATION) * 255)))
+
+    @staticmethod
+    def build_sprite(color: Tuple[int, int, int], radius: int, alpha: int) -> Surface:
+        """
+        Renders a particle with a neon effect onto a new surface.
+
+        Args:
+            color (tuple): The color of the particle (RGB format).
+            radius (int): The radius of the particle.
+            alpha (int): The opacity of the particle (0-255).
 
         Returns:
-            bool: True if the particle's lifetime is greater than 0, False otherwise.
+            pygame.Surface: The rendered particle with alpha channel.
         """
-        return self.lifetime > 0
+        size = max(1, int(radius * 2))
+        particle_surface = pygame.Surface((size, size), pygame.SRCALPHA)
+
+        # Draw the main body of the particle
+        pygame.draw.circle(particle_surface, (*color, alpha), (size // 2, size // 2), max(1, int(radius)))
+
+        # Add a bright point at the center
+        highlight_radius = max(1, int(radius * 0.5))
+        pygame.draw.circle(particle_surface, (255, 255, 255, alpha // 2), (size // 2, size // 2), highlight_radius)
+
+        return particle_surface
+
+    def get_sprite(self, color_index: int, radius: int, lifetime: float) -> Surface:
+        """
+        Retrieves the pre-baked sprite for a particle.
+
+        Args:
+            color_index (int): The index of the particle's color in the palette.
+            radius (int): The radius of the particle.
+            lifetime (float): The remaining lifetime of the particle in milliseconds.
+
+        Returns:
+            pygame.Surface: The particle sprite for the matching alpha bucket.
+        """
+        bucket = self.get_alpha(lifetime) * PARTICLE_ALPHA_BUCKETS // 256
+        color = self.palette[color_index]
+        return SpriteCache.get(
+            ("particle", color, radius, bucket),
+            lambda: self.build_sprite(color, radius, (bucket + 1) * 255 // PARTICLE_ALPHA_BUCKETS),
+        )
+
+    def draw(self, screen: Surface) -> List[pygame.Rect]:
+        """
+        Draws every live particle with a single batched blit.
+
+        Args:
+            screen (pygame.Surface): The surface where the particles are drawn.
+
+        Returns:
+            list: The regions covered by the particles.
+        """
+        slots = self.active
+        blits = []
+        for x, y, radius, color_index, lifetime in zip(
+            self.gather(self.x, slots),
+            self.gather(self.y, slots),
+            self.gather(self.radius, slots),
+            self.gather(self.color_index, slots),
+            self.gather(self.lifetime, slots),
+        ):
+            sprite = self.get_sprite(color_index, radius, lifetime)
+            blits.append((sprite, (int(x) - radius, int(y) - radius)))
+        return screen.blits(blits)
+
+    def count(self) -> int:
+        """
+        Gets the number of live particles.
+
+        Returns:
+            int: The number of particles currently alive.
+        """
+        return len(self.active)
+
+    def clear(self) -> None:
+        """Kills every particle and returns all slots to the free list."""
+        self.active.clear()
+        self.free_slots = list(range(self.capacity - 1, -1, -1))
+
+
+# Particle system shared by every entity of the game
+particle_system = ParticleSystem()
@@ -0,0 +1,110 @@
+"""
+sprite_cache.py
+
+This module keeps pre-rendered sprites so that static visuals are built once and then blitted every frame.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Tuple, Type
+from pygame.surface import Surface
+
+
+class SpriteCache:
+    """
+    Process-wide cache of pre-rendered surfaces.
+
+    Surfaces returned by the cache are shared between every caller and must be treated as read-only.
+
+    Attributes:
+        _sprites (dict): The pre-rendered surfaces, indexed by their cache key.
+    """
+
+    _sprites: Dict[Hashable, Surface] = {}
+
+    @classmethod
+    def get(cls, key: Hashable, builder: Callable[[], Surface]) -> Surface:
+        """
+        Retrieves the surface stored under a key, building it on first use.
+
+        Args:
+            key (Hashable): The key identifying the sprite.
+            builder (Callable): Called without arguments to render the sprite when it is not cached yet.
+
+        Returns:
+            pygame.Surface: The cached surface.
+        """
+        sprite = cls._sprites.get(key)
+        if sprite is None:
+            sprite = builder()
+            cls._sprites[key] = sprite
+        return sprite
+
+    @classmethod
+    def get_tower_sprite(cls, tower_class: Type[Any], color: Tuple[int, int, int], cell_size: int) -> Surface:
+        """
+        Retrieves the pre-rendered body of a tower.
+
+        Args:
+            tower_class (Type): The class of the tower, which provides the build_sprite method.
+            color (tuple): The color of the tower (RGB format).
+            cell_size (int): The size of a single grid cell.
+
+        Returns:
+            pygame.Surface: The tower body, sized cell_size x cell_size.
+        """
+        return cls.get(
+            ("tower", tower_class, tuple(color), cell_size),
+            lambda: tower_class.build_sprite(color, cell_size),
+        )
+
+    @classmethod
+    def get_enemy_stamp(cls, enemy_class: Type[Any], radius: float, color: Tuple[int, int, int]) -> Surface:
+        """
+        Retrieves the pre-rendered glow, body and border of an enemy.
+
+        Args:
+            enemy_class (Type): The class of the enemy, which provides the build_stamp method.
+            radius (float): The radius of the enemy's body.
+            color (tuple): The enemy's (quantized) health color (RGB format).
+
+        Returns:
+            pygame.Surface: The enemy stamp, centered on a square surface.
+        """
+        return cls.get(
+            ("enemy", enemy_class, radius, tuple(color)),
+            lambda: enemy_class.build_stamp(radius, color),
+        )
+
+    @classmethod
+    def get_range_overlay(cls, tower_class: Type[Any], attack_range: int, color: Tuple[int, int, int]) -> Surface:
+        """
+        Retrieves the pre-rendered shooting range indicator of a tower.
+
+        The overlay only depends on the range and the color, so it is shared by every tower with the same stats.
+
+        Args:
+            tower_class (Type): The class of the tower, which provides the build_range_overlay method.
+            attack_range (int): The shooting range of the tower in pixels.
+            color (tuple): The color of the tower (RGB format).
+
+        Returns:
+            pygame.Surface: The range indicator, centered on a square surface of side 2 * attack_range.
+        """
+        return cls.get(
+            ("range", attack_range, tuple(color)),
+            lambda: tower_class.build_range_overlay(attack_range, color),
+        )
+
+    @classmethod
+    def size(cls) -> int:
+        """
+        Gets the number of cached sprites.
+
+        Returns:
+            int: The number of surfaces currently held by the cache.
+        """
+        return len(cls._sprites)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drops every cached sprite, e.g. after the display mode changed."""
+        cls._sprites.clear()
@@ -1,32 +1,15 @@
-import pygame
+from typing import ClassVar
 from tower.entities.enemy_base import EnemyBase
 from tower.config.color import BLUE, WHITE
 from tower.config.constants import NORMAL_ENEMY_HEALTH, NORMAL_ENEMY_POINTS
-from os.path import join
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class EnemyNormal(EnemyBase):
-    color: tuple = field(default=BLUE, init=False)
-    text_color: tuple = field(default=WHITE, init=False)
+    color: ClassVar[tuple] = BLUE
+    text_color: ClassVar[tuple] = WHITE
     health: int = field(default=NORMAL_ENEMY_HEALTH, init=False)
-    points_value: int = field(default=NORMAL_ENEMY_POINTS, init=False)
+    points_value: ClassVar[int] = NORMAL_ENEMY_POINTS
+    death_sound_file: ClassVar[str] = "sounds/crystal_bubble_medium.wav"
     """Standard enemy with balanced health and point value"""
-
-    def __post_init__(self):
-        """
-        Initializes the EnemyNormal instance.
-
-        Sets the initial position based on the first track point and loads the death sound.
-        """
-        super().__post_init__()
-        # Load death sound
-        try:
-            from tower import __file__ as tower_init
-            from os.path import dirname
-
-            base_path = dirname(tower_init)
-            self.death_sound = pygame.mixer.Sound(join(base_path, "assets", "sounds", "crystal_bubble_medium.wav"))
-        except (pygame.error, ImportError):
-            pass  # Skip sound initialization if audio is not available
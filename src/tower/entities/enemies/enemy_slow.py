@@ -1,4 +1,4 @@
-import pygame
+from typing import ClassVar
 from tower.entities.enemy_base import EnemyBase
 from tower.config.constants import (
     ENEMY_RADIUS,
@@ -9,33 +9,16 @@ from tower.config.constants import (
     SLOW_ENEMY_POINTS,
 )
 from tower.config.color import PURPLE, BLACK
-from os.path import join
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class EnemySlow(EnemyBase):
-    color: tuple = field(default=PURPLE, init=False)
-    radius: float = field(default=ENEMY_RADIUS * SLOW_ENEMY_RADIUS_MULTIPLIER, init=False)
-    text_color: tuple = field(default=BLACK, init=False)
+    color: ClassVar[tuple] = PURPLE
+    radius: ClassVar[float] = ENEMY_RADIUS * SLOW_ENEMY_RADIUS_MULTIPLIER
+    text_color: ClassVar[tuple] = BLACK
     health: int = field(default=SLOW_ENEMY_HEALTH, init=False)
     speed: float = field(default=ENEMY_SPEED * SLOW_ENEMY_SPEED_MULTIPLIER, init=False)
-    points_value: int = field(default=SLOW_ENEMY_POINTS, init=False)
+    points_value: ClassVar[int] = SLOW_ENEMY_POINTS
+    death_sound_file: ClassVar[str] = "sounds/crystal_bubble_small.wav"
     """Slow enemy with higher defense but reduced speed"""
-
-    def __post_init__(self):
-        """
-        Initializes the EnemySlow instance.
-
-        Sets the initial position based on the first track point and loads the death sound.
-        """
-        super().__post_init__()
-        # Load death sound
-        try:
-            from tower import __file__ as tower_init
-            from os.path import dirname
-
-            base_path = dirname(tower_init)
-            self.death_sound = pygame.mixer.Sound(join(base_path, "assets", "sounds", "crystal_bubble_small.wav"))
-        except (pygame.error, ImportError):
-            pass  # Skip sound initialization if audio is not available
@@ -1,158 +1,244 @@
-from typing import List, Tuple
+from typing import ClassVar, List, Optional, Tuple
 import pygame
 from pygame.surface import Surface
 from tower.game.game_manager import GameManager
-from tower.config.constants import CELL_SIZE, ENEMY_RADIUS, ENEMY_SPEED, ENEMY_DAMAGED_COLOR
+from tower.config.constants import (
+    ENEMY_RADIUS,
+    ENEMY_SPEED,
+    ENEMY_DAMAGED_COLOR,
+    ENEMY_HEALTH_GRADIENT_STEPS,
+    PARTICLE_BURST_COUNT,
+    ENTITY_FONT_SIZE,
+)
 from tower.config.color import RED, BLACK
-from tower.effects.particle import Particle
-from dataclasses import dataclass, field
+from tower.effects.particle import particle_system
+from tower.effects.sprite_cache import SpriteCache
+from tower.game.sound_manager import SoundManager
+from tower.assets import FontRegistry
+from tower.design.track import TrackPath
+from dataclasses import InitVar, dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class EnemyBase:
-    screen: Surface
+    screen: InitVar[Optional[Surface]]
     track_points: List[Tuple[int, int]]
     game_manager: GameManager
+    path: Optional[TrackPath] = None
+    distance: float = field(default=0.0, init=False)
     current_point_index: int = field(default=0, init=False)
     health: int = field(default=100, init=False)
-    font: pygame.font.Font = field(default_factory=lambda: pygame.font.SysFont(None, 12), init=False)
-    particles: List[Particle] = field(default_factory=list, init=False)
     visible: bool = field(default=True, init=False)
-    points_value: int = field(default=25, init=False)
+    points_value: ClassVar[int] = 25
     x: float = field(init=False)
     y: float = field(init=False)
-    radius: int = field(default=ENEMY_RADIUS, init=False)
-    color: Tuple[int, int, int] = field(default=RED, init=False)
-    text_color: Tuple[int, int, int] = field(default=BLACK, init=False)
+    previous_x: float = field(init=False)
+    previous_y: float = field(init=False)
+    radius: ClassVar[int] = ENEMY_RADIUS
+    color: ClassVar[Tuple[int, int, int]] = RED
+    text_color: ClassVar[Tuple[int, int, int]] = BLACK
     speed: float = field(default=ENEMY_SPEED, init=False)
     reached_end: bool = field(default=False, init=False)
-    death_sound: pygame.mixer.Sound = field(init=False)
+    death_sound_file: ClassVar[Optional[str]] = None
 
     """
     Represents an enemy in the game.
 
     Attributes:
-        screen (pygame.Surface): The game screen where the enemy is drawn.
+        screen (pygame.Surface): Accepted for compatibility and not stored, enemies are drawn on the
+            surface passed to render().
         track_points (list): The points defining the track for enemy movement.
         game_manager (GameManager): The game manager handling game state (optional).
+        path (TrackPath): The pixel polyline of the track, shared by the enemies of a wave. Built from
+            track_points if None.
+        distance (float): The distance covered along the track in pixels.
         current_point_index (int): The index of the current track point the enemy is moving towards.
         health (int): The health of the enemy.
-        font (pygame.font.Font): The font used to display the enemy's health.
-        particles (list): A list of particles for visual effects when the enemy is removed.
         visible (bool): Whether the enemy is visible on the screen.
-        points_value (int): The points awarded for defeating the enemy.
+        points_value (int): The points awarded for defeating the enemy (shared by the class).
         x (float): The x-coordinate of the enemy's position.
         y (float): The y-coordinate of the enemy's position.
-        radius (int): The radius of the enemy's representation.
-        color (tuple): The color of the enemy (RGB format).
-        text_color (tuple): The color of the text displaying the enemy's health.
-        speed (float): The speed of the enemy's movement.
+        previous_x (float): The x-coordinate of the enemy's position before the last simulation step.
+        previous_y (float): The y-coordinate of the enemy's position before the last simulation step.
+        radius (int): The radius of the enemy's representation (shared by the class).
+        color (tuple): The color of the enemy (RGB format, shared by the class).
+        text_color (tuple): The color of the text displaying the enemy's health (shared by the class).
+        speed (float): The speed of the enemy's movement in pixels per second.
         reached_end (bool): Whether the enemy has reached the end of the track.
+        death_sound_file (str): The death sound, relative to the assets directory (shared by the class).
     """
 
-    def __post_init__(self):
+    def __post_init__(self, screen: Optional[Surface]):
         """
         Initializes the enemy's position based on the first track point.
 
         Sets the initial x and y coordinates based on the first track point in the track_points list.
+
+        Args:
+            screen (pygame.Surface): Unused, see the class attributes.
         """
         if not self.track_points:
             raise ValueError("Track points must not be empty.")
 
-        start_row, start_col = self.track_points[0]
-        self.x = start_col * CELL_SIZE + CELL_SIZE // 2
-        self.y = start_row * CELL_SIZE + CELL_SIZE // 2
+        if self.path is None:
+            self.path = TrackPath(self.track_points)
+        self.x, self.y = self.path.waypoints[0]
+        self.previous_x = self.x
+        self.previous_y = self.y
+
+    @property
+    def font(self) -> pygame.font.Font:
+        """
+        Gets the font used to display the enemy's health.
 
-        # Initialize death_sound to None by default
-        self.death_sound = None
+        The font is shared by every entity and only loaded the first time it is needed.
 
-    def move(self) -> None:
+        Returns:
+            pygame.font.Font: The shared entity font.
+        """
+        return FontRegistry.get(None, ENTITY_FONT_SIZE)
+
+    def update(self, dt: float) -> None:
+        """
+        Advances the enemy by one simulation step.
+
+        Args:
+            dt (float): The elapsed simulation time in milliseconds.
+        """
+        self.previous_x = self.x
+        self.previous_y = self.y
+        if self.is_active():
+            self.move(dt)
+
+    def move(self, dt: float) -> None:
         """
         Moves the enemy along the track.
 
-        Updates the enemy's position based on its speed and the target track point.
-        Marks the enemy as having reached the end if it completes the track.
+        Advances the distance covered along the track based on the enemy's speed and the elapsed
+        time, then places the enemy on the track at that distance. Marks the enemy as having
+        reached the end if it completes the track.
+
+        Args:
+            dt (float): The elapsed simulation time in milliseconds.
         """
         if self.reached_end or self.health <= 0:
             return
 
-        target_row, target_col = self.track_points[self.current_point_index]
-        target_x = target_col * CELL_SIZE + CELL_SIZE // 2
-        target_y = target_row * CELL_SIZE + CELL_SIZE // 2
+        path = self.path
+        self.distance += self.speed * dt / 1000
+        if self.distance >= path.total_length:
+            self.distance = path.total_length
+            self.x, self.y = path.waypoints[-1]
+            self.current_point_index = len(path.waypoints)
+            self.reached_end = True
+            return
+
+        # Enemies only move forward, so the search starts from the segment they were on
+        segment = path.get_segment(self.distance, max(self.current_point_index - 1, 0))
+        self.x, self.y = path.get_position(self.distance, segment)
+        self.current_point_index = segment + 1
 
-        dx = target_x - self.x
-        dy = target_y - self.y
-        distance = (dx**2 + dy**2) ** 0.5
+    def get_progress(self) -> float:
+        """
+        Computes how far along the track the enemy is.
 
-        if distance < float(self.speed):
-            self.current_point_index += 1
-            if self.current_point_index >= len(self.track_points):
-                self.reached_end = True
-                return
-        else:
-            self.x += (dx / distance) * self.speed
-            self.y += (dy / distance) * self.speed
+        Returns:
+            float: The covered fraction of the track, from 0 at the start to 1 at the end.
+        """
+        if self.path.total_length <= 0:
+            return 1.0
+        return self.distance / self.path.total_length
 
-    def draw(self) -> None:
+    def get_health_color(self) -> Tuple[int, int, int]:
         """
-        Draws the enemy and its particles on the screen.
+        Computes the enemy's color for its current health.
 
-        Displays the enemy's health and handles particle effects when the enemy is removed.
+        The color fades from the base color to the damaged color as health decreases. Health is
+        quantized into ENEMY_HEALTH_GRADIENT_STEPS buckets so the number of distinct colors, and
+        therefore of cached stamps, stays bounded.
+
+        Returns:
+            tuple: The color of the enemy (RGB format).
+        """
+        health_ratio = max(0.0, min(1.0, float(self.health) / 100.0))
+        health_ratio = round(health_ratio * ENEMY_HEALTH_GRADIENT_STEPS) / ENEMY_HEALTH_GRADIENT_STEPS
+        # Transition from base color to red as health decreases
+        base_color = self.color
+        damaged_color = ENEMY_DAMAGED_COLOR  # Color for damaged enemies
+        return (
+            int(base_color[0] * health_ratio + damaged_color[0] * (1 - health_ratio)),
+            int(base_color[1] * health_ratio + damaged_color[1] * (1 - health_ratio)),
+            int(base_color[2] * health_ratio + damaged_color[2] * (1 - health_ratio)),
+        )
+
+    @classmethod
+    def build_stamp(cls, radius: float, color: Tuple[int, int, int]) -> Surface:
+        """
+        Renders the enemy's neon glow, body and border onto a new surface.
+
+        Called once per (enemy class, radius, color) by the sprite cache. The enemy is centered
+        on the returned square surface.
+
+        Args:
+            radius (float): The radius of the enemy's body.
+            color (tuple): The color of the enemy (RGB format).
+
+        Returns:
+            pygame.Surface: The rendered enemy with alpha channel.
+        """
+        glow_radius = int(radius * 1.5)
+        border_size = int(radius * 2.2)
+        size = max(glow_radius * 2, border_size)
+        center = size // 2
+        stamp = pygame.Surface((size, size), pygame.SRCALPHA)
+
+        # Neon glow effect made of multiple circles
+        for r in range(int(glow_radius), int(radius), -1):
+            alpha = int(30 * (r / glow_radius))
+            s = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
+            pygame.draw.circle(s, (*color, alpha), (r, r), r)
+            stamp.blit(s, (center - r, center - r))
+
+        # Main enemy body with neon effect
+        for r in range(int(radius), 0, -1):
+            alpha = int(255 * (r / radius))
+            s = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
+            pygame.draw.circle(s, (*color, alpha), (r, r), r)
+            stamp.blit(s, (center - r, center - r))
+
+        # Add glowing border
+        border_surface = pygame.Surface((border_size, border_size), pygame.SRCALPHA)
+        pygame.draw.circle(
+            border_surface,
+            (*color, 160),
+            (int(radius * 1.1), int(radius * 1.1)),
+            int(radius),
+            2,
+        )
+        stamp.blit(border_surface, (center - int(radius * 1.1), center - int(radius * 1.1)))
+
+        return stamp
+
+    def render(self, surface: Surface, interpolation: float = 1.0) -> Optional[pygame.Rect]:
+        """
+        Draws the enemy.
+
+        The enemy's color reflects its remaining health. Nothing is drawn once the enemy is removed.
+
+        Args:
+            surface (pygame.Surface): The surface where the enemy is drawn.
+            interpolation (float): How far rendering is between the previous and the current simulation step (0-1).
+
+        Returns:
+            pygame.Rect: The region covered by the enemy, or None if nothing was drawn.
         """
         if self.visible:
-            # Calculate color based on health
-            health_ratio = max(0.0, min(1.0, float(self.health) / 100.0))
-            # Transition from base color to red as health decreases
-            base_color = self.color
-            damaged_color = ENEMY_DAMAGED_COLOR  # Color for damaged enemies
-            current_color = (
-                int(base_color[0] * health_ratio + damaged_color[0] * (1 - health_ratio)),
-                int(base_color[1] * health_ratio + damaged_color[1] * (1 - health_ratio)),
-                int(base_color[2] * health_ratio + damaged_color[2] * (1 - health_ratio)),
-            )
-
-            # Neon glow effect
-            glow_radius = int(self.radius * 1.5)
-
-            # Create multiple circles for glow effect
-            for r in range(int(glow_radius), int(self.radius), -1):
-                alpha = int(30 * (r / glow_radius))
-                s = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
-                pygame.draw.circle(s, (*current_color, alpha), (r, r), r)
-                self.screen.blit(s, (int(self.x - r), int(self.y - r)))
-
-            # Main enemy body with neon effect
-            for r in range(int(self.radius), 0, -1):
-                alpha = int(255 * (r / self.radius))
-                s = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
-                pygame.draw.circle(s, (*current_color, alpha), (r, r), r)
-                self.screen.blit(s, (int(self.x - r), int(self.y - r)))
-
-            # Add glowing border
-            border_surface = pygame.Surface((int(self.radius * 2.2), int(self.radius * 2.2)), pygame.SRCALPHA)
-            pygame.draw.circle(
-                border_surface,
-                (*current_color, 160),
-                (int(self.radius * 1.1), int(self.radius * 1.1)),
-                int(self.radius),
-                2,
-            )
-            self.screen.blit(
-                border_surface,
-                (int(self.x - self.radius * 1.1), int(self.y - self.radius * 1.1)),
-            )
-
-        particles_alive = False
-        for particle in self.particles[:]:
-            particle.update()
-            if particle.is_alive():
-                particle.draw(self.screen)
-                particles_alive = True
-            else:
-                self.particles.remove(particle)
-
-        if not particles_alive and not self.visible:
-            self.x = -100
+            x = self.previous_x + (self.x - self.previous_x) * interpolation
+            y = self.previous_y + (self.y - self.previous_y) * interpolation
+            stamp = SpriteCache.get_enemy_stamp(type(self), self.radius, self.get_health_color())
+            offset = stamp.get_width() // 2
+            return surface.blit(stamp, (int(x) - offset, int(y) - offset))
+        return None
 
     def is_active(self) -> bool:
         """
@@ -176,24 +262,21 @@ class EnemyBase:
 
     def play_death_sound(self) -> None:
         """Plays the enemy's death sound if one is defined and audio is available"""
-        try:
-            if hasattr(self, "death_sound"):
-                self.death_sound.play()
-        except (pygame.error, AttributeError):
-            # Skip playing sound if audio is not available
-            pass
+        if self.death_sound_file is not None:
+            SoundManager.play("death", self.death_sound_file)
 
     def remove(self) -> None:
         """
         Removes the enemy from the game.
 
-        Triggers particle effects, plays death sound, and updates the game manager with points and enemy kill count.
+        Emits particle effects, plays death sound, and updates the game manager with points and enemy kill count.
         """
         self.play_death_sound()
 
-        for i in range(8):
-            particle = Particle(self.x, self.y, RED)
-            self.particles.append(particle)
+        # Cosmetic effects use their own stream and are skipped entirely in headless games
+        rng = self.game_manager.rng if self.game_manager else None
+        if rng is None or rng.effects_enabled:
+            particle_system.emit(self.x, self.y, RED, PARTICLE_BURST_COUNT, rng.cosmetic if rng else None)
 
         if self.game_manager and self.visible:
             self.game_manager.add_points(self.points_value)
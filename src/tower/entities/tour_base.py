@@ -1,11 +1,15 @@
-from typing import List, Optional
+from typing import ClassVar, Iterable, Optional, Tuple
 import pygame
 from pygame.surface import Surface
-from tower.game.game_manager import GameManager
 from tower.entities.enemy_base import EnemyBase
+from tower.effects.sprite_cache import SpriteCache
+from tower.game.sound_manager import SoundManager
+from tower.assets import FontRegistry
+from tower.design.spatial_index import SpatialHash
 from tower.config.constants import (
     ATTACK_DURATION,
     CELL_SIZE,
+    ENTITY_FONT_SIZE,
     RANGE_CIRCLES_COUNT,
     RANGE_MIN_ALPHA,
     RANGE_MAX_ALPHA,
@@ -13,70 +17,93 @@ from tower.config.constants import (
     RANGE_GLOW_ALPHA,
 )
 from tower.config.color import GREEN, WHITE, RED
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
 
 
-@dataclass()
+@dataclass(slots=True)
 class TourBase:
-    screen: Surface
+    screen: InitVar[Optional[Surface]]
     column: int
     row: int
-    color: tuple = field(default=GREEN, init=False)
-    text_color: tuple = field(default=WHITE, init=False)
+    color: ClassVar[tuple] = GREEN
+    text_color: ClassVar[tuple] = WHITE
     health: int = field(default=1000, init=False)
-    damage: int = field(default=35, init=False)
-    attack_speed: float = field(default=1.0, init=False)
-    last_attack_time: int = field(default_factory=lambda: pygame.time.get_ticks(), init=False)
-    attack_range: int = field(default=60, init=False)
-    cost: int = field(default=100, init=False)
-    cell_size: int = field(default=CELL_SIZE, init=False)
-    font: pygame.font.Font = field(default_factory=lambda: pygame.font.SysFont(None, 12), init=False)
+    damage: ClassVar[int] = 35
+    attack_speed: ClassVar[float] = 1.0
+    time_since_last_attack: float = field(default=float("inf"), init=False)
+    attack_range: ClassVar[int] = 60
+    cost: ClassVar[int] = 100
+    cell_size: ClassVar[int] = CELL_SIZE
     is_attacking: bool = field(default=False, init=False)
-    attack_animation_duration: int = field(default=ATTACK_DURATION, init=False)
+    attack_animation_duration: ClassVar[int] = ATTACK_DURATION
     current_target: Optional[EnemyBase] = field(default=None, init=False)
+    attack_sound_file: ClassVar[Optional[str]] = None
+    targeting: ClassVar[str] = "weakest"
     """
     Represents a defensive tower in the game.
     
     Attributes:
-        screen (pygame.Surface): The game screen where the tower is drawn.
+        screen (pygame.Surface): Accepted for compatibility and not stored, towers are drawn on the
+            surface passed to render().
         column (int): The column position of the tower on the grid.
         row (int): The row position of the tower on the grid.
-        color (tuple): The color of the tower (RGB format).
-        text_color (tuple): The color of the text displaying the tower's damage.
+        color (tuple): The color of the tower (RGB format, shared by the class).
+        text_color (tuple): The color of the text displaying the tower's damage (shared by the class).
         health (int): The health of the tower.
-        damage (int): The damage dealt by the tower to enemies.
-        attack_speed (float): The attack speed of the tower (attacks per second).
-        last_attack_time (int): The time (in milliseconds) of the last attack.
-        attack_range (int): The range within which the tower can attack enemies.
-        cost (int): The cost of the tower.
-        cell_size (int): The size of a single grid cell.
-        font (pygame.font.Font): The font used to display the tower's damage.
+        damage (int): The damage dealt by the tower to enemies (shared by the class).
+        attack_speed (float): The attack speed of the tower (attacks per second) (shared by the class).
+        time_since_last_attack (float): The simulation time (in milliseconds) elapsed since the last attack.
+        attack_range (int): The range within which the tower can attack enemies (shared by the class).
+        cost (int): The cost of the tower (shared by the class).
+        cell_size (int): The size of a single grid cell (shared by the class).
         is_attacking (bool): Whether the tower is currently attacking.
-        attack_animation_duration (int): The duration of the attack animation (in milliseconds).
+        attack_animation_duration (int): The duration of the attack animation (in milliseconds) (shared by the class).
         current_target (Enemy): The current enemy being targeted by the tower.
+        attack_sound_file (str): The attack sound, relative to the assets directory (shared by the class).
+        targeting (str): How the tower picks its target among the enemies in range, one of TARGETING_STRATEGIES
+            (shared by the class).
     """
 
+    def __post_init__(self, screen: Optional[Surface]):
+        """
+        Discards the screen, which is only accepted for compatibility.
+
+        Args:
+            screen (pygame.Surface): Unused, see the class attributes.
+        """
+
+    @property
+    def font(self) -> pygame.font.Font:
+        """
+        Gets the font used to display the tower's damage.
+
+        The font is shared by every entity and only loaded the first time it is needed.
+
+        Returns:
+            pygame.font.Font: The shared entity font.
+        """
+        return FontRegistry.get(None, ENTITY_FONT_SIZE)
+
     def play_attack_sound(self) -> None:
         """Plays the tower's attack sound if one is defined and audio is available"""
-        try:
-            if hasattr(self, "attack_sound"):
-                self.attack_sound.play()
-        except (pygame.error, AttributeError):
-            # Skip playing sound if audio is not available
-            pass
+        if self.attack_sound_file is not None:
+            SoundManager.play("attack", self.attack_sound_file)
 
-    def draw(self, enemies: List[EnemyBase], game_manager: GameManager) -> None:
+    @classmethod
+    def build_sprite(cls, color: Tuple[int, int, int], size: int) -> Surface:
         """
-        Draws the tower on the screen and handles its attack logic.
+        Renders the tower's body onto a new surface.
+
+        Called once per (tower class, color, cell size) by the sprite cache; subclasses
+        may override it to give their towers a different look.
 
         Args:
-            enemies (list): A list of Enemy objects currently in the game.
-            game_manager (GameManager): The game manager handling game state.
+            color (tuple): The color of the tower (RGB format).
+            size (int): The size of the tower sprite in pixels.
+
+        Returns:
+            pygame.Surface: The rendered tower body with alpha channel.
         """
-        # Base coordinates of the tower
-        x = self.cell_size * self.column
-        y = self.cell_size * self.row
-        size = self.cell_size
         padding = 2  # Space for the glowing border
 
         # Create a surface for the tower with alpha channel
@@ -84,17 +111,17 @@ class TourBase:
 
         # Fill in with the base color (darker)
         base_color = (
-            max(0, self.color[0] - 30),
-            max(0, self.color[1] - 30),
-            max(0, self.color[2] - 30),
+            max(0, color[0] - 30),
+            max(0, color[1] - 30),
+            max(0, color[2] - 30),
         )
         pygame.draw.rect(tower_surface, base_color, (0, 0, size, size))
 
         # Add a subtle grid pattern
         grid_color = (
-            max(0, self.color[0] - 15),
-            max(0, self.color[1] - 15),
-            max(0, self.color[2] - 15),
+            max(0, color[0] - 15),
+            max(0, color[1] - 15),
+            max(0, color[2] - 15),
         )
         for i in range(0, size, 4):
             pygame.draw.line(tower_surface, grid_color, (i, 0), (i, size))
@@ -102,13 +129,13 @@ class TourBase:
 
         # Draw the main square with a glowing border
         inner_rect = pygame.Rect(padding, padding, size - 2 * padding, size - 2 * padding)
-        pygame.draw.rect(tower_surface, self.color, inner_rect)
+        pygame.draw.rect(tower_surface, color, inner_rect)
 
         # Add highlights on the edges
         highlight_color = (
-            min(255, self.color[0] + 50),
-            min(255, self.color[1] + 50),
-            min(255, self.color[2] + 50),
+            min(255, color[0] + 50),
+            min(255, color[1] + 50),
+            min(255, color[2] + 50),
         )
         pygame.draw.line(
             tower_surface,
@@ -127,9 +154,9 @@ class TourBase:
 
         # Add a darker outer border
         border_color = (
-            max(0, self.color[0] - 50),
-            max(0, self.color[1] - 50),
-            max(0, self.color[2] - 50),
+            max(0, color[0] - 50),
+            max(0, color[1] - 50),
+            max(0, color[2] - 50),
         )
         pygame.draw.rect(tower_surface, border_color, (0, 0, size, size), 1)
 
@@ -139,97 +166,210 @@ class TourBase:
         glow_size = 3
         pygame.draw.circle(tower_surface, glow_color, glow_pos, glow_size)
 
-        # Draw the tower on the screen
-        self.screen.blit(tower_surface, (x, y))
+        return tower_surface
 
-        center_x = self.cell_size * self.column + self.cell_size // 2
-        center_y = self.cell_size * self.row + self.cell_size // 2
+    def get_center(self) -> Tuple[int, int]:
+        """
+        Gets the center of the tower.
+
+        Returns:
+            tuple: The center of the tower's cell in pixels (x, y).
+        """
+        return (
+            self.cell_size * self.column + self.cell_size // 2,
+            self.cell_size * self.row + self.cell_size // 2,
+        )
+
+    def get_attack_delay(self) -> float:
+        """
+        Gets the time between two attacks.
+
+        Returns:
+            float: The attack delay in milliseconds.
+        """
+        return (1 / self.attack_speed) * 1000
+
+    def is_ready(self) -> bool:
+        """
+        Checks if the tower can attack.
+
+        Returns:
+            bool: True if enough time has elapsed since the last attack.
+        """
+        return self.time_since_last_attack >= self.get_attack_delay()
+
+    def select_target(self, enemies: Iterable[EnemyBase]) -> Optional[EnemyBase]:
+        """
+        Picks the enemy to attack according to the tower's targeting strategy.
+
+        Args:
+            enemies (iterable): The enemies in range.
+
+        Returns:
+            EnemyBase: The first best valid enemy (alive and visible), or None if there is none.
+        """
+        candidates = [enemy for enemy in enemies if enemy.visible and enemy.health > 0]
+        if not candidates:
+            return None
+        if self.targeting == "strongest":
+            return max(candidates, key=lambda enemy: enemy.health)
+        if self.targeting == "first":
+            return max(candidates, key=lambda enemy: enemy.distance)
+        if self.targeting == "closest":
+            center_x, center_y = self.get_center()
+            return min(candidates, key=lambda enemy: (enemy.x - center_x) ** 2 + (enemy.y - center_y) ** 2)
+        return min(candidates, key=lambda enemy: enemy.health)
+
+    def fire(self, target: EnemyBase) -> None:
+        """
+        Attacks a target and starts the attack animation.
+
+        Args:
+            target (EnemyBase): The enemy to attack.
+        """
+        self.attack(target)
+        self.time_since_last_attack = 0
+        self.play_attack_sound()
+        self.is_attacking = True
+        self.current_target = target
+
+    def update_attack_animation(self) -> None:
+        """Stops the attack animation once it has run its course or the target is gone."""
+        if not (
+            self.is_attacking
+            and self.current_target
+            and self.current_target.visible
+            and self.time_since_last_attack <= self.attack_animation_duration
+        ):
+            self.is_attacking = False
+            self.current_target = None
+
+    def update(self, dt: float, enemy_index: SpatialHash) -> None:
+        """
+        Advances the tower's attack logic by one simulation step.
+
+        Towers on a grid are usually advanced together by a CombatResolver instead.
 
-        # Display shooting range only for the first two waves
-        if game_manager and game_manager.get_current_wave() <= 2:
-            # Create a surface with alpha channel for the shooting range
-            range_surface = pygame.Surface((self.attack_range * 2, self.attack_range * 2), pygame.SRCALPHA)
-
-            # Draw multiple concentric circles with varying transparency
-            for r in range(self.attack_range, self.attack_range - RANGE_CIRCLES_COUNT, -1):
-                # Calculate alpha based on circle position
-                progress = (r - (self.attack_range - RANGE_CIRCLES_COUNT)) / RANGE_CIRCLES_COUNT
-                alpha = int(RANGE_MIN_ALPHA + (RANGE_MAX_ALPHA - RANGE_MIN_ALPHA) * progress)
-
-                # Use a slightly tinted color based on the tower's color
-                range_color = (
-                    min(255, self.color[0] + RANGE_COLOR_INTENSITY),
-                    min(255, self.color[1] + RANGE_COLOR_INTENSITY),
-                    min(255, self.color[2] + RANGE_COLOR_INTENSITY),
-                    alpha,
-                )
-                pygame.draw.circle(
-                    range_surface,
-                    range_color,
-                    (self.attack_range, self.attack_range),
-                    r,
-                    1,
-                )
-
-            # Add a very subtle glow effect
-            glow_color = (255, 255, 255, RANGE_GLOW_ALPHA)
+        Args:
+            dt (float): The elapsed simulation time in milliseconds.
+            enemy_index (SpatialHash): A spatial index of the enemies, shared by every tower of the step.
+        """
+        self.time_since_last_attack += dt
+
+        if self.is_ready():
+            center_x, center_y = self.get_center()
+            target = self.select_target(enemy_index.query(center_x, center_y, self.attack_range))
+            if target is not None:
+                self.fire(target)
+
+        self.update_attack_animation()
+
+    @staticmethod
+    def build_range_overlay(attack_range: int, color: Tuple[int, int, int]) -> Surface:
+        """
+        Renders a shooting range indicator onto a new surface.
+
+        Called once per (range, color) by the sprite cache.
+
+        Args:
+            attack_range (int): The shooting range in pixels.
+            color (tuple): The color of the tower (RGB format).
+
+        Returns:
+            pygame.Surface: The range indicator with alpha channel, centered on a square surface.
+        """
+        # Create a surface with alpha channel for the shooting range
+        range_surface = pygame.Surface((attack_range * 2, attack_range * 2), pygame.SRCALPHA)
+
+        # Draw multiple concentric circles with varying transparency
+        for r in range(attack_range, attack_range - RANGE_CIRCLES_COUNT, -1):
+            # Calculate alpha based on circle position
+            progress = (r - (attack_range - RANGE_CIRCLES_COUNT)) / RANGE_CIRCLES_COUNT
+            alpha = int(RANGE_MIN_ALPHA + (RANGE_MAX_ALPHA - RANGE_MIN_ALPHA) * progress)
+
+            # Use a slightly tinted color based on the tower's color
+            range_color = (
+                min(255, color[0] + RANGE_COLOR_INTENSITY),
+                min(255, color[1] + RANGE_COLOR_INTENSITY),
+                min(255, color[2] + RANGE_COLOR_INTENSITY),
+                alpha,
+            )
             pygame.draw.circle(
                 range_surface,
-                glow_color,
-                (self.attack_range, self.attack_range),
-                self.attack_range - 1,
+                range_color,
+                (attack_range, attack_range),
+                r,
                 1,
             )
 
-            # Display the range surface
-            self.screen.blit(
-                range_surface,
-                (center_x - self.attack_range, center_y - self.attack_range),
+        # Add a very subtle glow effect
+        glow_color = (255, 255, 255, RANGE_GLOW_ALPHA)
+        pygame.draw.circle(
+            range_surface,
+            glow_color,
+            (attack_range, attack_range),
+            attack_range - 1,
+            1,
+        )
+
+        return range_surface
+
+    def get_range_rect(self) -> pygame.Rect:
+        """
+        Gets the region covered by the tower's range indicator.
+
+        Returns:
+            pygame.Rect: The square enclosing the shooting range.
+        """
+        center_x = self.cell_size * self.column + self.cell_size // 2
+        center_y = self.cell_size * self.row + self.cell_size // 2
+        return pygame.Rect(
+            center_x - self.attack_range,
+            center_y - self.attack_range,
+            self.attack_range * 2,
+            self.attack_range * 2,
+        )
+
+    def render_range(self, surface: Surface) -> None:
+        """
+        Draws the tower's shooting range from the pre-rendered overlay.
+
+        Args:
+            surface (pygame.Surface): The surface where the range is drawn.
+        """
+        overlay = SpriteCache.get_range_overlay(type(self), self.attack_range, self.color)
+        surface.blit(overlay, self.get_range_rect())
+
+    def render(self, surface: Surface, show_range: bool = False) -> Optional[pygame.Rect]:
+        """
+        Draws the tower, its shooting range and its attack beam.
+
+        Args:
+            surface (pygame.Surface): The surface where the tower is drawn.
+            show_range (bool): Whether to display the tower's shooting range.
+
+        Returns:
+            pygame.Rect: The region covered by the attack beam, or None if the tower is not attacking.
+        """
+        # Draw the pre-rendered tower body
+        sprite = SpriteCache.get_tower_sprite(type(self), self.color, self.cell_size)
+        surface.blit(sprite, (self.cell_size * self.column, self.cell_size * self.row))
+
+        center_x = self.cell_size * self.column + self.cell_size // 2
+        center_y = self.cell_size * self.row + self.cell_size // 2
+
+        if show_range:
+            self.render_range(surface)
+
+        if self.is_attacking and self.current_target and self.current_target.visible:
+            return pygame.draw.line(
+                surface,
+                RED,
+                (center_x, center_y),
+                (self.current_target.x, self.current_target.y),
+                3,
             )
-        if enemies:
-            enemies_in_range = []
-            for enemy in enemies:
-                distance = ((enemy.x - center_x) ** 2 + (enemy.y - center_y) ** 2) ** 0.5
-                if distance <= self.attack_range:
-                    enemies_in_range.append(enemy)
-
-            if enemies_in_range:
-                # Set is_attacking to True if any enemy is in range
-                self.is_attacking = True
-                current_time = pygame.time.get_ticks()
-
-                # Filter valid enemies (alive and visible)
-                valid_enemies = [e for e in enemies_in_range if e.visible and e.health > 0]
-
-                if valid_enemies:
-                    attack_delay = (1 / self.attack_speed) * 1000
-                    time_since_last_attack = current_time - self.last_attack_time
-                    if time_since_last_attack >= attack_delay:
-                        target = min(valid_enemies, key=lambda e: e.health)
-                        # Final check that the target is still valid
-                        if target.visible and target.health > 0:
-                            self.attack(target)
-                            self.last_attack_time = current_time
-                            self.play_attack_sound()
-                            self.is_attacking = True
-                            self.current_target = target
-
-                if self.is_attacking and self.current_target and self.current_target.visible:
-                    attack_animation_time = current_time - self.last_attack_time
-                    if attack_animation_time <= self.attack_animation_duration:
-                        pygame.draw.line(
-                            self.screen,
-                            RED,
-                            (center_x, center_y),
-                            (self.current_target.x, self.current_target.y),
-                            3,
-                        )
-                    else:
-                        self.is_attacking = False
-                        self.current_target = None
-                else:
-                    self.is_attacking = False
-                    self.current_target = None
+        return None
 
     def attack(self, enemy: EnemyBase) -> None:
         """
@@ -1,4 +1,4 @@
-import pygame
+from typing import ClassVar
 from tower.entities.tour_base import TourBase
 from tower.config.color import BLUE
 from tower.config.constants import (
@@ -7,28 +7,15 @@ from tower.config.constants import (
     NORMAL_TOWER_DAMAGE,
     NORMAL_TOWER_COST,
 )
-from os.path import join
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class TourNormal(TourBase):
-    color: tuple = field(default=BLUE, init=False)
-    attack_range: int = field(default=NORMAL_TOWER_RANGE, init=False)
-    attack_speed: float = field(default=NORMAL_TOWER_ATTACK_SPEED, init=False)
-    damage: int = field(default=NORMAL_TOWER_DAMAGE, init=False)
-    cost: int = field(default=NORMAL_TOWER_COST, init=False)
+    color: ClassVar[tuple] = BLUE
+    attack_range: ClassVar[int] = NORMAL_TOWER_RANGE
+    attack_speed: ClassVar[float] = NORMAL_TOWER_ATTACK_SPEED
+    damage: ClassVar[int] = NORMAL_TOWER_DAMAGE
+    cost: ClassVar[int] = NORMAL_TOWER_COST
+    attack_sound_file: ClassVar[str] = "sounds/crystal_laser_medium.wav"
     """Tour with balanced stats for general purpose defense"""
-
-    def __post_init__(self):
-        super().__init__(self.screen, self.column, self.row)
-        # Only load sound if screen is defined (not during type initialization)
-        if self.screen is not None:
-            try:
-                from tower import __file__ as tower_init
-                from os.path import dirname
-
-                base_path = dirname(tower_init)
-                self.attack_sound = pygame.mixer.Sound(join(base_path, "assets", "sounds", "crystal_laser_medium.wav"))
-            except (pygame.error, ImportError):
-                pass  # Skip sound initialization if audio is not available
@@ -1,4 +1,4 @@
-import pygame
+from typing import ClassVar
 from tower.entities.tour_base import TourBase
 from tower.config.color import RED
 from tower.config.constants import (
@@ -7,28 +7,15 @@ from tower.config.constants import (
     POWER_TOWER_DAMAGE,
     POWER_TOWER_COST,
 )
-from os.path import join
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class TourPower(TourBase):
-    color: tuple = field(default=RED, init=False)
-    attack_range: int = field(default=POWER_TOWER_RANGE, init=False)
-    attack_speed: float = field(default=POWER_TOWER_ATTACK_SPEED, init=False)
-    damage: int = field(default=POWER_TOWER_DAMAGE, init=False)
-    cost: int = field(default=POWER_TOWER_COST, init=False)
+    color: ClassVar[tuple] = RED
+    attack_range: ClassVar[int] = POWER_TOWER_RANGE
+    attack_speed: ClassVar[float] = POWER_TOWER_ATTACK_SPEED
+    damage: ClassVar[int] = POWER_TOWER_DAMAGE
+    cost: ClassVar[int] = POWER_TOWER_COST
+    attack_sound_file: ClassVar[str] = "sounds/crystal_laser_short.wav"
     """High damage tower with increased attack speed and range"""
-
-    def __post_init__(self):
-        super().__init__(self.screen, self.column, self.row)
-        # Only load sound if screen is defined (not during type initialization)
-        if self.screen is not None:
-            try:
-                from tower import __file__ as tower_init
-                from os.path import dirname
-
-                base_path = dirname(tower_init)
-                self.attack_sound = pygame.mixer.Sound(join(base_path, "assets", "sounds", "crystal_laser_short.wav"))
-            except (pygame.error, ImportError):
-                pass  # Skip sound initialization if audio is not available
@@ -0,0 +1,136 @@
+import pygame
+from abc import ABC, abstractmethod
+from tower.config.constants import FIXED_TIMESTEP
+
+
+class GameClock(ABC):
+    """
+    Source of game time, shared through the GameManager.
+
+    Each tick returns the frame time scaled by the clock's time scale, so everything driven by the
+    clock speeds up or slows down together.
+
+    Attributes:
+        time_scale (float): The multiplier applied to the frame time (2.0 runs the game twice as fast).
+    """
+
+    def __init__(self, time_scale: float = 1.0):
+        """
+        Initializes a GameClock instance.
+
+        Args:
+            time_scale (float): The multiplier applied to the frame time.
+        """
+        self.time_scale = time_scale
+
+    @abstractmethod
+    def read_frame_time(self, fps: int) -> float:
+        """
+        Reads the unscaled duration of the last frame.
+
+        Args:
+            fps (int): The target frame rate, 0 for no limit.
+
+        Returns:
+            float: The duration of the last frame in milliseconds.
+        """
+
+    def tick(self, fps: int = 0) -> float:
+        """
+        Advances the clock by one frame.
+
+        Args:
+            fps (int): The target frame rate, 0 for no limit.
+
+        Returns:
+            float: The scaled duration of the frame in milliseconds.
+        """
+        return self.read_frame_time(fps) * self.time_scale
+
+    def set_time_scale(self, time_scale: float) -> None:
+        """
+        Changes the speed of the game.
+
+        Args:
+            time_scale (float): The multiplier applied to the frame time.
+
+        Raises:
+            ValueError: If the time scale is not positive.
+        """
+        if time_scale <= 0:
+            raise ValueError("Time scale must be positive.")
+        self.time_scale = time_scale
+
+    def get_time_scale(self) -> float:
+        """
+        Retrieves the speed of the game.
+
+        Returns:
+            float: The multiplier applied to the frame time.
+        """
+        return self.time_scale
+
+
+class RealClock(GameClock):
+    """
+    Clock following the wall clock, used by the game window.
+
+    Attributes:
+        clock (pygame.time.Clock): The pygame clock measuring and limiting the frame rate.
+    """
+
+    def __init__(self, time_scale: float = 1.0):
+        """
+        Initializes a RealClock instance.
+
+        Args:
+            time_scale (float): The multiplier applied to the frame time.
+        """
+        super().__init__(time_scale)
+        self.clock = pygame.time.Clock()
+
+    def read_frame_time(self, fps: int) -> float:
+        """
+        Waits for the next frame and measures the time spent since the previous one.
+
+        Args:
+            fps (int): The target frame rate, 0 for no limit.
+
+        Returns:
+            float: The duration of the last frame in milliseconds.
+        """
+        return self.clock.tick(fps)
+
+
+class ManualClock(GameClock):
+    """
+    Clock advanced by the caller, used by tests and headless simulations.
+
+    Frames never wait, so a game driven by this clock runs as fast as the CPU allows.
+
+    Attributes:
+        frame_time (float): The unscaled duration of a frame in milliseconds.
+    """
+
+    def __init__(self, frame_time: float = FIXED_TIMESTEP, time_scale: float = 1.0):
+        """
+        Initializes a ManualClock instance.
+
+        Args:
+            frame_time (float): The unscaled duration of a frame in milliseconds.
+            time_scale (float): The multiplier applied to the frame time.
+        """
+        super().__init__(time_scale)
+        self.frame_time = frame_time
+
+    def read_frame_time(self, fps: int) -> float:
+        """
+        Returns the configured frame time without waiting.
+
+        Args:
+            fps (int): Ignored, a manual clock is never limited.
+
+        Returns:
+            float: The duration of a frame in milliseconds.
+        """
+        return self.frame_time
@@ -1,5 +1,7 @@
-from typing import Type, Any
+from typing import Type, Any, Optional
 from tower.config.constants import STARTING_POINTS, STARTING_LIVES
+from .clock import GameClock, RealClock
+from .rng import GameRandom
 from .save_manager import save_high_score
 
 
@@ -17,11 +19,18 @@ class GameManager:
         wave_completed (bool): Indicates whether the current wave is completed.
         lives (int): The number of lives remaining for the player.
         game_over (bool): Indicates whether the game is over.
+        score_saved (bool): Indicates whether the score of the finished game has been saved.
+        clock (GameClock): The source of game time.
+        rng (GameRandom): The source of randomness of the game.
     """
 
-    def __init__(self):
+    def __init__(self, clock: Optional[GameClock] = None, rng: Optional[GameRandom] = None):
         """
         Initializes a GameManager instance with default values.
+
+        Args:
+            clock (GameClock): The source of game time, defaults to a clock following the wall clock.
+            rng (GameRandom): The source of randomness, defaults to a randomly seeded one.
         """
         self.points = STARTING_POINTS
         self.enemies_killed = 0
@@ -29,6 +38,9 @@ class GameManager:
         self.wave_completed = False
         self.lives = STARTING_LIVES
         self.game_over = False
+        self.score_saved = False
+        self.clock = clock if clock is not None else RealClock()
+        self.rng = rng if rng is not None else GameRandom()
 
     def lose_life(self) -> None:
         """
@@ -54,9 +66,10 @@ class GameManager:
         Returns:
             bool: True if the game is over, False otherwise.
         """
-        if self.game_over:
-            # Save the score when game is over
-            save_high_score(self.points)
+        if self.game_over and not self.score_saved:
+            # Save the score once when the game is over, this is checked every frame
+            save_high_score(self.points, self.current_wave)
+            self.score_saved = True
         return self.game_over
 
     def next_wave(self) -> None:
@@ -86,8 +99,8 @@ class GameManager:
         not when transitioning between waves.
         """
         # Save the current score if the game is over
-        if self.game_over:
-            save_high_score(self.points)
+        if self.game_over and not self.score_saved:
+            save_high_score(self.points, self.current_wave)
 
         self.points = STARTING_POINTS  # Points are reset only for a new game
         self.lives = STARTING_LIVES
@@ -95,6 +108,7 @@ class GameManager:
         self.enemies_killed = 0
         self.wave_completed = False
         self.game_over = False
+        self.score_saved = False
 
     def is_wave_completed(self) -> bool:
         """
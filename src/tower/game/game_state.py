@@ -5,14 +5,15 @@ This module defines different game states and manages transitions between them.
 """
 
 from typing import Literal
-from tower.game.save_manager import save_high_score, load_high_score
+from tower.game.save_manager import load_high_score
 
-GameStateType = Literal["menu", "playing", "game_over"]
+GameStateType = Literal["menu", "playing", "wave_transition", "game_over"]
 
 
 class GameState:
     MENU: GameStateType = "menu"
     PLAYING: GameStateType = "playing"
+    WAVE_TRANSITION: GameStateType = "wave_transition"
     GAME_OVER: GameStateType = "game_over"
 
     def __init__(self):
@@ -28,8 +29,8 @@ class GameState:
 
     def update_high_score(self, score: int) -> bool:
         if score > self.high_score:
+            # The score itself is saved once per game by the GameManager when the game ends
             self.high_score = score
-            save_high_score(self.high_score)
             return True
         return False
 
@@ -0,0 +1,118 @@
+"""
+high_score_index.py
+
+This module defines the in-memory index of the best scores, kept up to date as scores are recorded
+so leaderboards are drawn without querying the player storage.
+"""
+
+import heapq
+from typing import Dict, Iterable, List, Optional, Tuple
+from tower.config.constants import LEADERBOARD_SIZE
+
+
+class HighScoreIndex:
+    """
+    Best score of every player and the global top of these scores.
+
+    The top is a min-heap of at most `size` entries, so a new best score only has to beat the
+    weakest entry to get in. Best scores only ever increase, so a player pushed out of the top
+    can only come back through a new best score, which is recorded through add.
+
+    Attributes:
+        size (int): The number of players kept in the top.
+        best_scores (dict): The best score of each player, indexed by username.
+        top (list): Heap of (high score, username) tuples, the weakest entry first.
+        leaderboard (list): The sorted top, None until requested after a change.
+    """
+
+    def __init__(self, size: int = LEADERBOARD_SIZE):
+        """
+        Initializes an empty HighScoreIndex instance.
+
+        Args:
+            size (int): The number of players kept in the top.
+        """
+        self.size = size
+        self.best_scores: Dict[str, int] = {}
+        self.top: List[Tuple[int, str]] = []
+        self.leaderboard: Optional[List[Dict[str, object]]] = None
+
+    @classmethod
+    def from_high_scores(
+        cls, high_scores: Iterable[Dict[str, object]], size: int = LEADERBOARD_SIZE
+    ) -> "HighScoreIndex":
+        """
+        Builds an index from the best score of each player.
+
+        Args:
+            high_scores (iterable): Dictionaries with the "username" and "high_score" keys.
+            size (int): The number of players kept in the top.
+
+        Returns:
+            HighScoreIndex: The index of these scores.
+        """
+        index = cls(size)
+        index.best_scores = {entry["username"]: entry["high_score"] for entry in high_scores}
+        index.top = heapq.nlargest(size, ((score, username) for username, score in index.best_scores.items()))
+        heapq.heapify(index.top)
+        return index
+
+    def add(self, username: str, score: int) -> bool:
+        """
+        Records a score of a player.
+
+        Args:
+            username (str): The username of the player.
+            score (int): The recorded score.
+
+        Returns:
+            bool: True if the score is a new best score of the player, False otherwise.
+        """
+        best_score = self.best_scores.get(username)
+        if best_score is not None and score <= best_score:
+            return False
+        self.best_scores[username] = score
+
+        if best_score is not None and (best_score, username) in self.top:
+            # Raising an entry of a min-heap can break the heap order below it
+            self.top.remove((best_score, username))
+            self.top.append((score, username))
+            heapq.heapify(self.top)
+        elif len(self.top) < self.size:
+            heapq.heappush(self.top, (score, username))
+        elif (score, username) > self.top[0]:
+            heapq.heapreplace(self.top, (score, username))
+        else:
+            return True
+        self.leaderboard = None
+        return True
+
+    def get_best_score(self, username: Optional[str] = None) -> int:
+        """
+        Gets a best score.
+
+        Args:
+            username (str): The username of the player, None for the best score of all players.
+
+        Returns:
+            int: The best score, 0 if no scores exist.
+        """
+        if username is not None:
+            return self.best_scores.get(username, 0)
+        return max(self.top)[0] if self.top else 0
+
+    def get_leaderboard(self, limit: Optional[int] = None) -> List[Dict[str, object]]:
+        """
+        Gets the top of the best scores.
+
+        Args:
+            limit (int): The maximum number of players, at most and by default the size of the index.
+
+        Returns:
+            list: Dictionaries with the "username" and "high_score" keys, from best to worst.
+        """
+        if self.leaderboard is None:
+            self.leaderboard = [
+                {"username": username, "high_score": score} for score, username in sorted(self.top, reverse=True)
+            ]
+        return self.leaderboard[:limit]
@@ -1,7 +1,12 @@
-import json
+import atexit
 import os
+import threading
 import bcrypt
-from typing import Dict, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional
+from tower.config.constants import BCRYPT_ROUNDS, LEADERBOARD_SIZE, PLAYER_STORAGE
+from tower.game.high_score_index import HighScoreIndex
+from tower.game.player_store import JsonPlayerStore, PlayerStore, SqlitePlayerStore
 
 
 class Player:
@@ -11,7 +16,8 @@ class Player:
         if is_password_hashed:
             self.password = password
         else:
-            self.password = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+            salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+            self.password = bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
         self.scores = []
 
     def check_password(self, password: str) -> bool:
@@ -19,79 +25,268 @@ class Player:
         return bcrypt.checkpw(password.encode("utf-8"), self.password.encode("utf-8"))
 
     def to_dict(self) -> Dict:
-        return {"username": self.username, "password": self.password, "scores": self.scores}
+        return {"username": self.username, "password": self.password, "scores": list(self.scores)}
 
     @classmethod
     def from_dict(cls, data: Dict) -> "Player":
         player = cls(data["username"], data["password"], is_password_hashed=True)
-        player.scores = data.get("scores", [])
+        player.scores = list(data.get("scores", []))
         return player
 
 
 class PlayerManager:
+    """
+    Process-wide access to the player profiles.
+
+    Profiles live in a storage backend chosen by BACKEND: "json" keeps them in memory and writes
+    them behind to SAVE_FILE, "sqlite" keeps them in the DATABASE_FILE database, where leaderboards
+    are answered by indexed queries. The SQLite database imports SAVE_FILE when it is created.
+    Pending changes are written when the process exits. The best scores are indexed in memory on
+    first use and kept up to date as scores are saved, so leaderboards never query the backend.
+
+    Hashing and checking passwords take a noticeable time by design, the async variants of the
+    login and account creation run them on a worker thread so the game loop keeps running.
+
+    Attributes:
+        SAVE_FILE (str): The path of the JSON save file.
+        DATABASE_FILE (str): The path of the SQLite database.
+        BACKEND (str): The storage backend, "json" or "sqlite".
+        _current_player (Player): The logged in player, None for guests.
+        _store (PlayerStore): The open storage backend, None until first use.
+        _high_scores (HighScoreIndex): The index of the best scores, None until first use.
+        _executor (ThreadPoolExecutor): The worker thread of the async variants, None until first use.
+        _lock (threading.RLock): Guards the opening of the backend and of the worker thread.
+    """
+
     SAVE_FILE = os.path.join(os.path.dirname(__file__), "..", "..", "..", "players.json")
+    DATABASE_FILE = os.path.join(os.path.dirname(__file__), "..", "..", "..", "players.db")
+    BACKEND = PLAYER_STORAGE
     _current_player: Optional[Player] = None
+    _store: Optional[PlayerStore] = None
+    _high_scores: Optional[HighScoreIndex] = None
+    _executor: Optional[ThreadPoolExecutor] = None
+    _lock = threading.RLock()
+
+    @classmethod
+    def get_store(cls) -> PlayerStore:
+        """
+        Gets the storage backend, opening it on first use.
+
+        Returns:
+            PlayerStore: The storage backend selected by BACKEND.
+
+        Raises:
+            ValueError: If BACKEND is not a known backend.
+        """
+        with cls._lock:
+            if cls._store is None:
+                if cls.BACKEND == "json":
+                    cls._store = JsonPlayerStore(cls.SAVE_FILE)
+                elif cls.BACKEND == "sqlite":
+                    cls._store = SqlitePlayerStore(cls.DATABASE_FILE, legacy_json_path=cls.SAVE_FILE)
+                else:
+                    raise ValueError(f"Unknown player storage backend: {cls.BACKEND}")
+            return cls._store
 
     @classmethod
-    def save_players(cls, players: Dict[str, Player]) -> None:
-        data = {username: player.to_dict() for username, player in players.items()}
-        with open(cls.SAVE_FILE, "w") as f:
-            json.dump(data, f)
+    def get_high_score_index(cls) -> HighScoreIndex:
+        """
+        Gets the index of the best scores, building it from the backend on first use.
+
+        Returns:
+            HighScoreIndex: The index of the best score of every player.
+        """
+        with cls._lock:
+            if cls._high_scores is None:
+                cls._high_scores = HighScoreIndex.from_high_scores(cls.get_store().get_high_scores())
+            return cls._high_scores
 
     @classmethod
     def load_players(cls) -> Dict[str, Player]:
-        if not os.path.exists(cls.SAVE_FILE):
-            return {}
+        """
+        Gets every player, prefer the leaderboard methods which do not load the whole store.
+
+        Returns:
+            dict: The players indexed by username.
+        """
+        return {username: Player.from_dict(record) for username, record in cls.get_store().get_players().items()}
+
+    @classmethod
+    def find_player(cls, username: str) -> Optional[Player]:
+        """
+        Looks up a player, ignoring case.
 
-        with open(cls.SAVE_FILE, "r") as f:
-            data = json.load(f)
-            return {username: Player.from_dict(player_data) for username, player_data in data.items()}
+        Args:
+            username (str): The username of the player.
+
+        Returns:
+            Player: The player, or None if there is none with this username.
+        """
+        record = cls.get_store().get_player(username)
+        return Player.from_dict(record) if record is not None else None
+
+    @classmethod
+    def flush(cls) -> None:
+        """Writes pending changes right away."""
+        with cls._lock:
+            store = cls._store
+        if store is not None:
+            store.flush()
+
+    @classmethod
+    def unload(cls) -> None:
+        """Writes pending changes and closes the backend, the players are read again on next use."""
+        with cls._lock:
+            if cls._store is not None:
+                cls._store.close()
+            cls._store = None
+            cls._high_scores = None
+            cls._current_player = None
 
     @classmethod
     def create_player(cls, username: str, password: str) -> bool:
-        players = cls.load_players()
         # Vérifier si le nom d'utilisateur existe déjà (insensible à la casse)
-        username_lower = username.lower()
-        if any(p.username.lower() == username_lower for p in players.values()):
+        store = cls.get_store()
+        if store.get_player(username):
             return False
 
-        players[username] = Player(username, password)
-        cls.save_players(players)
-        return True
+        player = Player(username, password)
+        return store.add_player(player.to_dict())
 
     @classmethod
     def login_player(cls, username: str, password: str) -> bool:
-        players = cls.load_players()
         # Recherche insensible à la casse
-        username_lower = username.lower()
-        player = next((p for p in players.values() if p.username.lower() == username_lower), None)
+        player = cls.find_player(username)
 
         if player and player.check_password(password):
             cls._current_player = player
             return True
         return False
 
+    @classmethod
+    def get_executor(cls) -> ThreadPoolExecutor:
+        """
+        Gets the worker thread of the async variants, starting it on first use.
+
+        Returns:
+            ThreadPoolExecutor: A single worker, so requests complete in the order they were made.
+        """
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="player")
+            return cls._executor
+
+    @classmethod
+    def create_player_async(cls, username: str, password: str) -> "Future[bool]":
+        """
+        Creates a player on the worker thread, bcrypt releases the GIL while hashing the password.
+
+        Args:
+            username (str): The username of the new player.
+            password (str): The password of the new player.
+
+        Returns:
+            Future: Resolves to the result of create_player.
+        """
+        return cls.get_executor().submit(cls.create_player, username, password)
+
+    @classmethod
+    def login_player_async(cls, username: str, password: str) -> "Future[bool]":
+        """
+        Logs a player in on the worker thread, bcrypt releases the GIL while checking the password.
+
+        Args:
+            username (str): The username of the player.
+            password (str): The password of the player.
+
+        Returns:
+            Future: Resolves to the result of login_player.
+        """
+        return cls.get_executor().submit(cls.login_player, username, password)
+
     @classmethod
     def get_current_player(cls) -> Optional[Player]:
         return cls._current_player
 
     @classmethod
-    def save_score(cls, score: int) -> bool:
-        if not cls._current_player:
+    def save_score(cls, score: int, wave: Optional[int] = None) -> bool:
+        """
+        Records a score of the logged in player.
+
+        The JSON backend keeps a single copy of each score of a player, the SQLite backend records
+        every game.
+
+        Args:
+            score (int): The score to record.
+            wave (int): The wave reached, if known.
+
+        Returns:
+            bool: True if a player is logged in, False otherwise.
+        """
+        player = cls._current_player
+        if not player:
             return False
 
-        # Ne pas ajouter le score s'il est déjà présent
-        if score not in cls._current_player.scores:
-            cls._current_player.scores.append(score)
-            players = cls.load_players()
-            players[cls._current_player.username] = cls._current_player
-            cls.save_players(players)
+        if cls.get_store().add_score(player.username, score, wave):
+            with cls._lock:
+                cls.get_high_score_index().add(player.username, score)
+            player.scores.append(score)
         return True
 
     @classmethod
-    def get_high_scores(cls, username: str) -> list:
-        players = cls.load_players()
-        player = players.get(username)
-        if player:
-            return sorted(player.scores, reverse=True)
-        return []
+    def get_high_scores(cls, username: str, limit: Optional[int] = None) -> List[int]:
+        """
+        Gets the best scores of a player.
+
+        Args:
+            username (str): The username of the player.
+            limit (int): The maximum number of scores, None for all of them.
+
+        Returns:
+            list: The scores, from best to worst.
+        """
+        return cls.get_store().get_scores(username, limit)
+
+    @classmethod
+    def get_leaderboard(cls, limit: Optional[int] = None) -> List[Dict[str, object]]:
+        """
+        Gets the best score of each player, from the in-memory index up to LEADERBOARD_SIZE players.
+
+        Args:
+            limit (int): The maximum number of players, None for all of them.
+
+        Returns:
+            list: Dictionaries with the "username" and "high_score" keys, from best to worst.
+        """
+        if limit is not None and limit <= LEADERBOARD_SIZE:
+            with cls._lock:
+                return cls.get_high_score_index().get_leaderboard(limit)
+        return cls.get_store().get_high_scores(limit)
+
+    @classmethod
+    def get_best_score(cls, username: Optional[str] = None) -> int:
+        """
+        Gets a best score from the in-memory index.
+
+        Args:
+            username (str): The username of the player, None for the best score of all players.
+
+        Returns:
+            int: The best score, 0 if no scores exist.
+        """
+        with cls._lock:
+            return cls.get_high_score_index().get_best_score(username)
+
+    @classmethod
+    def get_wave_stats(cls) -> List[Dict[str, object]]:
+        """
+        Gets statistics of the games by wave reached, only recorded by the SQLite backend.
+
+        Returns:
+            list: Dictionaries with the "wave", "games", "best_score" and "average_score" keys, by wave.
+        """
+        return cls.get_store().get_wave_stats()
+
+
+# Write pending changes when the game exits
+atexit.register(PlayerManager.flush)
@@ -0,0 +1,592 @@
+"""
+player_store.py
+
+This module defines the storage backends of the player profiles.
+
+Backends exchange players as records, dictionaries with the "username", "password" (bcrypt hash)
+and "scores" keys, the format of players.json. Usernames are unique regardless of case.
+
+Classes:
+- PlayerStore: Interface shared by the backends.
+- FileLock: Exclusive lock on a file shared by the processes of the install.
+- JsonPlayerStore: Players kept in memory and written behind to a journaled JSON file.
+- SqlitePlayerStore: Players and scores in an SQLite database, with indexed leaderboards.
+"""
+
+import json
+import os
+from abc import ABC, abstractmethod
+import sqlite3
+import tempfile
+import threading
+from typing import Dict, List, Optional
+from tower.config.constants import JOURNAL_COMPACT_SIZE, SAVE_DELAY
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - depends on the platform
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:  # pragma: no cover - depends on the platform
+    msvcrt = None
+
+PlayerRecord = Dict[str, object]
+
+
+class PlayerStore(ABC):
+    """Interface of the player storage backends."""
+
+    @abstractmethod
+    def get_player(self, username: str) -> Optional[PlayerRecord]:
+        """
+        Looks up a player, ignoring case.
+
+        Args:
+            username (str): The username of the player.
+
+        Returns:
+            dict: The player record, or None if there is none with this username.
+        """
+
+    @abstractmethod
+    def get_players(self) -> Dict[str, PlayerRecord]:
+        """
+        Gets every player.
+
+        Returns:
+            dict: The player records indexed by username.
+        """
+
+    @abstractmethod
+    def add_player(self, record: PlayerRecord) -> bool:
+        """
+        Adds a new player.
+
+        Args:
+            record (dict): The player record.
+
+        Returns:
+            bool: True if the player was added, False if the username is already taken.
+        """
+
+    @abstractmethod
+    def add_score(self, username: str, score: int, wave: Optional[int] = None) -> bool:
+        """
+        Records a score of a player.
+
+        Args:
+            username (str): The username of the player.
+            score (int): The score to record.
+            wave (int): The wave reached, if known.
+
+        Returns:
+            bool: True if the score was recorded, False if the player is unknown or the backend keeps
+            a single copy of each score and already has this one.
+        """
+
+    @abstractmethod
+    def get_scores(self, username: str, limit: Optional[int] = None) -> List[int]:
+        """
+        Gets the best scores of a player.
+
+        Args:
+            username (str): The username of the player.
+            limit (int): The maximum number of scores, None for all of them.
+
+        Returns:
+            list: The scores, from best to worst.
+        """
+
+    @abstractmethod
+    def get_high_scores(self, limit: Optional[int] = None) -> List[Dict[str, object]]:
+        """
+        Gets the leaderboard, the best score of each player.
+
+        Args:
+            limit (int): The maximum number of players, None for all of them.
+
+        Returns:
+            list: Dictionaries with the "username" and "high_score" keys, from best to worst.
+        """
+
+    def get_best_score(self) -> int:
+        """
+        Gets the best score of all players.
+
+        Returns:
+            int: The best score, 0 if no scores exist.
+        """
+        high_scores = self.get_high_scores(1)
+        return high_scores[0]["high_score"] if high_scores else 0
+
+    def get_wave_stats(self) -> List[Dict[str, object]]:
+        """
+        Gets statistics of the games by wave reached.
+
+        Returns:
+            list: Dictionaries with the "wave", "games", "best_score" and "average_score" keys, by wave.
+        """
+        return []
+
+    def flush(self) -> None:
+        """Writes pending changes right away."""
+
+    def close(self) -> None:
+        """Writes pending changes and releases the backend's resources."""
+        self.flush()
+
+
+class FileLock:
+    """
+    Exclusive lock on a file, shared by every process of the install.
+
+    The lock relies on fcntl on Unix and msvcrt on Windows, and only guards the threads of the
+    current process where neither is available.
+
+    Attributes:
+        path (str): The path of the lock file, created if needed.
+        file (file): The open lock file while the lock is held.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initializes a FileLock instance.
+
+        Args:
+            path (str): The path of the lock file.
+        """
+        self.path = path
+        self.file = None
+
+    def __enter__(self) -> "FileLock":
+        self.file = open(self.path, "a+")
+        if fcntl is not None:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_EX)
+        elif msvcrt is not None:  # pragma: no cover - depends on the platform
+            self.file.seek(0)
+            msvcrt.locking(self.file.fileno(), msvcrt.LK_LOCK, 1)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if fcntl is not None:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+        elif msvcrt is not None:  # pragma: no cover - depends on the platform
+            self.file.seek(0)
+            msvcrt.locking(self.file.fileno(), msvcrt.LK_UNLCK, 1)
+        self.file.close()
+        self.file = None
+
+
+class JsonPlayerStore(PlayerStore):
+    """
+    Players kept in memory and written behind to a JSON file.
+
+    The save files are read once and the players are kept in memory afterwards. Changes are queued
+    and appended by a background timer, SAVE_DELAY seconds after the last of them, to a journal next
+    to the save file, one JSON line per change, so a new score costs an append instead of a rewrite.
+    Once the journal
+    holds JOURNAL_COMPACT_SIZE changes, it is compacted into the save file, which is replaced
+    atomically through a temporary file. Reading replays the journal over the save file, skipping a
+    change torn by a crash, which the next append cuts off the journal.
+
+    Every access to the files holds a lock file, so game instances sharing an install add their
+    changes to each other's instead of overwriting them. Records also keep the best score of the
+    player under the "high_score" key, so leaderboards are built without going through every
+    score. The file does not record the wave of the scores.
+
+    Attributes:
+        path (str): The path of the save file.
+        journal_path (str): The path of the journal of changes not compacted yet.
+        file_lock (FileLock): The lock guarding the files against other processes.
+        players (dict): The loaded player records indexed by username, None until first use.
+        players_by_name (dict): The loaded player records indexed by lowercase username.
+        pending (list): The changes not appended to the journal yet.
+        journal_size (int): The number of changes in the journal, as last seen by this store.
+        flush_timer (threading.Timer): The pending background write, if any.
+        lock (threading.RLock): Guards the store against the background writer.
+        write_lock (threading.Lock): Keeps writes in the order the changes were made.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initializes a JsonPlayerStore instance.
+
+        Args:
+            path (str): The path of the save file.
+        """
+        self.path = path
+        self.journal_path = path + ".journal"
+        self.file_lock = FileLock(path + ".lock")
+        self.players: Optional[Dict[str, PlayerRecord]] = None
+        self.players_by_name: Dict[str, PlayerRecord] = {}
+        self.pending: List[Dict[str, object]] = []
+        self.journal_size = 0
+        self.flush_timer: Optional[threading.Timer] = None
+        self.lock = threading.RLock()
+        self.write_lock = threading.Lock()
+
+    @staticmethod
+    def apply(
+        players: Dict[str, PlayerRecord], players_by_name: Dict[str, PlayerRecord], change: Dict[str, object]
+    ) -> None:
+        """
+        Applies a journaled change to player records, changes already applied are ignored.
+
+        Args:
+            players (dict): The player records indexed by username.
+            players_by_name (dict): The same records indexed by lowercase username, kept up to date.
+            change (dict): A "player" change with the new record, or a "score" change with the username and score.
+        """
+        if change["type"] == "player":
+            record = change["player"]
+            if record["username"].lower() not in players_by_name:
+                record = dict(record, scores=list(record["scores"]))
+                players[record["username"]] = record
+                players_by_name[record["username"].lower()] = record
+        elif change["type"] == "score":
+            record = players.get(change["username"])
+            if record is not None and change["score"] not in record["scores"]:
+                record["scores"].append(change["score"])
+                record["high_score"] = max(record.get("high_score", change["score"]), change["score"])
+
+    def read(self) -> Dict[str, PlayerRecord]:
+        """
+        Reads the players from the save file and its journal, bypassing the in-memory store.
+
+        Returns:
+            dict: The saved player records indexed by username.
+        """
+        with self.file_lock:
+            return self.read_unlocked()
+
+    def read_unlocked(self) -> Dict[str, PlayerRecord]:
+        """
+        Reads the players from the save file and its journal, the caller holding the file lock.
+
+        Returns:
+            dict: The saved player records indexed by username.
+        """
+        players = {}
+        if os.path.exists(self.path):
+            with open(self.path, "r") as f:
+                players = json.load(f)
+
+        self.journal_size = 0
+        if os.path.exists(self.journal_path):
+            players_by_name = {record["username"].lower(): record for record in players.values()}
+            with open(self.journal_path, "r") as f:
+                for line in f:
+                    try:
+                        change = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A change cut short by a crash never took effect
+                        continue
+                    self.apply(players, players_by_name, change)
+                    self.journal_size += 1
+        return players
+
+    def write(self, players: Dict[str, PlayerRecord]) -> None:
+        """
+        Replaces the save file atomically, a crash leaves either the old or the new file.
+
+        Args:
+            players (dict): The player records indexed by username.
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix=".players-", suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "w") as f:
+                json.dump(players, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def append(self, changes: List[Dict[str, object]]) -> None:
+        """
+        Appends changes to the journal, the caller holding the file lock.
+
+        Args:
+            changes (list): The changes, in the order they were made.
+        """
+        with open(self.journal_path, "ab+") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size:
+                f.seek(size - 1)
+                if f.read(1) != b"\n":
+                    # Drop a change torn by a crash so the new changes start on a line of their own
+                    f.seek(0)
+                    f.truncate(f.read().rfind(b"\n") + 1)
+            f.write("".join(json.dumps(change) + "\n" for change in changes).encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        self.journal_size += len(changes)
+
+    def compact(self) -> None:
+        """Folds the journal into the save file, including the changes of other processes."""
+        with self.write_lock, self.file_lock:
+            self.compact_unlocked()
+
+    def compact_unlocked(self) -> None:
+        """Folds the journal into the save file, the caller holding the write and file locks."""
+        # The files are the reference, the in-memory players may miss changes of other processes
+        players = self.read_unlocked()
+        self.write(players)
+        # A crash before the truncation only replays changes already in the save file
+        open(self.journal_path, "w").close()
+        self.journal_size = 0
+
+    def load(self) -> Dict[str, PlayerRecord]:
+        """
+        Gets the in-memory players, reading the save files on first use.
+
+        Returns:
+            dict: The player records indexed by username.
+        """
+        with self.lock:
+            if self.players is None:
+                self.players = self.read()
+                self.players_by_name = {record["username"].lower(): record for record in self.players.values()}
+            return self.players
+
+    def record(self, change: Dict[str, object]) -> None:
+        """
+        Queues a change and postpones the background write to SAVE_DELAY seconds from now.
+
+        The write waits for the changes to settle, so a burst of changes costs a single write.
+
+        Args:
+            change (dict): The change, in the journal format.
+        """
+        with self.lock:
+            self.pending.append(change)
+            if self.flush_timer is not None:
+                self.flush_timer.cancel()
+            self.flush_timer = threading.Timer(SAVE_DELAY, self.flush)
+            self.flush_timer.daemon = True
+            self.flush_timer.start()
+
+    def flush(self) -> None:
+        """Appends pending changes to the journal right away, compacting it when it is full."""
+        with self.write_lock:
+            with self.lock:
+                if self.flush_timer is not None:
+                    self.flush_timer.cancel()
+                    self.flush_timer = None
+                if not self.pending:
+                    return
+                changes, self.pending = self.pending, []
+            with self.file_lock:
+                self.append(changes)
+                if self.journal_size >= JOURNAL_COMPACT_SIZE:
+                    self.compact_unlocked()
+
+    def get_player(self, username: str) -> Optional[PlayerRecord]:
+        with self.lock:
+            self.load()
+            return self.players_by_name.get(username.lower())
+
+    def get_players(self) -> Dict[str, PlayerRecord]:
+        return self.load()
+
+    def add_player(self, record: PlayerRecord) -> bool:
+        with self.lock:
+            if self.get_player(record["username"]) is not None:
+                return False
+            record = dict(record, scores=list(record.get("scores", [])))
+            if record["scores"]:
+                record["high_score"] = max(record["scores"])
+            self.players[record["username"]] = record
+            self.players_by_name[record["username"].lower()] = record
+            self.record({"type": "player", "player": dict(record, scores=list(record["scores"]))})
+        return True
+
+    def add_score(self, username: str, score: int, wave: Optional[int] = None) -> bool:
+        with self.lock:
+            record = self.get_player(username)
+            if record is None or score in record["scores"]:
+                return False
+            record["scores"].append(score)
+            record["high_score"] = max(record.get("high_score", score), score)
+            self.record({"type": "score", "username": record["username"], "score": score})
+        return True
+
+    def get_scores(self, username: str, limit: Optional[int] = None) -> List[int]:
+        with self.lock:
+            record = self.get_player(username)
+            scores = sorted(record["scores"], reverse=True) if record else []
+        return scores[:limit]
+
+    def get_high_scores(self, limit: Optional[int] = None) -> List[Dict[str, object]]:
+        with self.lock:
+            high_scores = [
+                {
+                    "username": username,
+                    "high_score": record["high_score"] if "high_score" in record else max(record["scores"]),
+                }
+                for username, record in self.load().items()
+                if record["scores"]
+            ]
+        high_scores.sort(key=lambda x: x["high_score"], reverse=True)
+        return high_scores[:limit]
+
+
+class SqlitePlayerStore(PlayerStore):
+    """
+    Players and scores in an SQLite database.
+
+    Every game played is a row of the scores table, equal scores included, so games are counted
+    right. Scores are indexed by value and by player, so leaderboards are answered by the database
+    without loading the players, deduplicating scores where they need to. Changes are committed
+    right away. When the database is
+    created, the players of a legacy JSON save file are imported into it.
+
+    Attributes:
+        path (str): The path of the database file.
+        connection (sqlite3.Connection): The connection to the database, shared by every thread.
+        lock (threading.Lock): Serializes the use of the connection.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS players (
+            id INTEGER PRIMARY KEY,
+            username TEXT NOT NULL UNIQUE COLLATE NOCASE,
+            password TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS scores (
+            id INTEGER PRIMARY KEY,
+            player_id INTEGER NOT NULL REFERENCES players (id),
+            score INTEGER NOT NULL,
+            wave INTEGER,
+            played_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score);
+        CREATE INDEX IF NOT EXISTS scores_by_player ON scores (player_id, score);
+        CREATE INDEX IF NOT EXISTS scores_by_wave ON scores (wave);
+    """
+
+    def __init__(self, path: str, legacy_json_path: Optional[str] = None):
+        """
+        Initializes a SqlitePlayerStore instance, creating the database if needed.
+
+        Args:
+            path (str): The path of the database file, ":memory:" for a temporary database.
+            legacy_json_path (str): A JSON save file imported when the database has no players.
+        """
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self.lock = threading.Lock()
+        with self.lock, self.connection:
+            self.connection.executescript(self.SCHEMA)
+        if legacy_json_path is not None and os.path.exists(legacy_json_path) and not self.get_players_count():
+            self.import_players(JsonPlayerStore(legacy_json_path).read().values())
+
+    def get_players_count(self) -> int:
+        """
+        Counts the players.
+
+        Returns:
+            int: The number of players in the database.
+        """
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM players").fetchone()[0]
+
+    def import_players(self, records) -> None:
+        """
+        Adds players with their scores in a single transaction.
+
+        Args:
+            records (iterable): The player records to import.
+        """
+        with self.lock, self.connection:
+            for record in records:
+                cursor = self.connection.execute(
+                    "INSERT OR IGNORE INTO players (username, password) VALUES (?, ?)",
+                    (record["username"], record["password"]),
+                )
+                if cursor.rowcount:
+                    self.connection.executemany(
+                        "INSERT INTO scores (player_id, score) VALUES (?, ?)",
+                        [(cursor.lastrowid, score) for score in record.get("scores", [])],
+                    )
+
+    def get_player(self, username: str) -> Optional[PlayerRecord]:
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT id, username, password FROM players WHERE username = ?", (username,)
+            ).fetchone()
+            if row is None:
+                return None
+            scores = self.connection.execute("SELECT score FROM scores WHERE player_id = ? ORDER BY id", (row["id"],))
+            return {"username": row["username"], "password": row["password"], "scores": [r[0] for r in scores]}
+
+    def get_players(self) -> Dict[str, PlayerRecord]:
+        with self.lock:
+            players = {
+                row["id"]: {"username": row["username"], "password": row["password"], "scores": []}
+                for row in self.connection.execute("SELECT id, username, password FROM players")
+            }
+            for row in self.connection.execute("SELECT player_id, score FROM scores ORDER BY id"):
+                players[row["player_id"]]["scores"].append(row["score"])
+        return {record["username"]: record for record in players.values()}
+
+    def add_player(self, record: PlayerRecord) -> bool:
+        try:
+            with self.lock, self.connection:
+                self.connection.execute(
+                    "INSERT INTO players (username, password) VALUES (?, ?)",
+                    (record["username"], record["password"]),
+                )
+        except sqlite3.IntegrityError:
+            return False
+        return True
+
+    def add_score(self, username: str, score: int, wave: Optional[int] = None) -> bool:
+        with self.lock, self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO scores (player_id, score, wave) SELECT id, ?, ? FROM players WHERE username = ?",
+                (score, wave, username),
+            )
+            return cursor.rowcount > 0
+
+    def get_scores(self, username: str, limit: Optional[int] = None) -> List[int]:
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT DISTINCT score FROM scores JOIN players ON players.id = scores.player_id "
+                "WHERE players.username = ? ORDER BY score DESC LIMIT ?",
+                (username, -1 if limit is None else limit),
+            )
+            return [row[0] for row in rows]
+
+    def get_high_scores(self, limit: Optional[int] = None) -> List[Dict[str, object]]:
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT players.username, MAX(scores.score) AS high_score "
+                "FROM scores JOIN players ON players.id = scores.player_id "
+                "GROUP BY scores.player_id ORDER BY high_score DESC LIMIT ?",
+                (-1 if limit is None else limit,),
+            )
+            return [{"username": row["username"], "high_score": row["high_score"]} for row in rows]
+
+    def get_best_score(self) -> int:
+        with self.lock:
+            # Answered from the score index without scanning the table
+            best_score = self.connection.execute("SELECT MAX(score) FROM scores").fetchone()[0]
+        return best_score or 0
+
+    def get_wave_stats(self) -> List[Dict[str, object]]:
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT wave, COUNT(*) AS games, MAX(score) AS best_score, AVG(score) AS average_score "
+                "FROM scores WHERE wave IS NOT NULL GROUP BY wave ORDER BY wave"
+            )
+            return [dict(row) for row in rows]
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
@@ -0,0 +1,32 @@
+import random
+from typing import Optional
+
+
+class GameRandom:
+    """
+    Per-game source of randomness, split into independent streams.
+
+    The gameplay stream drives everything that changes the outcome of a game (tracks, wave sizes,
+    enemy types) while the cosmetic stream only drives visual effects. Since the streams are
+    independent, a seed fully determines the gameplay whether or not effects are drawn.
+
+    Attributes:
+        seed (int): The seed of the game.
+        gameplay (random.Random): The stream used by the game logic.
+        cosmetic (random.Random): The stream used by visual effects.
+        effects_enabled (bool): Whether cosmetic effects are generated at all (False when running headless).
+    """
+
+    def __init__(self, seed: Optional[int] = None, effects_enabled: bool = True):
+        """
+        Initializes a GameRandom instance.
+
+        Args:
+            seed (int): The seed of the game, a random one is picked if None.
+            effects_enabled (bool): Whether cosmetic effects are generated at all.
+        """
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        # String seeds are hashed deterministically, unlike tuples
+        self.gameplay = random.Random(f"{self.seed}:gameplay")
+        self.cosmetic = random.Random(f"{self.seed}:cosmetic")
+        self.effects_enabled = effects_enabled
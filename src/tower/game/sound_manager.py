@@ -0,0 +1,108 @@
+from typing import Dict, List, Mapping, Optional, Set
+import pygame
+from tower.assets import SoundCache
+from tower.config.constants import MUSIC_CHANNELS, SOUND_VOICE_LIMITS, SHARED_SOUND_CHANNELS
+
+
+class SoundManager:
+    """
+    Budgets mixer channels between music and sound effect categories.
+
+    Music plays on reserved channels that sound effects never take. Each sound effect category
+    (tower attacks, enemy deaths) owns a fixed number of channels: when all of them are busy, new
+    sounds of the category are dropped instead of flooding the mixer. A sound triggered several
+    times during the same frame is only played once.
+
+    Until init() is called, for instance when running headless, every request is ignored.
+
+    Attributes:
+        _music_channel (pygame.mixer.Channel): The channel playing the music.
+        _channels (dict): The channels owned by each sound effect category.
+        _played_this_frame (set): The sounds already played during the current frame.
+    """
+
+    _music_channel: Optional[pygame.mixer.Channel] = None
+    _channels: Dict[str, List[pygame.mixer.Channel]] = {}
+    _played_this_frame: Set[str] = set()
+
+    @classmethod
+    def init(
+        cls,
+        voice_limits: Mapping[str, int] = SOUND_VOICE_LIMITS,
+        music_channels: int = MUSIC_CHANNELS,
+    ) -> None:
+        """
+        Allocates the mixer channels; the mixer must be initialized.
+
+        Args:
+            voice_limits (dict): The maximum number of concurrent voices of each sound effect category.
+            music_channels (int): The number of channels reserved for music.
+        """
+        pygame.mixer.set_num_channels(music_channels + sum(voice_limits.values()) + SHARED_SOUND_CHANNELS)
+        pygame.mixer.set_reserved(music_channels)
+        cls._music_channel = pygame.mixer.Channel(0)
+
+        cls._channels = {}
+        first_channel = music_channels
+        for category, limit in voice_limits.items():
+            cls._channels[category] = [pygame.mixer.Channel(i) for i in range(first_channel, first_channel + limit)]
+            first_channel += limit
+        cls._played_this_frame.clear()
+
+    @classmethod
+    def play(cls, category: str, name: str) -> bool:
+        """
+        Plays a sound effect if its category has a free voice.
+
+        Args:
+            category (str): The category of the sound (e.g. "attack").
+            name (str): The path of the sound relative to the assets directory.
+
+        Returns:
+            bool: True if the sound started playing, False if it was coalesced, dropped or audio is unavailable.
+        """
+        channels = cls._channels.get(category)
+        if not channels or name in cls._played_this_frame:
+            return False
+
+        sound = SoundCache.get(name)
+        if sound is None:
+            return False
+
+        for channel in channels:
+            if not channel.get_busy():
+                channel.play(sound)
+                cls._played_this_frame.add(name)
+                return True
+        # Every voice of the category is busy
+        return False
+
+    @classmethod
+    def end_frame(cls) -> None:
+        """Ends the current frame, allowing every sound to be played again."""
+        cls._played_this_frame.clear()
+
+    @classmethod
+    def play_music(cls, sound: pygame.mixer.Sound, loops: int = 0) -> None:
+        """
+        Plays a music on the reserved channel, replacing the current one.
+
+        Args:
+            sound (pygame.mixer.Sound): The music to play.
+            loops (int): The number of extra repetitions, -1 to loop forever.
+        """
+        if cls._music_channel is not None and sound is not None:
+            cls._music_channel.play(sound, loops=loops)
+
+    @classmethod
+    def stop_music(cls) -> None:
+        """Stops the music."""
+        if cls._music_channel is not None:
+            cls._music_channel.stop()
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Releases the channels, required after the mixer is shut down."""
+        cls._music_channel = None
+        cls._channels = {}
+        cls._played_this_frame.clear()
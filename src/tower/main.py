@@ -6,7 +6,6 @@ It handles game setup, user interactions, game logic, and rendering.
 
 Modules:
 - pygame: Used for game rendering and event handling.
-- random: Used for generating random values for enemy waves and track generation.
 - sys: Used for exiting the program.
 - config.constants: Contains game constants like window dimensions and title.
 - config.color: Contains color definitions used in the game.
@@ -21,38 +20,55 @@ Functions:
 """
 
 import pygame
-import random
 from sys import exit
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from tower.config.constants import (
     BOARD_WIDTH,
     BOARD_HEIGHT,
     CELL_SIZE,
     WINDOW_WIDTH,
     WINDOW_HEIGHT,
+    UI_WIDTH,
+    HUD_HEIGHT,
     TITLE,
+    RENDER_FPS,
+    RENDER_INTERPOLATION,
+    FIXED_TIMESTEP,
+    MAX_STEPS_PER_FRAME,
+    TIME_SCALES,
+    WAVE_TRANSITION_DELAY,
 )
 from tower.config.color import WHITE, BLACK
 import tower.design.grid as grid_module
 import tower.design.track as track_module
+from tower.design.background import board_background
 from tower.design.enemy_wave import EnemyWave
 from tower.ui.game_ui import GameUI
+from tower.ui.text_cache import TextCache
 from tower.game.game_manager import GameManager
+from tower.game.clock import GameClock, RealClock
 from tower.game.game_state import GameState
 from tower.ui.menu_manager import MenuManager
-from os.path import join
+from tower.assets import SoundCache
+from tower.game.sound_manager import SoundManager
 from pygame.surface import Surface
 
 # Calculate grid dimensions
 GRID_WIDTH = BOARD_WIDTH // CELL_SIZE
 GRID_HEIGHT = BOARD_HEIGHT // CELL_SIZE
 
+# Screen regions redrawn on every frame
+HUD_RECT = pygame.Rect(0, 0, BOARD_WIDTH, HUD_HEIGHT)
+UI_PANEL_RECT = pygame.Rect(BOARD_WIDTH, 0, UI_WIDTH, WINDOW_HEIGHT)
+
 
 def create_enemy_wave(
     screen: Surface,
     track_data: List[Tuple[int, int]],
     game_manager: GameManager,
     is_new_wave: bool = False,
+    vectorized: Optional[bool] = False,
+    wave: Optional[int] = None,
 ) -> EnemyWave:
     """
     Creates a new enemy wave with appropriate parameters based on the game state.
@@ -62,19 +78,24 @@ def create_enemy_wave(
         track_data: The current track data
         game_manager: The game manager instance
         is_new_wave: Boolean indicating if this is a new wave (affects enemy count)
+        vectorized: Whether the wave moves its enemies through a NumPy enemy store, None to let the wave decide
+        wave: The wave number sizing a new wave, defaults to the current wave
 
     Returns:
         A new EnemyWave instance
     """
+    rng = game_manager.rng.gameplay
     if is_new_wave:
-        base_enemies = 25 + (game_manager.get_current_wave() - 1) * 5
-        max_enemies = 50 + (game_manager.get_current_wave() - 1) * 5
-        base_delay = max(2000 - (game_manager.get_current_wave() - 1) * 100, 500)
-        num_enemies = random.randint(base_enemies, max_enemies)
-        spawn_delay = random.randint(500, base_delay)
+        if wave is None:
+            wave = game_manager.get_current_wave()
+        base_enemies = 25 + (wave - 1) * 5
+        max_enemies = 50 + (wave - 1) * 5
+        base_delay = max(2000 - (wave - 1) * 100, 500)
+        num_enemies = rng.randint(base_enemies, max_enemies)
+        spawn_delay = rng.randint(500, base_delay)
     else:
-        num_enemies = random.randint(25, 50)
-        spawn_delay = random.randint(500, 2000)
+        num_enemies = rng.randint(25, 50)
+        spawn_delay = rng.randint(500, 2000)
 
     return EnemyWave(
         screen,
@@ -82,16 +103,19 @@ def create_enemy_wave(
         num_enemies=num_enemies,
         spawn_delay=spawn_delay,
         game_manager=game_manager,
+        vectorized=vectorized,
     )
 
 
 def initialize_game(
     screen: Surface,
+    clock: Optional[GameClock] = None,
 ) -> tuple[GameState, MenuManager, GameManager, grid_module.Grid, track_module.Track, EnemyWave]:
     """Initialize game components.
 
     Args:
         screen: The game screen surface
+        clock: The source of game time, defaults to a clock following the wall clock
 
     Returns:
         tuple containing initialized game components:
@@ -104,11 +128,11 @@ def initialize_game(
     """
     game_state = GameState()
     menu_manager = MenuManager(screen)
-    game_manager = GameManager()
+    game_manager = GameManager(clock)
 
     grid = grid_module.Grid(screen)
     track = track_module.Track(screen)
-    track.generate_random_track()
+    track.generate_random_track(game_manager.rng.gameplay)
     track_data = track.get_track()
 
     enemy_wave = create_enemy_wave(screen, track_data, game_manager)
@@ -146,45 +170,107 @@ def handle_tower_placement(
                     grid.add_tower(row, column, tower_type.grid_type)
 
 
-def handle_wave_completion(
+def handle_wave_completion(game_manager: GameManager, wave_complete_sound: Optional[pygame.mixer.Sound]) -> None:
+    """
+    Handle wave completion logic.
+
+    The next wave does not start right away: the game loop prepares its board with prepare_next_wave,
+    counts down WAVE_TRANSITION_DELAY and calls start_next_wave when the countdown ends.
+
+    Args:
+        game_manager: The game manager instance
+        wave_complete_sound: The wave completion sound effect, None if it could not be loaded
+    """
+    game_manager.set_wave_completed(True)
+    if wave_complete_sound is not None:
+        wave_complete_sound.play()
+
+
+def prepare_next_wave(
     screen: Surface,
     game_manager: GameManager,
-    grid: grid_module.Grid,
-    track: track_module.Track,
-    wave_complete_sound: pygame.mixer.Sound,
+    vectorized: Optional[bool] = False,
 ) -> tuple[EnemyWave, grid_module.Grid, track_module.Track, list[tuple[int, int]]]:
     """
-    Handle wave completion logic.
+    Build the board of the next wave without starting it.
+
+    The game loop calls this when the wave transition begins, so the track generation and the wave
+    setup do not stall the frame where the countdown ends.
 
     Args:
-        screen: The game screen surface
+        screen: The game screen surface, or None when running headless
         game_manager: The game manager instance
-        grid: The game grid instance
-        track: The game track instance
-        wave_complete_sound: The wave completion sound effect
+        vectorized: Whether the wave moves its enemies through a NumPy enemy store, None to let the wave decide
 
     Returns:
         tuple containing:
-        - new enemy wave
+        - new enemy wave, sized for the wave following the current one
         - new grid
         - new track
         - new track data
     """
-    game_manager.set_wave_completed(True)
-    wave_complete_sound.play()
-    pygame.time.wait(3000)
-
     # Créer une nouvelle grille vide et un nouveau chemin
     new_grid = grid_module.Grid(screen)
     new_track = track_module.Track(screen)
-    new_track.generate_random_track()
+    new_track.generate_random_track(game_manager.rng.gameplay)
     new_track_data = new_track.get_track()
 
+    enemy_wave = create_enemy_wave(
+        screen,
+        new_track_data,
+        game_manager,
+        is_new_wave=True,
+        vectorized=vectorized,
+        wave=game_manager.get_current_wave() + 1,
+    )
+    return enemy_wave, new_grid, new_track, new_track_data
+
+
+def start_next_wave(
+    screen: Surface,
+    game_manager: GameManager,
+    vectorized: Optional[bool] = False,
+    prepared: Optional[tuple[EnemyWave, grid_module.Grid, track_module.Track, list[tuple[int, int]]]] = None,
+) -> tuple[EnemyWave, grid_module.Grid, track_module.Track, list[tuple[int, int]]]:
+    """
+    Advance to the next wave on a fresh board.
+
+    Args:
+        screen: The game screen surface, or None when running headless
+        game_manager: The game manager instance
+        vectorized: Whether the wave moves its enemies through a NumPy enemy store, None to let the wave decide
+        prepared: The board returned by prepare_next_wave, built here when None
+
+    Returns:
+        tuple containing:
+        - new enemy wave
+        - new grid
+        - new track
+        - new track data
+    """
+    if prepared is None:
+        prepared = prepare_next_wave(screen, game_manager, vectorized=vectorized)
+
     game_manager.next_wave()
     game_manager.add_points(game_manager.get_lives() * 10)
+    return prepared
 
-    enemy_wave = create_enemy_wave(screen, new_track_data, game_manager, is_new_wave=True)
-    return enemy_wave, new_grid, new_track, new_track_data
+
+def handle_time_scale_key(key: int, clock: GameClock) -> bool:
+    """Change the game speed when one of the number keys is pressed.
+
+    Args:
+        key: The pressed key
+        clock: The game clock
+
+    Returns:
+        True if the key selected a game speed, False otherwise
+    """
+    for index, time_scale in enumerate(TIME_SCALES):
+        if key == pygame.K_1 + index:
+            clock.set_time_scale(time_scale)
+            return True
+    return False
 
 
 def render_menu_screen(screen: Surface, menu_manager: MenuManager) -> None:
@@ -198,6 +284,40 @@ def render_menu_screen(screen: Surface, menu_manager: MenuManager) -> None:
     pygame.display.flip()
 
 
+def update_game(dt: float, grid: grid_module.Grid, enemy_wave: EnemyWave) -> None:
+    """Advance the game simulation by one step, without rendering anything.
+
+    Args:
+        dt: The elapsed simulation time in milliseconds
+        grid: The game grid instance
+        enemy_wave: The current enemy wave
+    """
+    enemy_wave.update(dt)
+    grid.update(dt, enemy_wave.get_enemies())
+
+
+def run_fixed_steps(accumulator: float, grid: grid_module.Grid, enemy_wave: EnemyWave) -> float:
+    """Run the fixed simulation steps owed by the accumulated frame time.
+
+    At most MAX_STEPS_PER_FRAME steps are run; any remaining backlog is dropped so that a
+    slow frame slows the game down instead of snowballing into ever longer catch-ups.
+
+    Args:
+        accumulator: The frame time not yet simulated, in milliseconds
+        grid: The game grid instance
+        enemy_wave: The current enemy wave
+
+    Returns:
+        The time left to simulate on the next frame, always shorter than one step
+    """
+    steps = 0
+    while accumulator >= FIXED_TIMESTEP and steps < MAX_STEPS_PER_FRAME:
+        update_game(FIXED_TIMESTEP, grid, enemy_wave)
+        accumulator -= FIXED_TIMESTEP
+        steps += 1
+    return accumulator % FIXED_TIMESTEP
+
+
 def render_game_screen(
     screen: Surface,
     game_state: GameState,
@@ -206,9 +326,13 @@ def render_game_screen(
     grid: grid_module.Grid,
     track: track_module.Track,
     enemy_wave: EnemyWave,
-) -> None:
+    interpolation: float = 1.0,
+) -> Optional[List[pygame.Rect]]:
     """Render the main game screen.
 
+    Only draws the current state of the game; the simulation is advanced by update_game.
+    The grid cells and the track come from the pre-rendered board background.
+
     Args:
         screen: The game screen surface
         game_state: The game state instance
@@ -217,10 +341,20 @@ def render_game_screen(
         grid: The game grid instance
         track: The game track instance
         enemy_wave: The current enemy wave
+        interpolation: How far rendering is between the previous and the current simulation step (0-1)
+
+    Returns:
+        The regions that may differ from the previous frame, or None if the whole screen changed
     """
-    screen.fill(BLACK)
-    grid.draw(enemy_wave.get_enemies(), game_manager)
-    track.draw()
+    full_redraw = board_background.is_stale(grid, track)
+    screen.blit(board_background.get(grid, track), (0, 0))
+    screen.fill(BLACK, UI_PANEL_RECT)
+
+    # Display every shooting range for the first two waves, then only the one of the hovered tower
+    mouse_x, mouse_y = pygame.mouse.get_pos()
+    hovered_cell = (mouse_y // CELL_SIZE, mouse_x // CELL_SIZE)
+    dirty_rects = grid.render(screen, game_manager.get_current_wave() <= 2, hovered_cell)
+    dirty_rects += enemy_wave.render(screen, interpolation)
 
     game_ui = menu_manager.get_game_ui()
     game_ui.draw_points(game_manager.get_points())
@@ -228,9 +362,37 @@ def render_game_screen(
     game_ui.draw_high_score(game_state.get_high_score())
     game_ui.draw_tower_buttons(game_manager.get_points())
     game_ui.draw_enemy_info(enemy_wave, game_manager)
+    game_ui.draw_time_scale(game_manager.clock.get_time_scale())
+    dirty_rects += [HUD_RECT, UI_PANEL_RECT]
 
     if game_ui.get_selected_tower() is not None:
-        game_ui.draw_preview(pygame.mouse.get_pos())
+        preview_rect = game_ui.draw_preview((mouse_x, mouse_y))
+        if preview_rect is not None:
+            dirty_rects.append(preview_rect)
+
+    return None if full_redraw else dirty_rects
+
+
+def present_frame(
+    dirty_rects: Optional[List[pygame.Rect]], previous_dirty_rects: Optional[List[pygame.Rect]]
+) -> Optional[List[pygame.Rect]]:
+    """Push the rendered frame to the display.
+
+    Only the regions changed this frame or the previous one are updated: what was drawn last
+    frame must be uncovered as well. The whole display is flipped when either frame redrew everything.
+
+    Args:
+        dirty_rects: The regions changed this frame, or None if the whole screen changed
+        previous_dirty_rects: The regions changed on the previous frame, or None
+
+    Returns:
+        The regions to pass as previous_dirty_rects on the next frame
+    """
+    if dirty_rects is None or previous_dirty_rects is None:
+        pygame.display.flip()
+    else:
+        pygame.display.update(previous_dirty_rects + dirty_rects)
+    return dirty_rects
 
 
 def run() -> None:
@@ -239,68 +401,111 @@ def run() -> None:
     pygame.mixer.init()
     screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
 
-    # Load sounds
-    from tower import __file__ as tower_init
-    from os.path import dirname
-
-    base_path = dirname(tower_init)
-    wave_complete_sound = pygame.mixer.Sound(join(base_path, "assets", "musics", "win_zen_crystal_melody.wav"))
-    menu_music = pygame.mixer.Sound(join(base_path, "assets", "musics", "zen_menu_loop.wav"))
-    game_over_music = pygame.mixer.Sound(join(base_path, "assets", "musics", "zen_death_melody.wav"))
+    # Decode every sound up front so that spawns and attacks never load from disk mid-wave
+    SoundCache.preload()
+    SoundManager.init()
+    wave_complete_sound = SoundCache.get("musics/win_zen_crystal_melody.wav")
+    menu_music = SoundCache.get("musics/zen_menu_loop.wav")
+    game_over_music = SoundCache.get("musics/zen_death_melody.wav")
 
-    menu_channel = pygame.mixer.Channel(0)
-    menu_channel.play(menu_music, loops=-1)
+    SoundManager.play_music(menu_music, loops=-1)
     pygame.display.set_caption(TITLE)
-    clock = pygame.time.Clock()
+    clock = RealClock()
+    accumulator = 0.0
+    # Time left before the next wave starts, during a wave transition
+    transition_remaining = 0.0
+    # Board of the next wave, built when the transition starts
+    next_board = None
+    # Regions changed by the last presented game frame, None to flip the whole display
+    previous_dirty_rects = None
 
     # Initialize game components
-    game_state, menu_manager, game_manager, grid, track, enemy_wave = initialize_game(screen)
+    game_state, menu_manager, game_manager, grid, track, enemy_wave = initialize_game(screen, clock)
     track_data = track.get_track()
 
     # Game loop
     while True:
+        frame_time = clock.tick(RENDER_FPS)
+
         if game_state.get_state() == GameState.MENU:
             render_menu_screen(screen, menu_manager)
 
+            start_game = False
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     exit()
                 elif menu_manager.handle_event(event):
-                    menu_channel.stop()
-                    game_state.set_state("playing")
+                    start_game = True
+            # Logins complete on a worker thread, they are polled every frame
+            if menu_manager.update():
+                start_game = True
+
+            if start_game:
+                SoundManager.stop_music()
+                previous_dirty_rects = None
+                game_state.set_state("playing")
+
+        elif game_state.get_state() in (GameState.PLAYING, GameState.WAVE_TRANSITION):
+            in_transition = game_state.get_state() == GameState.WAVE_TRANSITION
 
-        elif game_state.get_state() == GameState.PLAYING:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     exit()
-                elif event.type == pygame.MOUSEBUTTONDOWN:
+                elif event.type == pygame.MOUSEBUTTONDOWN and not in_transition:
                     pos = pygame.mouse.get_pos()
                     game_ui = menu_manager.get_game_ui()
                     game_ui.handle_click(pos)
                     handle_tower_placement(pos, game_ui, game_manager, grid, track_data)
+                elif event.type == pygame.KEYDOWN:
+                    handle_time_scale_key(event.key, clock)
+
+            # The finished wave keeps running during the transition so its last effects fade out
+            accumulator = run_fixed_steps(accumulator + frame_time, grid, enemy_wave)
+            # Skip rendering work while the window is minimized
+            if pygame.display.get_active():
+                interpolation = accumulator / FIXED_TIMESTEP if RENDER_INTERPOLATION else 1.0
+                dirty_rects = render_game_screen(
+                    screen, game_state, game_manager, menu_manager, grid, track, enemy_wave, interpolation
+                )
+                if in_transition:
+                    countdown_rect = menu_manager.get_game_ui().draw_wave_countdown(
+                        game_manager.get_current_wave() + 1, transition_remaining
+                    )
+                    if dirty_rects is not None:
+                        dirty_rects.append(countdown_rect)
+                previous_dirty_rects = present_frame(dirty_rects, previous_dirty_rects)
+            else:
+                # The display must be redrawn entirely once the window is restored
+                previous_dirty_rects = None
+
+            if in_transition:
+                transition_remaining -= frame_time
+                if transition_remaining <= 0:
+                    enemy_wave, grid, track, track_data = start_next_wave(screen, game_manager, prepared=next_board)
+                    next_board = None
+                    accumulator = 0.0
+                    game_state.set_state("playing")
 
-            render_game_screen(screen, game_state, game_manager, menu_manager, grid, track, enemy_wave)
-            enemy_wave.update()
-
-            if game_manager.is_game_over():
+            elif game_manager.is_game_over():
                 if game_state.update_high_score(game_manager.get_points()):
                     print("New high score!")
                 game_state.set_state("game_over")
-                game_over_music.play()
+                SoundManager.play_music(game_over_music)
 
             elif enemy_wave.is_wave_complete():
-                enemy_wave, grid, track, track_data = handle_wave_completion(
-                    screen, game_manager, grid, track, wave_complete_sound
-                )
+                handle_wave_completion(game_manager, wave_complete_sound)
+                next_board = prepare_next_wave(screen, game_manager)
+                transition_remaining = WAVE_TRANSITION_DELAY
+                game_state.set_state("wave_transition")
 
         elif game_state.get_state() == GameState.GAME_OVER:
             screen.fill(BLACK)
-            menu_manager.get_game_ui().draw_game_over(game_manager)
+            game_ui = menu_manager.get_game_ui()
+            game_ui.draw_game_over(game_manager)
 
-            font = pygame.font.Font(None, 36)
-            text = font.render("Press Enter to return to the menu", True, WHITE)
+            text = TextCache.render(game_ui.font, "Press Enter to return to the menu", WHITE)
             text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 100))
             screen.blit(text, text_rect)
             pygame.display.flip()
@@ -310,15 +515,14 @@ def run() -> None:
                     pygame.quit()
                     exit()
                 elif event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-                    game_over_music.stop()
-                    menu_channel.stop()
+                    SoundManager.stop_music()
                     # Réinitialiser complètement le jeu
-                    game_state, menu_manager, game_manager, grid, track, enemy_wave = initialize_game(screen)
+                    clock.set_time_scale(1)
+                    game_state, menu_manager, game_manager, grid, track, enemy_wave = initialize_game(screen, clock)
                     track_data = track.get_track()
-                    menu_channel.play(menu_music, loops=-1)
+                    SoundManager.play_music(menu_music, loops=-1)
 
-        clock.tick(60)
-        pygame.display.flip()
+        SoundManager.end_frame()
 
 
 if __name__ == "__main__":
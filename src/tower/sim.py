@@ -0,0 +1,220 @@
+"""
+sim.py
+
+This script runs the tower defense game logic without a display, for batch evaluation of
+tower layouts and for benchmarking the core loop.
+
+The game is driven by a manual clock advanced in fixed steps: no window is opened, the
+mixer is never initialized and nothing is rendered, so waves run as fast as the CPU allows.
+
+Functions:
+- parse_tower(): Parses a ROW,COL,TYPE tower specification.
+- place_towers(): Buys and places a tower layout on a grid.
+- simulate(): Runs a seeded game and returns its results.
+- main(): Command line entry point of tower-sim.
+"""
+
+import argparse
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+from tower.config.constants import GRID_WIDTH, GRID_HEIGHT, STARTING_LIVES
+from tower.design.grid import Grid
+from tower.design.track import Track
+from tower.entities.tours.tower_types import TowerType
+from tower.game.game_manager import GameManager
+from tower.game.clock import ManualClock
+from tower.game.rng import GameRandom
+from tower.design.enemy_store import HAS_NUMPY
+from tower.main import create_enemy_wave, start_next_wave, update_game
+
+TowerLayout = List[Tuple[int, int, TowerType]]
+
+
+@dataclass
+class SimulationResult:
+    """
+    Results of a headless game.
+
+    Attributes:
+        seed (int): The seed the game was run with.
+        waves_completed (int): The number of waves fully cleared.
+        lives_lost (int): The number of lives lost.
+        enemies_killed (int): The number of enemies killed by the towers.
+        points (int): The points left at the end of the game.
+        towers_placed (int): The number of towers placed over all waves.
+        ticks (int): The number of simulation steps run.
+        elapsed (float): The wall-clock duration of the simulation in seconds.
+    """
+
+    seed: int
+    waves_completed: int
+    lives_lost: int
+    enemies_killed: int
+    points: int
+    towers_placed: int
+    ticks: int
+    elapsed: float
+
+    @property
+    def ticks_per_second(self) -> float:
+        """
+        Computes the simulation throughput.
+
+        Returns:
+            float: The number of simulation steps run per wall-clock second.
+        """
+        return self.ticks / self.elapsed if self.elapsed > 0 else float("inf")
+
+
+def parse_tower(spec: str) -> Tuple[int, int, TowerType]:
+    """
+    Parses a tower specification.
+
+    Args:
+        spec (str): The tower as ROW,COL,TYPE, where TYPE is a tower type name (normal, power, slow)
+            or its grid type number.
+
+    Returns:
+        tuple: The row, column and type of the tower.
+
+    Raises:
+        argparse.ArgumentTypeError: If the specification is malformed.
+    """
+    try:
+        row, column, type_name = (part.strip() for part in spec.split(","))
+        row, column = int(row), int(column)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid tower {spec!r}, expected ROW,COL,TYPE")
+
+    for tower_type in TowerType:
+        if type_name.upper() == tower_type.name or type_name == str(tower_type.grid_type):
+            return row, column, tower_type
+    raise argparse.ArgumentTypeError(f"unknown tower type {type_name!r}")
+
+
+def place_towers(
+    grid: Grid,
+    layout: TowerLayout,
+    track_data: List[Tuple[int, int]],
+    game_manager: GameManager,
+) -> int:
+    """
+    Buys and places the towers of a layout, following the same rules as the player.
+
+    Towers outside the board, on the track, on an occupied cell or that cannot be afforded are skipped.
+
+    Args:
+        grid (Grid): The grid where the towers are placed.
+        layout (list): The towers to place, as (row, column, tower type).
+        track_data (list): The points of the current track.
+        game_manager (GameManager): The game manager paying for the towers.
+
+    Returns:
+        int: The number of towers placed.
+    """
+    track_cells = set(track_data)
+    placed = 0
+    for row, column, tower_type in layout:
+        if not (0 <= row < GRID_HEIGHT and 0 <= column < GRID_WIDTH):
+            continue
+        if (row, column) in track_cells or grid.get_grid()[row][column] != 0:
+            continue
+        if game_manager.buy_tower(tower_type.tower_class):
+            grid.add_tower(row, column, tower_type.grid_type)
+            placed += 1
+    return placed
+
+
+def simulate(seed: int, layout: TowerLayout, waves: int, vectorized: Optional[bool] = False) -> SimulationResult:
+    """
+    Runs a game without a display until the requested number of waves is cleared or the game is over.
+
+    Args:
+        seed (int): The seed of the game, which fully determines its outcome.
+        layout (list): The towers placed at the start of every wave, as (row, column, tower type).
+        waves (int): The number of waves to play.
+        vectorized (bool): Whether enemies are moved all at once through a NumPy enemy store, None to use
+            the store only for waves large enough to benefit from it.
+
+    Returns:
+        SimulationResult: The results of the game.
+    """
+    game_manager = GameManager(ManualClock(), GameRandom(seed, effects_enabled=False))
+    track = Track(None)
+    track.generate_random_track(game_manager.rng.gameplay)
+    track_data = track.get_track()
+    grid = Grid(None)
+    towers_placed = place_towers(grid, layout, track_data, game_manager)
+    enemy_wave = create_enemy_wave(None, track_data, game_manager, vectorized=vectorized)
+
+    ticks = 0
+    waves_completed = 0
+    start = time.perf_counter()
+    while waves_completed < waves:
+        update_game(game_manager.clock.tick(), grid, enemy_wave)
+        ticks += 1
+
+        if game_manager.is_game_over():
+            break
+        if enemy_wave.is_wave_complete():
+            waves_completed += 1
+            if waves_completed < waves:
+                enemy_wave, grid, track, track_data = start_next_wave(None, game_manager, vectorized=vectorized)
+                towers_placed += place_towers(grid, layout, track_data, game_manager)
+    elapsed = time.perf_counter() - start
+
+    return SimulationResult(
+        seed=seed,
+        waves_completed=waves_completed,
+        lives_lost=STARTING_LIVES - game_manager.get_lives(),
+        enemies_killed=game_manager.get_enemies_killed(),
+        points=game_manager.get_points(),
+        towers_placed=towers_placed,
+        ticks=ticks,
+        elapsed=elapsed,
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Runs a headless game from the command line and prints its results.
+
+    Args:
+        argv (list): The command line arguments, defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(prog="tower-sim", description="Run tower defense waves without a display.")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the game, which fully determines its outcome")
+    parser.add_argument("--waves", type=int, default=1, help="number of waves to play")
+    parser.add_argument(
+        "--tower",
+        dest="layout",
+        action="append",
+        default=[],
+        type=parse_tower,
+        metavar="ROW,COL,TYPE",
+        help="tower placed at the start of every wave (repeatable), TYPE is normal, power or slow",
+    )
+    parser.add_argument(
+        "--vectorized",
+        action="store_true",
+        help="move enemies with NumPy arrays instead of one by one in large waves (requires numpy)",
+    )
+    args = parser.parse_args(argv)
+    if args.vectorized and not HAS_NUMPY:
+        parser.error("--vectorized requires numpy")
+
+    result = simulate(args.seed, args.layout, args.waves, None if args.vectorized else False)
+
+    print(f"Seed: {result.seed}")
+    print(f"Waves completed: {result.waves_completed}")
+    print(f"Lives lost: {result.lives_lost}")
+    print(f"Enemies killed: {result.enemies_killed}")
+    print(f"Points: {result.points}")
+    print(f"Towers placed: {result.towers_placed}")
+    print(f"Ticks: {result.ticks}")
+    print(f"Ticks/second: {result.ticks_per_second:.0f}")
+
+
+if __name__ == "__main__":
+    main()
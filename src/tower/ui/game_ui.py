@@ -1,9 +1,13 @@
+import math
 from typing import Tuple, Optional
 import pygame
 from pygame.surface import Surface
 from tower.config.color import WHITE, RED, YELLOW, GREEN
 from tower.config.constants import BOARD_WIDTH, WINDOW_WIDTH, WINDOW_HEIGHT, CELL_SIZE
 from tower.entities.tours.tower_types import TowerType
+from tower.effects.sprite_cache import SpriteCache
+from tower.assets import FontRegistry
+from tower.ui.text_cache import TextCache
 from tower.design.enemy_wave import EnemyWave
 from tower.game.game_manager import GameManager
 from tower.game.player import PlayerManager
@@ -21,10 +25,12 @@ class GameUI:
         font (pygame.font.Font): Font used for rendering main text elements.
         info_font (pygame.font.Font): Font used for rendering smaller informational text.
         button_font (pygame.font.Font): Font used for rendering button text.
+        title_font (pygame.font.Font): Font used for rendering the game over title.
         tower_buttons (list): List of tower buttons available for selection.
         button_padding (int): Padding between tower buttons.
         button_size (int): Size of each tower button.
         selected_tower (TowerType): The currently selected tower type.
+        countdown_banner (pygame.Surface): The translucent banner behind the wave countdown, None until first drawn.
     """
 
     def __init__(self, screen: Surface):
@@ -35,12 +41,15 @@ class GameUI:
             screen (pygame.Surface): The game screen where UI elements are drawn.
         """
         self.screen = screen
-        self.font = pygame.font.SysFont(None, 36)
-        self.info_font = pygame.font.SysFont(None, 20)
-        self.button_font = pygame.font.SysFont(None, 24)
+        self.font = FontRegistry.get(None, 36)
+        self.info_font = FontRegistry.get(None, 20)
+        self.button_font = FontRegistry.get(None, 24)
+        self.title_font = FontRegistry.get(None, 72)
         self.tower_buttons = []
         self.button_padding = 5
         self.button_size = 30
+        # Translucent banner behind the wave countdown, created on first use
+        self.countdown_banner: Optional[Surface] = None
 
         all_towers = TowerType.get_all_towers()
         self.selected_tower = min(all_towers, key=lambda t: t.get_cost())
@@ -52,14 +61,14 @@ class GameUI:
         Args:
             points (int): The player's current points.
         """
-        points_text = self.font.render(f"Points: {points}", True, WHITE)
+        points_text = TextCache.render(self.font, f"Points: {points}", WHITE)
         points_rect = points_text.get_rect(topright=(BOARD_WIDTH - 10, 10))
         self.screen.blit(points_text, points_rect)
 
         # Draw player name if logged in
         current_player = PlayerManager.get_current_player()
         if current_player:
-            player_text = self.info_font.render(f"Player: {current_player.username}", True, GREEN)
+            player_text = TextCache.render(self.info_font, f"Player: {current_player.username}", GREEN)
             player_rect = player_text.get_rect(topright=(BOARD_WIDTH - 10, 40))
             self.screen.blit(player_text, player_rect)
 
@@ -70,7 +79,7 @@ class GameUI:
         Args:
             lives (int): The number of lives remaining.
         """
-        lives_text = self.font.render(f"Lives: {lives}", True, RED if lives < 5 else WHITE)
+        lives_text = TextCache.render(self.font, f"Lives: {lives}", RED if lives < 5 else WHITE)
         lives_rect = lives_text.get_rect(topright=(BOARD_WIDTH - 10, 50))
         self.screen.blit(lives_text, lives_rect)
 
@@ -81,32 +90,31 @@ class GameUI:
         Args:
             game_manager (GameManager): The game manager instance providing game statistics.
         """
-        game_over_font = pygame.font.SysFont(None, 72)
-        game_over_text = game_over_font.render("GAME OVER", True, RED)
+        game_over_text = TextCache.render(self.title_font, "GAME OVER", RED)
         text_rect = game_over_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 3))
         self.screen.blit(game_over_text, text_rect)
 
         current_score = game_manager.get_points()
-        points_text = self.font.render(f"Score: {current_score}", True, YELLOW)
+        points_text = TextCache.render(self.font, f"Score: {current_score}", YELLOW)
         points_rect = points_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
         self.screen.blit(points_text, points_rect)
 
         # Show personal best if logged in
         current_player = PlayerManager.get_current_player()
         if current_player and current_player.scores:
-            best_score = max(current_player.scores)
+            best_score = PlayerManager.get_best_score(current_player.username)
             if current_score > best_score:
-                new_record_text = self.font.render("New Personal Best!", True, GREEN)
+                new_record_text = TextCache.render(self.font, "New Personal Best!", GREEN)
             else:
-                new_record_text = self.font.render(f"Personal Best: {best_score}", True, WHITE)
+                new_record_text = TextCache.render(self.font, f"Personal Best: {best_score}", WHITE)
             record_rect = new_record_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 40))
             self.screen.blit(new_record_text, record_rect)
 
-        wave_text = self.font.render(f"Wave reached: {game_manager.get_current_wave()}", True, WHITE)
+        wave_text = TextCache.render(self.font, f"Wave reached: {game_manager.get_current_wave()}", WHITE)
         wave_rect = wave_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 80))
         self.screen.blit(wave_text, wave_rect)
 
-        kills_text = self.font.render(f"Enemies killed: {game_manager.get_enemies_killed()}", True, WHITE)
+        kills_text = TextCache.render(self.font, f"Enemies killed: {game_manager.get_enemies_killed()}", WHITE)
         kills_rect = kills_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 120))
         self.screen.blit(kills_text, kills_rect)
 
@@ -121,30 +129,66 @@ class GameUI:
         x_start = BOARD_WIDTH + 10
 
         y_start = WINDOW_HEIGHT - 120
-        wave_text = self.info_font.render(f"Wave {game_manager.get_current_wave()}", True, YELLOW)
+        wave_text = TextCache.render(self.info_font, f"Wave {game_manager.get_current_wave()}", YELLOW)
         self.screen.blit(wave_text, (x_start, y_start))
 
         y_start += 30
-        total_text = self.info_font.render(f"Total: {enemy_wave.get_total_enemies()}", True, WHITE)
+        total_text = TextCache.render(self.info_font, f"Total: {enemy_wave.get_total_enemies()}", WHITE)
         self.screen.blit(total_text, (x_start, y_start))
 
         remaining = enemy_wave.get_remaining_enemies()
-        remaining_text = self.info_font.render(f"Remaining: {remaining}", True, WHITE)
+        remaining_text = TextCache.render(self.info_font, f"Remaining: {remaining}", WHITE)
         self.screen.blit(remaining_text, (x_start, y_start + 20))
 
-        killed_text = self.info_font.render(f"Killed: {game_manager.get_enemies_killed()}", True, WHITE)
+        killed_text = TextCache.render(self.info_font, f"Killed: {game_manager.get_enemies_killed()}", WHITE)
         self.screen.blit(killed_text, (x_start, y_start + 40))
 
         if game_manager.is_wave_completed():
-            next_wave_text = self.info_font.render("Next wave...", True, GREEN)
+            next_wave_text = TextCache.render(self.info_font, "Next wave...", GREEN)
             self.screen.blit(next_wave_text, (x_start, y_start + 60))
 
-    def draw_preview(self, pos: Tuple[int, int]) -> None:
+    def draw_time_scale(self, time_scale: float) -> None:
         """
-        Draws a preview of the selected tower at the specified position.
+        Draws the current game speed.
+
+        Args:
+            time_scale (float): The multiplier applied to the game time.
+        """
+        speed_text = TextCache.render(self.info_font, f"Speed: x{time_scale:g}", YELLOW if time_scale != 1 else WHITE)
+        self.screen.blit(speed_text, (BOARD_WIDTH + 10, WINDOW_HEIGHT - 150))
+
+    def draw_wave_countdown(self, wave: int, remaining: float) -> pygame.Rect:
+        """
+        Draws the countdown before the next wave over the board.
+
+        Args:
+            wave (int): The number of the next wave.
+            remaining (float): The time left before the wave starts, in milliseconds.
+
+        Returns:
+            pygame.Rect: The region covered by the countdown.
+        """
+        if self.countdown_banner is None:
+            self.countdown_banner = pygame.Surface((BOARD_WIDTH, 80), pygame.SRCALPHA)
+            self.countdown_banner.fill((0, 0, 0, 160))
+        banner_rect = self.countdown_banner.get_rect(center=(BOARD_WIDTH // 2, WINDOW_HEIGHT // 2))
+        self.screen.blit(self.countdown_banner, banner_rect)
+
+        seconds = max(1, math.ceil(remaining / 1000))
+        countdown_text = TextCache.render(self.font, f"Wave {wave} starts in {seconds}", GREEN)
+        countdown_rect = countdown_text.get_rect(center=banner_rect.center)
+        self.screen.blit(countdown_text, countdown_rect)
+        return banner_rect
+
+    def draw_preview(self, pos: Tuple[int, int]) -> Optional[pygame.Rect]:
+        """
+        Draws a preview of the selected tower and of its shooting range at the specified position.
 
         Args:
             pos (tuple): The position where the preview should be drawn (x, y).
+
+        Returns:
+            pygame.Rect: The region covered by the preview, or None if nothing was drawn.
         """
         if self.selected_tower and pos[0] < BOARD_WIDTH:
             cell_x = (pos[0] // CELL_SIZE) * CELL_SIZE
@@ -153,12 +197,17 @@ class GameUI:
             preview_surface = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
             color = self.selected_tower.get_color()
             preview_surface.fill((color[0], color[1], color[2], 128))
-            self.screen.blit(preview_surface, (cell_x, cell_y))
+            preview_rect = self.screen.blit(preview_surface, (cell_x, cell_y))
+
+            tower_class = self.selected_tower.tower_class
+            overlay = SpriteCache.get_range_overlay(tower_class, tower_class.attack_range, color)
+            range_rect = self.screen.blit(overlay, overlay.get_rect(center=preview_rect.center))
+            return preview_rect.union(range_rect)
+        return None
 
     def draw_high_score(self, high_score: int) -> None:
         """Draw the high score on the screen."""
-        font = pygame.font.Font(None, 36)
-        text = font.render(f"High Score: {high_score}", True, WHITE)
+        text = TextCache.render(self.font, f"High Score: {high_score}", WHITE)
         text_rect = text.get_rect(topleft=(10, 10))
         self.screen.blit(text, text_rect)
 
@@ -188,7 +237,7 @@ class GameUI:
             pygame.draw.rect(self.screen, button_color, button_rect)
 
             text_color = WHITE if can_afford else (128, 128, 128)
-            cost_text = self.button_font.render(str(cost), True, text_color)
+            cost_text = TextCache.render(self.button_font, str(cost), text_color)
             cost_rect = cost_text.get_rect(midleft=(ui_x + self.button_size + 5, y + self.button_size // 2))
             self.screen.blit(cost_text, cost_rect)
 
@@ -1,15 +1,21 @@
+import math
 import pygame
+from concurrent.futures import Future
+from typing import Optional
 from pygame.surface import Surface
 from tower.config.color import WHITE, RED, GREEN, YELLOW
+from tower.config.constants import SPINNER_SPEED
 from tower.game.player import PlayerManager
 from tower.game.save_manager import get_all_high_scores
+from tower.assets import FontRegistry
+from tower.ui.text_cache import TextCache
 
 
 class LoginMenu:
     def __init__(self, screen: Surface):
         self.screen = screen
-        self.font = pygame.font.SysFont(None, 36)
-        self.small_font = pygame.font.SysFont(None, 24)
+        self.font = FontRegistry.get(None, 36)
+        self.small_font = FontRegistry.get(None, 24)
 
         # Input fields
         self.username = ""
@@ -29,8 +35,21 @@ class LoginMenu:
         # High scores
         self.show_high_scores = True
 
+        # Connexion en cours sur le thread de travail
+        self.pending: Optional[Future] = None
+        self.pending_step = ""
+        self.spinner_rect = pygame.Rect(385, 495, 30, 30)
+
+    def is_busy(self) -> bool:
+        """Returns True while a login or an account creation is running."""
+        return self.pending is not None
+
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle input events. Returns True if user wants to start game."""
+        if self.is_busy():
+            # Les champs sont figés pendant la vérification du mot de passe
+            return False
+
         if event.type == pygame.MOUSEBUTTONDOWN:
             mouse_pos = event.pos
 
@@ -73,63 +92,83 @@ class LoginMenu:
         return False
 
     def handle_play(self) -> bool:
-        """Handle play attempt. Creates account if needed, then logs in."""
+        """Handle play attempt. Starts logging in, update reports when the player can play."""
         if not self.username or not self.password:
             self.message = "Please enter username and password"
             self.message_color = RED
             return False
 
-        # Si le compte n'existe pas, le créer
-        if not PlayerManager.login_player(self.username, self.password):
-            if PlayerManager.create_player(self.username, self.password):
-                PlayerManager.login_player(self.username, self.password)
-                self.message = f"Welcome {self.username}!"
+        self.message = "Checking account..."
+        self.message_color = WHITE
+        self.start_step("login", PlayerManager.login_player_async(self.username, self.password))
+        return False
+
+    def start_step(self, step: str, future: Future) -> None:
+        """Wait for a step of the login running on the worker thread."""
+        self.pending_step = step
+        self.pending = future
+
+    def update(self) -> bool:
+        """Poll the pending login. Returns True once the player is logged in."""
+        if self.pending is None or not self.pending.done():
+            return False
+
+        future, self.pending = self.pending, None
+        succeeded = future.result()
+        if self.pending_step == "login":
+            if succeeded:
+                self.message = f"Welcome back, {self.username}!"
                 self.message_color = GREEN
                 return True
+            # Si le compte n'existe pas, le créer
+            self.start_step("create", PlayerManager.create_player_async(self.username, self.password))
+        elif self.pending_step == "create":
+            if succeeded:
+                self.start_step("new_login", PlayerManager.login_player_async(self.username, self.password))
             else:
                 self.message = "Error creating account"
                 self.message_color = RED
-                return False
         else:
-            self.message = f"Welcome back, {self.username}!"
+            self.message = f"Welcome {self.username}!"
             self.message_color = GREEN
             return True
+        return False
 
     def draw(self) -> None:
         """Draw the login menu."""
         self.screen.fill((0, 0, 0))  # Black background
 
         # Title
-        title = self.font.render("Tower Defense", True, WHITE)
+        title = TextCache.render(self.font, "Tower Defense", WHITE)
         title_rect = title.get_rect(center=(400, 50))
         self.screen.blit(title, title_rect)
 
         # Username field
         username_color = GREEN if self.active_field == "username" else WHITE
         pygame.draw.rect(self.screen, username_color, self.username_rect, 2)
-        username_text = self.font.render(self.username, True, WHITE)
+        username_text = TextCache.render(self.font, self.username, WHITE)
         self.screen.blit(username_text, (self.username_rect.x + 5, self.username_rect.y + 5))
-        username_label = self.small_font.render("Username:", True, WHITE)
+        username_label = TextCache.render(self.small_font, "Username:", WHITE)
         self.screen.blit(username_label, (self.username_rect.x - 100, self.username_rect.y + 8))
 
         # Password field
         password_color = GREEN if self.active_field == "password" else WHITE
         pygame.draw.rect(self.screen, password_color, self.password_rect, 2)
         password_display = "*" * len(self.password)
-        password_text = self.font.render(password_display, True, WHITE)
+        password_text = TextCache.render(self.font, password_display, WHITE)
         self.screen.blit(password_text, (self.password_rect.x + 5, self.password_rect.y + 5))
-        password_label = self.small_font.render("Password:", True, WHITE)
+        password_label = TextCache.render(self.small_font, "Password:", WHITE)
         self.screen.blit(password_label, (self.password_rect.x - 100, self.password_rect.y + 8))
 
         # Play button
         pygame.draw.rect(self.screen, WHITE, self.play_button, 2)
-        play_text = self.font.render("Play", True, WHITE)
+        play_text = TextCache.render(self.font, "Play", WHITE)
         play_text_rect = play_text.get_rect(center=self.play_button.center)
         self.screen.blit(play_text, play_text_rect)
 
         # Guest button
         pygame.draw.rect(self.screen, WHITE, self.play_as_guest_button, 2)
-        guest_text = self.font.render("Play as Guest", True, WHITE)
+        guest_text = TextCache.render(self.font, "Play as Guest", WHITE)
         guest_text_rect = guest_text.get_rect(center=self.play_as_guest_button.center)
         self.screen.blit(guest_text, guest_text_rect)
 
@@ -137,24 +176,30 @@ class LoginMenu:
         instructions = ["Press TAB to switch fields", "Press ENTER to play"]
         y_pos = 410
         for instruction in instructions:
-            inst_text = self.small_font.render(instruction, True, YELLOW)
+            inst_text = TextCache.render(self.small_font, instruction, YELLOW)
             inst_rect = inst_text.get_rect(center=(400, y_pos))
             self.screen.blit(inst_text, inst_rect)
             y_pos += 25
 
         # Message
         if self.message:
-            message_text = self.font.render(self.message, True, self.message_color)
+            message_text = TextCache.render(self.font, self.message, self.message_color)
             message_rect = message_text.get_rect(center=(400, 460))
             self.screen.blit(message_text, message_rect)
 
+        # Spinner
+        if self.is_busy():
+            start_angle = math.radians(pygame.time.get_ticks() * SPINNER_SPEED / 1000)
+            pygame.draw.arc(self.screen, WHITE, self.spinner_rect, start_angle, start_angle + 1.5 * math.pi, 3)
+
         # High Scores
         if self.show_high_scores:
-            scores = get_all_high_scores()
+            scores = get_all_high_scores(5)
             y_pos = 150
-            self.screen.blit(self.font.render("High Scores:", True, YELLOW), (600, y_pos))
+            self.screen.blit(TextCache.render(self.font, "High Scores:", YELLOW), (600, y_pos))
             y_pos += 40
             for i, score in enumerate(scores[:5]):  # Show top 5 scores
-                score_text = self.small_font.render(f"{i + 1}. {score['username']}: {score['high_score']}", True, WHITE)
+                score_line = f"{i + 1}. {score['username']}: {score['high_score']}"
+                score_text = TextCache.render(self.small_font, score_line, WHITE)
                 self.screen.blit(score_text, (600, y_pos))
                 y_pos += 30
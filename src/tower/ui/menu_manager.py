@@ -27,6 +27,15 @@ class MenuManager:
                 return True
         return False
 
+    def update(self) -> bool:
+        """Poll the pending login.
+        Returns True if the game should start."""
+        if self.state == GameState.LOGIN:
+            if self.login_menu.update():
+                self.state = GameState.PLAYING
+                return True
+        return False
+
     def draw(self) -> None:
         """Draw the current menu/UI based on state."""
         if self.state == GameState.LOGIN:
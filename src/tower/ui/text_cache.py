@@ -0,0 +1,61 @@
+from collections import OrderedDict
+from typing import Tuple
+import pygame
+from pygame.surface import Surface
+from tower.config.constants import TEXT_CACHE_SIZE
+
+
+class TextCache:
+    """
+    Process-wide least-recently-used cache of rendered texts.
+
+    HUD texts change rarely compared to the frame rate, so each (font, text, color) is rendered
+    once and the surface is reused until it falls out of the cache. Surfaces returned by the
+    cache are shared and must be treated as read-only.
+
+    Attributes:
+        capacity (int): The maximum number of rendered texts kept.
+        _texts (OrderedDict): The rendered texts, from least to most recently used.
+    """
+
+    capacity: int = TEXT_CACHE_SIZE
+    _texts: "OrderedDict[Tuple[pygame.font.Font, str, Tuple[int, ...]], Surface]" = OrderedDict()
+
+    @classmethod
+    def render(cls, font: pygame.font.Font, text: str, color: Tuple[int, ...]) -> Surface:
+        """
+        Retrieves an antialiased text, rendering it on first use.
+
+        Args:
+            font (pygame.font.Font): The font of the text.
+            text (str): The text to render.
+            color (tuple): The color of the text (RGB format).
+
+        Returns:
+            pygame.Surface: The rendered text.
+        """
+        key = (font, text, tuple(color))
+        surface = cls._texts.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            cls._texts[key] = surface
+            if len(cls._texts) > cls.capacity:
+                cls._texts.popitem(last=False)
+        else:
+            cls._texts.move_to_end(key)
+        return surface
+
+    @classmethod
+    def size(cls) -> int:
+        """
+        Gets the number of cached texts.
+
+        Returns:
+            int: The number of rendered texts.
+        """
+        return len(cls._texts)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drops every cached text, required after the font module is shut down."""
+        cls._texts.clear()
@@ -7,6 +7,10 @@ import os
 import pytest
 import pygame
 from unittest.mock import MagicMock
+from tower.assets import FontRegistry, SoundCache
+from tower.game.sound_manager import SoundManager
+from tower.game.player import PlayerManager
+from tower.ui.text_cache import TextCache
 
 
 @pytest.fixture(autouse=True)
@@ -22,9 +26,30 @@ def initialize_pygame():
         # Skip mixer initialization if no audio device is available
         print("Warning: Audio device not available, running without sound")
     yield
+    # Decoded sounds and channels do not survive the mixer being shut down
+    SoundManager.shutdown()
+    SoundCache.clear()
+    TextCache.clear()
+    FontRegistry.clear()
     pygame.quit()
 
 
+@pytest.fixture(autouse=True)
+def save_file(tmp_path, monkeypatch):
+    """Keep the players of every test in a temporary save file."""
+    PlayerManager.unload()
+    path = tmp_path / "players.json"
+    monkeypatch.setattr(PlayerManager, "SAVE_FILE", str(path))
+    yield path
+    PlayerManager.unload()
+
+
+@pytest.fixture(autouse=True)
+def fast_password_hashing(monkeypatch):
+    """Hash passwords with the lowest bcrypt work factor to keep tests fast."""
+    monkeypatch.setattr("tower.game.player.BCRYPT_ROUNDS", 4)
+
+
 @pytest.fixture
 def mock_sound():
     """Create a mock sound object for testing."""
@@ -0,0 +1,106 @@
+"""
+Tests for the SoundCache and FontRegistry classes.
+"""
+
+import pytest
+import pygame
+from tower.assets import FontRegistry, SoundCache
+from tower.entities.enemies.enemy_small import EnemySmall
+from tower.entities.enemies.enemy_normal import EnemyNormal
+from tower.entities.enemies.enemy_slow import EnemySlow
+from tower.entities.tours.tour_power import TourPower
+from tower.game.game_manager import GameManager
+
+
+class FakeSound:
+    """Stand-in for pygame.mixer.Sound recording how it is used."""
+
+    loads = []
+
+    def __init__(self, path):
+        FakeSound.loads.append(path)
+        self.plays = 0
+
+    def play(self):
+        self.plays += 1
+
+
+@pytest.fixture
+def fake_mixer(monkeypatch):
+    """Pretend the mixer is initialized and record decoded files."""
+    FakeSound.loads = []
+    SoundCache.clear()
+    monkeypatch.setattr(pygame.mixer, "get_init", lambda: (44100, -16, 2))
+    monkeypatch.setattr(pygame.mixer, "Sound", FakeSound)
+    yield
+    SoundCache.clear()
+
+
+def test_no_audio_returns_none(monkeypatch):
+    """Test if lookups without a mixer return None and cache nothing."""
+    SoundCache.clear()
+    monkeypatch.setattr(pygame.mixer, "get_init", lambda: None)
+
+    assert SoundCache.get("sounds/crystal_bubble_small.wav") is None
+    assert SoundCache.size() == 0
+
+
+def test_sound_is_decoded_once(fake_mixer):
+    """Test if a sound is loaded from disk once and shared afterwards."""
+    first = SoundCache.get("sounds/crystal_bubble_small.wav")
+    second = SoundCache.get("sounds/crystal_bubble_small.wav")
+
+    assert first is second
+    assert len(FakeSound.loads) == 1
+
+
+def test_preload_every_sound(fake_mixer):
+    """Test if preloading decodes every sound and music file."""
+    count = SoundCache.preload()
+
+    assert count == len(FakeSound.loads)
+    assert count >= 9
+
+    # Spawning entities afterwards never loads anything
+    enemies = [EnemySmall(None, [(0, 0), (0, 1)], GameManager()), EnemySlow(None, [(0, 0), (0, 1)], GameManager())]
+    tower = TourPower(None, 0, 0)
+    for enemy in enemies:
+        enemy.play_death_sound()
+    tower.play_attack_sound()
+    assert len(FakeSound.loads) == count
+
+
+def test_entities_share_sounds(fake_mixer):
+    """Test if entities of the same class play the same sound object."""
+    first = EnemySmall(None, [(0, 0), (0, 1)], GameManager())
+    second = EnemySmall(None, [(0, 0), (0, 1)], GameManager())
+
+    assert SoundCache.get(first.death_sound_file) is SoundCache.get(second.death_sound_file)
+    assert len(FakeSound.loads) == 1
+
+
+def test_font_is_loaded_once(monkeypatch):
+    """Test if a font is looked up once per name and size."""
+    lookups = []
+    sys_font = pygame.font.SysFont
+    monkeypatch.setattr(pygame.font, "SysFont", lambda name, size: lookups.append((name, size)) or sys_font(name, size))
+
+    first = FontRegistry.get(None, 24)
+    second = FontRegistry.get(None, 24)
+    other = FontRegistry.get(None, 36)
+
+    assert first is second
+    assert other is not first
+    assert lookups == [(None, 24), (None, 36)]
+
+
+def test_entities_do_not_load_fonts(monkeypatch):
+    """Test if spawning entities loads no font and they share one when needed."""
+    monkeypatch.setattr(pygame.font, "SysFont", lambda name, size: pytest.fail("font loaded"))
+    enemies = [EnemyNormal(None, [(0, 0), (0, 1)], GameManager()) for _ in range(50)]
+    towers = [TourPower(None, 0, column) for column in range(10)]
+    assert FontRegistry.size() == 0
+
+    monkeypatch.undo()
+    assert enemies[0].font is enemies[-1].font is towers[0].font
+    assert FontRegistry.size() == 1
@@ -0,0 +1,68 @@
+"""
+Tests for the BoardBackground class.
+"""
+
+import pytest
+from tower.design.background import BoardBackground
+from tower.design.grid import Grid
+from tower.design.track import Track
+from tower.game.rng import GameRandom
+from tower.config.constants import CELL_SIZE
+from tower.config.color import BLACK, DARK_GRAY
+
+
+@pytest.fixture
+def test_board():
+    """Create a grid and a generated track."""
+    track = Track(None)
+    track.generate_random_track(GameRandom(5).gameplay)
+    return Grid(None), track
+
+
+def test_background_is_reused(test_board):
+    """Test if the background is rendered once while nothing changes."""
+    grid, track = test_board
+    background = BoardBackground()
+
+    assert background.is_stale(grid, track)
+    surface = background.get(grid, track)
+    assert not background.is_stale(grid, track)
+    assert background.get(grid, track) is surface
+
+
+def test_background_invalidated_by_towers(test_board):
+    """Test if adding or removing a tower invalidates the background."""
+    grid, track = test_board
+    background = BoardBackground()
+    background.get(grid, track)
+
+    grid.add_tower(1, 1, 1)
+    assert background.is_stale(grid, track)
+    background.get(grid, track)
+
+    grid.remove_tower(1, 1)
+    assert background.is_stale(grid, track)
+
+
+def test_background_invalidated_by_new_board(test_board):
+    """Test if a new track or a new grid invalidates the background."""
+    grid, track = test_board
+    background = BoardBackground()
+    background.get(grid, track)
+
+    track.generate_random_track(GameRandom(6).gameplay)
+    assert background.is_stale(grid, track)
+    background.get(grid, track)
+
+    assert background.is_stale(Grid(None), track)
+
+
+def test_background_content(test_board):
+    """Test if the background holds the cell outlines but not the towers."""
+    grid, track = test_board
+    grid.add_tower(0, 5, 1)
+    surface = BoardBackground().get(grid, track)
+
+    # An empty cell has its outline, an occupied cell does not
+    assert surface.get_at((CELL_SIZE * 6, 0))[:3] == DARK_GRAY
+    assert surface.get_at((CELL_SIZE * 5 + CELL_SIZE // 2, 0))[:3] == BLACK
@@ -0,0 +1,44 @@
+"""
+Tests for the game clocks.
+"""
+
+import pytest
+from tower.game.clock import GameClock, ManualClock, RealClock
+from tower.game.game_manager import GameManager
+from tower.config.constants import FIXED_TIMESTEP
+
+
+def test_manual_clock_tick():
+    """Test if a manual clock returns its frame time without waiting."""
+    clock = ManualClock(frame_time=10)
+
+    assert clock.read_frame_time(60) == 10
+    assert clock.tick() == 10
+    assert clock.tick(60) == 10
+
+
+def test_game_clock_is_abstract():
+    """Test if a clock without a frame time source cannot be created."""
+    with pytest.raises(TypeError):
+        GameClock()
+
+
+def test_time_scale():
+    """Test if the time scale multiplies the frame time."""
+    clock = ManualClock(frame_time=10)
+    clock.set_time_scale(4)
+
+    assert clock.tick() == 40
+    assert clock.read_frame_time(0) == 10
+    assert clock.get_time_scale() == 4
+
+    with pytest.raises(ValueError):
+        clock.set_time_scale(0)
+
+
+def test_game_manager_clock():
+    """Test if the game manager reads its frame times from the clock it was given."""
+    manager = GameManager(ManualClock())
+
+    assert manager.clock.read_frame_time(0) == FIXED_TIMESTEP
+    assert isinstance(GameManager().clock, RealClock)
@@ -0,0 +1,110 @@
+"""
+Tests for the CombatResolver class.
+"""
+
+import pytest
+from tower.design.combat import CombatResolver, HAS_NUMPY
+from tower.entities.tour_base import TourBase
+from tower.entities.enemy_base import EnemyBase
+from tower.game.game_manager import GameManager
+from tower.config.constants import CELL_SIZE
+
+MODES = [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(not HAS_NUMPY, reason="requires numpy")),
+]
+
+
+@pytest.fixture
+def enemies():
+    """Create three enemies along a horizontal track, next to a tower on cell (1, 2)."""
+    track = [(0, column) for column in range(6)]
+    game_manager = GameManager()
+    created = []
+    for column, health in ((1, 80), (2, 45), (3, 60)):
+        enemy = EnemyBase(None, track, game_manager)
+        enemy.distance = column * CELL_SIZE
+        enemy.x = column * CELL_SIZE + CELL_SIZE // 2
+        enemy.health = health
+        created.append(enemy)
+    return created
+
+
+class Tower(TourBase):
+    """Tower with a range covering every test enemy."""
+
+    attack_range = 3 * CELL_SIZE
+    damage = 40
+
+
+@pytest.mark.parametrize("vectorized", MODES)
+@pytest.mark.parametrize(
+    "targeting, expected",
+    [("weakest", 1), ("strongest", 0), ("first", 2), ("closest", 1)],
+)
+def test_targeting_strategies(enemies, vectorized, targeting, expected, monkeypatch):
+    """Test if each targeting strategy picks the expected enemy."""
+    monkeypatch.setattr(Tower, "targeting", targeting)
+    tower = Tower(None, 2, 1)
+
+    CombatResolver(vectorized).resolve(16, [tower], enemies)
+
+    assert tower.current_target is enemies[expected]
+
+
+@pytest.mark.parametrize("vectorized", MODES)
+def test_killed_enemy_is_not_targeted_again(enemies, vectorized):
+    """Test if a tower does not waste its attack on an enemy killed earlier in the step."""
+    enemies[1].health = 30
+    towers = [Tower(None, 2, 1), Tower(None, 3, 1)]
+
+    CombatResolver(vectorized).resolve(16, towers, enemies)
+
+    # The weakest enemy dies from the first attack, the second tower picks the next weakest
+    assert not enemies[1].visible
+    assert towers[1].current_target is enemies[2]
+    assert enemies[2].health == 20
+
+
+@pytest.mark.parametrize("vectorized", MODES)
+def test_towers_wait_for_their_attack_delay(enemies, vectorized):
+    """Test if the resolver respects each tower's attack delay."""
+    tower = Tower(None, 2, 1)
+    resolver = CombatResolver(vectorized)
+
+    resolver.resolve(16, [tower], enemies)
+    resolver.resolve(tower.get_attack_delay() / 2, [tower], enemies)
+    assert sum(enemy.health for enemy in enemies) == 80 + 5 + 60
+
+    resolver.resolve(tower.get_attack_delay() / 2, [tower], enemies)
+    assert not enemies[1].visible
+
+
+@pytest.mark.parametrize("vectorized", MODES)
+@pytest.mark.parametrize("targeting", ["weakest", "strongest", "first", "closest"])
+def test_ties_favor_the_enemy_spawned_first(enemies, vectorized, targeting, monkeypatch):
+    """Test if both paths break ties the same way, whatever the order of the spatial index."""
+    monkeypatch.setattr(Tower, "targeting", targeting)
+    tower = Tower(None, 2, 1)
+    # Two identical enemies at the same distance from the tower, the first one spawned on the right
+    first, second = enemies[2], enemies[0]
+    second.health = first.health
+    second.distance = first.distance
+    spawn_order = [first, second]
+
+    CombatResolver(vectorized).resolve(16, [tower], spawn_order)
+
+    assert tower.current_target is first
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="requires numpy")
+def test_small_steps_use_the_spatial_index(enemies, monkeypatch):
+    """Test if the default resolver only builds a distance matrix for steps with enough pairs."""
+    resolver = CombatResolver()
+    assert len(enemies) < resolver.threshold
+    monkeypatch.setattr(resolver, "fire_vectorized", lambda towers, enemies: pytest.fail("matrix built"))
+    tower = Tower(None, 2, 1)
+
+    resolver.resolve(16, [tower], enemies)
+
+    assert tower.current_target is enemies[1]
@@ -63,3 +63,56 @@ def test_enemy_is_active(enemy_base):
     # Test after taking fatal damage
     enemy_base.take_damage(enemy_base.health)
     assert enemy_base.is_active() == False  # Should be inactive when dead
+
+
+def test_enemy_movement_is_frame_rate_independent(test_screen):
+    """Test if the distance covered only depends on the elapsed time, not on the step count."""
+    track = [(0, 0), (0, 20)]  # Straight horizontal track
+    coarse = EnemyBase(test_screen, track, GameManager())
+    fine = EnemyBase(test_screen, track, GameManager())
+    coarse.current_point_index = fine.current_point_index = 1
+
+    coarse.update(100)
+    for _ in range(10):
+        fine.update(10)
+
+    assert fine.x == pytest.approx(coarse.x)
+    assert fine.x - track[0][1] * CELL_SIZE - CELL_SIZE // 2 == pytest.approx(coarse.speed * 0.1)
+
+
+def test_enemy_speed_in_pixels_per_second(enemy_base):
+    """Test if an enemy covers speed pixels in one second of simulated time."""
+    enemy_base.current_point_index = 1  # Head straight for the second track point
+    enemy_base.speed = 5
+    start_x = enemy_base.x
+
+    enemy_base.update(1000)
+
+    assert enemy_base.x - start_x == pytest.approx(5)
+    assert enemy_base.previous_x == start_x
+
+
+def test_enemy_turns_corners_without_stopping(test_screen, test_track):
+    """Test if an enemy keeps its pace through the corners of the track."""
+    enemy = EnemyBase(test_screen, test_track, GameManager())
+    enemy.speed = CELL_SIZE * 10  # One cell every 100 ms
+
+    enemy.update(150)
+    assert enemy.distance == pytest.approx(1.5 * CELL_SIZE)
+    # Half a cell down from the second track point (0, 1)
+    assert (enemy.x, enemy.y) == pytest.approx((1.5 * CELL_SIZE, CELL_SIZE))
+    assert enemy.current_point_index == 2
+    assert enemy.get_progress() == pytest.approx(0.5)
+
+    enemy.update(200)
+    assert enemy.reached_end
+    assert (enemy.x, enemy.y) == enemy.path.waypoints[-1]
+    assert enemy.get_progress() == 1
+
+
+def test_enemy_is_slotted(enemy_base):
+    """Test if enemies keep no per-instance dictionary nor the screen."""
+    assert not hasattr(enemy_base, "__dict__")
+    assert not hasattr(enemy_base, "screen")
+    with pytest.raises(AttributeError):
+        enemy_base.unknown = 1
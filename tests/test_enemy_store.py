@@ -0,0 +1,86 @@
+"""
+Tests for the EnemyStore class.
+"""
+
+import pytest
+from tower.design.enemy_wave import EnemyWave
+from tower.design.track import TrackPath
+from tower.entities.enemies.enemy_big import EnemyBig
+from tower.entities.enemies.enemy_small import EnemySmall
+from tower.game.game_manager import GameManager
+from tower.game.clock import ManualClock
+from tower.game.rng import GameRandom
+from tower.config.constants import CELL_SIZE, ENEMY_STORE_THRESHOLD
+
+pytest.importorskip("numpy")
+
+from tower.design.enemy_store import EnemyStore  # noqa: E402
+
+
+@pytest.fixture
+def test_track():
+    """Create a simple test track."""
+    return [(0, 0), (0, 1), (1, 1), (1, 2)]
+
+
+def test_spawned_enemy_is_a_view(test_track):
+    """Test if stored enemies behave like enemies while their state lives in the arrays."""
+    store = EnemyStore(TrackPath(test_track), 2)
+    enemy = store.spawn(EnemyBig, None, test_track, GameManager())
+
+    assert isinstance(enemy, EnemyBig)
+    assert enemy.x == CELL_SIZE // 2
+    assert enemy.health == store.health[0]
+    assert enemy.speed == store.speed[0] > 0
+
+    enemy.take_damage(30)
+    assert store.health[0] == enemy.health
+    assert enemy.visible
+
+
+def test_store_is_bounded(test_track):
+    """Test if a store refuses enemies beyond its capacity."""
+    store = EnemyStore(TrackPath(test_track), 1)
+    store.spawn(EnemySmall, None, test_track, GameManager())
+
+    with pytest.raises(IndexError):
+        store.spawn(EnemySmall, None, test_track, GameManager())
+
+
+def test_vectorized_wave_matches_objects(test_track):
+    """Test if a vectorized wave moves its enemies exactly like a regular wave."""
+    waves = [
+        EnemyWave(
+            None,
+            test_track,
+            num_enemies=10,
+            spawn_delay=100,
+            game_manager=GameManager(ManualClock(), GameRandom(7)),
+            vectorized=vectorized,
+        )
+        for vectorized in (False, True)
+    ]
+
+    for step in range(600):
+        for wave in waves:
+            wave.update(16)
+        if step == 50:
+            for wave in waves:
+                wave.enemies[0].take_damage(1000)
+        regular, vectorized = ([(enemy.x, enemy.y, enemy.health) for enemy in wave.enemies] for wave in waves)
+        assert regular == vectorized
+
+    assert waves[1].is_wave_complete()
+    assert waves[1].game_manager.get_lives() == waves[0].game_manager.get_lives()
+    assert waves[1].game_manager.get_enemies_killed() == 1
+
+
+def test_store_is_used_for_large_waves_only(test_track):
+    """Test if a wave left to decide only pays for a store when it has enough enemies."""
+    small, large = (
+        EnemyWave(None, test_track, num_enemies, spawn_delay=100, game_manager=GameManager(), vectorized=None)
+        for num_enemies in (ENEMY_STORE_THRESHOLD - 1, ENEMY_STORE_THRESHOLD)
+    )
+
+    assert small.store is None
+    assert large.store is not None
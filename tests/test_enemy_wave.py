@@ -37,11 +37,8 @@ def test_wave_initialization(test_wave):
 
 def test_wave_spawning(test_wave):
     """Test if enemies spawn correctly."""
-    # Set initial spawn time to allow immediate spawning
-    test_wave.last_spawn_time = pygame.time.get_ticks() - test_wave.spawn_delay - 1
-
-    # Update to trigger spawning
-    test_wave.update()
+    # The first update spawns an enemy
+    test_wave.update(16)
 
     assert test_wave.enemies_spawned == 1
     assert len(test_wave.enemies) == 1
@@ -54,9 +51,8 @@ def test_wave_completion(test_wave):
     """Test wave completion logic."""
     # Spawn all enemies
     for _ in range(test_wave.num_enemies):
-        # Set spawn time to allow immediate spawning
-        test_wave.last_spawn_time = pygame.time.get_ticks() - test_wave.spawn_delay - 1
-        test_wave.update()
+        # Let a full spawn delay elapse between updates
+        test_wave.update(test_wave.spawn_delay)
 
     assert test_wave.enemies_spawned == test_wave.num_enemies
 
@@ -68,9 +64,7 @@ def test_wave_completion(test_wave):
 
 def test_enemy_removal(test_wave):
     """Test if enemies are properly removed when they reach the end."""
-    # Set spawn time to allow immediate spawning
-    test_wave.last_spawn_time = pygame.time.get_ticks() - test_wave.spawn_delay - 1
-    test_wave.update()  # Spawn one enemy
+    test_wave.update(16)  # Spawn one enemy
 
     assert len(test_wave.enemies) == 1  # Verify enemy was spawned
     enemy = test_wave.enemies[0]
@@ -78,10 +72,9 @@ def test_enemy_removal(test_wave):
     # Simulate enemy reaching the end
     enemy.reached_end = True
     enemy.visible = False
-    enemy.particles = []  # Ensure no particles are active
 
     # Update to trigger enemy removal
-    test_wave.update()
+    test_wave.update(16)
 
     assert len(test_wave.enemies) == 0
 
@@ -89,3 +82,12 @@ def test_enemy_removal(test_wave):
 def test_get_total_enemies(test_wave):
     """Test if total enemies count is correct."""
     assert test_wave.get_total_enemies() == 5
+
+
+def test_wave_update_without_surface(test_track):
+    """Test if the wave simulation runs without any surface."""
+    wave = EnemyWave(None, test_track, num_enemies=2, spawn_delay=100, game_manager=GameManager())
+
+    wave.update(16)
+
+    assert wave.enemies_spawned == 1
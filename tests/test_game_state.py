@@ -20,6 +20,10 @@ def test_game_state_transitions():
     state.set_state(GameState.PLAYING)
     assert state.get_state() == GameState.PLAYING
 
+    # Test transition to the pause between waves
+    state.set_state(GameState.WAVE_TRANSITION)
+    assert state.get_state() == GameState.WAVE_TRANSITION
+
     # Test transition to game over
     state.set_state(GameState.GAME_OVER)
     assert state.get_state() == GameState.GAME_OVER
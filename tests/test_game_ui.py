@@ -141,3 +141,12 @@ def test_draw_preview(game_ui):
     # Test preview outside board
     game_ui.draw_preview((1000, 1000))
     assert True  # If we got here without errors, the drawing worked
+
+
+def test_draw_wave_countdown(game_ui):
+    """Test the countdown overlay between waves."""
+    game_ui.draw_wave_countdown(2, 3000)
+    banner = game_ui.countdown_banner
+    assert banner is not None
+    game_ui.draw_wave_countdown(2, 1)
+    assert game_ui.countdown_banner is banner
@@ -85,3 +85,17 @@ def test_invalid_tower_type(test_grid):
 
     assert grid_data[row][col] == 0  # Should not add invalid tower
     assert (row, col) not in test_grid.towers
+
+
+def test_hovered_tower_range(test_grid, test_screen):
+    """Test if only the hovered tower's range is reported as changing."""
+    test_grid.add_tower(1, 1, 1)
+    test_grid.add_tower(5, 5, 2)
+
+    assert test_grid.render(test_screen) == []
+
+    dirty_rects = test_grid.render(test_screen, hovered_cell=(5, 5))
+    assert dirty_rects == [test_grid.towers[(5, 5)].get_range_rect()]
+
+    # Ranges displayed for every tower are static
+    assert test_grid.render(test_screen, show_ranges=True, hovered_cell=(5, 5)) == []
@@ -0,0 +1,51 @@
+"""
+Tests for the HighScoreIndex class.
+"""
+
+import random
+from tower.game.high_score_index import HighScoreIndex
+
+
+def test_index_keeps_best_scores():
+    """Test if only improvements of a player's best score are recorded."""
+    index = HighScoreIndex(size=3)
+
+    assert index.add("Alice", 300)
+    assert not index.add("Alice", 200)
+    assert index.add("Alice", 450)
+
+    assert index.get_best_score("Alice") == 450
+    assert index.get_best_score("Bob") == 0
+    assert index.get_best_score() == 450
+
+
+def test_index_keeps_top_players():
+    """Test if the top holds the best player of each rank, once per player."""
+    index = HighScoreIndex.from_high_scores(
+        [{"username": "Alice", "high_score": 300}, {"username": "Bob", "high_score": 100}], size=2
+    )
+
+    index.add("Carol", 200)
+    assert index.get_leaderboard() == [
+        {"username": "Alice", "high_score": 300},
+        {"username": "Carol", "high_score": 200},
+    ]
+
+    index.add("Carol", 500)
+    index.add("Bob", 400)
+    assert index.get_leaderboard() == [
+        {"username": "Carol", "high_score": 500},
+        {"username": "Bob", "high_score": 400},
+    ]
+    assert index.get_leaderboard(1) == [{"username": "Carol", "high_score": 500}]
+
+
+def test_index_matches_full_sort():
+    """Test if incremental updates give the same top as sorting every best score."""
+    rng = random.Random(3)
+    index = HighScoreIndex(size=5)
+    for _ in range(500):
+        index.add(f"player{rng.randrange(40)}", rng.randrange(10_000))
+
+    expected = sorted(index.best_scores.items(), key=lambda item: (item[1], item[0]), reverse=True)[:5]
+    assert [(entry["username"], entry["high_score"]) for entry in index.get_leaderboard()] == expected
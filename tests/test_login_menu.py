@@ -0,0 +1,89 @@
+"""
+Tests for the LoginMenu class.
+"""
+
+import threading
+import time
+import pygame
+import pytest
+from tower.game.player import Player, PlayerManager
+from tower.ui.login_menu import LoginMenu
+
+
+@pytest.fixture
+def login_menu():
+    """Create a login menu with filled in fields."""
+    menu = LoginMenu(pygame.display.get_surface())
+    menu.username = "Alice"
+    menu.password = "secret"
+    return menu
+
+
+def wait_for_login(menu):
+    """Poll the menu like the game loop until the pending login completes."""
+    deadline = time.monotonic() + 5
+    while menu.is_busy() and time.monotonic() < deadline:
+        if menu.update():
+            return True
+        menu.draw()
+        time.sleep(0.001)
+    return False
+
+
+def test_play_creates_account_then_logs_in(login_menu):
+    """Test if playing with a new username creates the account and logs it in."""
+    assert not login_menu.handle_play()
+    assert login_menu.is_busy()
+
+    assert wait_for_login(login_menu)
+    assert PlayerManager.get_current_player().username == "Alice"
+    assert login_menu.message == "Welcome Alice!"
+
+
+def test_play_logs_existing_player_in(login_menu):
+    """Test if playing with an existing account logs it in."""
+    assert PlayerManager.create_player("Alice", "secret")
+    login_menu.handle_play()
+
+    assert wait_for_login(login_menu)
+    assert login_menu.message == "Welcome back, Alice!"
+
+
+def test_wrong_password_is_rejected(login_menu):
+    """Test if a wrong password for an existing account does not log in."""
+    assert PlayerManager.create_player("alice", "other")
+    login_menu.handle_play()
+
+    assert not wait_for_login(login_menu)
+    assert not login_menu.is_busy()
+    assert PlayerManager.get_current_player() is None
+    assert login_menu.message == "Error creating account"
+
+
+def test_password_is_checked_off_main_thread(login_menu, monkeypatch):
+    """Test if passwords are checked on the worker thread and input is ignored meanwhile."""
+    threads = []
+    release = threading.Event()
+    check_password = Player.check_password
+
+    def slow_check_password(player, password):
+        threads.append(threading.current_thread())
+        release.wait(5)
+        return check_password(player, password)
+
+    monkeypatch.setattr(Player, "check_password", slow_check_password)
+    assert PlayerManager.create_player("Alice", "secret")
+    login_menu.handle_play()
+    event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, unicode="a")
+
+    assert not login_menu.update()
+    assert not login_menu.handle_event(event)
+    assert login_menu.username == "Alice"
+    release.set()
+    assert wait_for_login(login_menu)
+    assert threads and threading.main_thread() not in threads
+
+
+def test_work_factor_is_configurable():
+    """Test if new password hashes use the configured work factor."""
+    assert Player("Alice", "secret").password.startswith("$2b$04$")
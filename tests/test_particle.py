@@ -1,16 +1,21 @@
 """
-Tests for the Particle class.
+Tests for the ParticleSystem class.
 """
 
+import random
 import pytest
 import pygame
-from tower.effects.particle import Particle
+from tower.effects.particle import HAS_NUMPY, ParticleSystem, particle_system
+from tower.entities.enemy_base import EnemyBase
+from tower.game.game_manager import GameManager
 from tower.config.constants import (
     PARTICLE_SIZE_MIN,
     PARTICLE_SIZE_MAX,
     PARTICLE_LIFETIME_MIN,
     PARTICLE_LIFETIME_MAX,
     PARTICLE_SPEED,
+    PARTICLE_BURST_COUNT,
+    PARTICLE_FADE_DURATION,
 )
 
 
@@ -20,67 +25,110 @@ def test_screen():
     return pygame.Surface((800, 600))
 
 
-@pytest.fixture
-def test_particle():
-    """Create a test particle instance."""
-    return Particle(100, 100, (255, 0, 0))  # Red particle at (100, 100)
+@pytest.fixture(
+    params=[False, pytest.param(True, marks=pytest.mark.skipif(not HAS_NUMPY, reason="NumPy is not installed"))],
+    ids=["array", "numpy"],
+)
+def test_system(request):
+    """Create a small particle system holding one burst of particles, with each storage."""
+    system = ParticleSystem(capacity=16, vectorized=request.param)
+    system.emit(100, 100, (255, 0, 0), 8)  # Red particles at (100, 100)
+    return system
+
+
+def test_particle_initialization(test_system):
+    """Test if emitted particles initialize with correct values."""
+    assert test_system.count() == 8
+    assert len(test_system.free_slots) == 8
+
+    for slot in test_system.active:
+        assert test_system.x[slot] == 100
+        assert test_system.y[slot] == 100
+        assert all(0 <= c <= 255 for c in test_system.palette[test_system.color_index[slot]])
+        assert PARTICLE_SIZE_MIN <= test_system.radius[slot] <= PARTICLE_SIZE_MAX
+        assert PARTICLE_LIFETIME_MIN <= test_system.lifetime[slot] <= PARTICLE_LIFETIME_MAX
+        assert -PARTICLE_SPEED <= test_system.dx[slot] <= PARTICLE_SPEED
+        assert -PARTICLE_SPEED <= test_system.dy[slot] <= PARTICLE_SPEED
+
+
+def test_particle_update(test_system):
+    """Test if particles update correctly."""
+    slot = test_system.active[0]
+    initial_x = test_system.x[slot]
+    initial_y = test_system.y[slot]
+    initial_lifetime = test_system.lifetime[slot]
+
+    test_system.update(100)
+
+    # Position should change based on velocity and elapsed time
+    assert test_system.x[slot] == pytest.approx(initial_x + test_system.dx[slot] * 0.1)
+    assert test_system.y[slot] == pytest.approx(initial_y + test_system.dy[slot] * 0.1)
+    assert test_system.lifetime[slot] == initial_lifetime - 100
+
+
+def test_particle_slots_are_recycled(test_system):
+    """Test if expired particles release their slot to the free list."""
+    test_system.update(PARTICLE_LIFETIME_MAX)
+
+    assert test_system.count() == 0
+    assert len(test_system.free_slots) == test_system.capacity
 
+    # The pool is bounded: extra particles are dropped
+    test_system.emit(0, 0, (255, 0, 0), test_system.capacity + 5)
+    assert test_system.count() == test_system.capacity
+    assert not test_system.free_slots
 
-def test_particle_initialization(test_particle):
-    """Test if particle initializes with correct values."""
-    assert test_particle.x == 100
-    assert test_particle.y == 100
-    assert all(0 <= c <= 255 for c in test_particle.color)
-    assert PARTICLE_SIZE_MIN <= test_particle.radius <= PARTICLE_SIZE_MAX
-    assert PARTICLE_LIFETIME_MIN <= test_particle.lifetime <= PARTICLE_LIFETIME_MAX
-    assert -PARTICLE_SPEED <= test_particle.dx <= PARTICLE_SPEED
-    assert -PARTICLE_SPEED <= test_particle.dy <= PARTICLE_SPEED
-    assert test_particle.alpha == 255
 
+def test_particle_alpha():
+    """Test if opacity is proportional to the remaining lifetime."""
+    assert ParticleSystem.get_alpha(PARTICLE_FADE_DURATION) == 255
+    assert ParticleSystem.get_alpha(PARTICLE_FADE_DURATION / 2) == int(0.5 * 255)
+    assert ParticleSystem.get_alpha(0) == 0
 
-def test_particle_update(test_particle):
-    """Test if particle updates correctly."""
-    initial_x = test_particle.x
-    initial_y = test_particle.y
-    initial_lifetime = test_particle.lifetime
 
-    test_particle.update()
+def test_particle_draw(test_system, test_screen):
+    """Test if particles can be drawn without errors."""
+    test_system.draw(test_screen)
 
-    # Position should change based on velocity
-    assert test_particle.x == initial_x + test_particle.dx
-    assert test_particle.y == initial_y + test_particle.dy
-    assert test_particle.lifetime == initial_lifetime - 1
+    # Drawing again after an update should reuse the pre-baked sprites
+    test_system.update(16)
+    test_system.draw(test_screen)
+    assert test_system.count() == 8
 
-    # Alpha should be proportional to remaining lifetime
-    expected_alpha = int((test_particle.lifetime / 30) * 255)
-    assert test_particle.alpha == expected_alpha
 
+def test_enemy_death_emits_particles(test_screen):
+    """Test if killing an enemy emits a burst into the shared particle system."""
+    particle_system.clear()
+    enemy = EnemyBase(test_screen, [(0, 0), (0, 1)], GameManager())
 
-def test_particle_is_alive(test_particle):
-    """Test particle lifetime logic."""
-    assert test_particle.is_alive()
+    enemy.take_damage(enemy.health)
 
-    # Force particle to end of life
-    test_particle.lifetime = 0
-    assert not test_particle.is_alive()
+    assert particle_system.count() == PARTICLE_BURST_COUNT
+    particle_system.clear()
+    assert particle_system.count() == 0
 
 
-def test_particle_draw(test_particle, test_screen):
-    """Test if particle can be drawn without errors."""
-    # Initial alpha should be 255
-    assert test_particle.alpha == 255
+@pytest.mark.skipif(not HAS_NUMPY, reason="NumPy is not installed")
+def test_vectorized_update_matches_slot_update():
+    """Test if the NumPy update computes the same particles as the slot by slot update."""
+    systems = [ParticleSystem(capacity=64, vectorized=vectorized) for vectorized in (False, True)]
+    for system in systems:
+        rng = random.Random(5)
+        for step in range(40):
+            if step % 5 == 0:
+                system.emit(step, 2 * step, (0, 128, 255), 12, rng)
+            system.update(16)
 
-    # Draw should work without errors
-    test_particle.draw(test_screen)
+    reference, vectorized = systems
+    assert vectorized.active == reference.active
+    assert vectorized.free_slots == reference.free_slots
+    for name in ("x", "y", "lifetime"):
+        assert list(getattr(vectorized, name)) == list(getattr(reference, name))
 
-    # Force a lifetime decrease to ensure alpha change
-    test_particle.lifetime = 15  # Half of default lifetime
 
-    # Update and draw again
-    test_particle.update()
-    test_particle.draw(test_screen)
+def test_vectorized_particles_require_numpy(monkeypatch):
+    """Test if asking for NumPy particles without NumPy fails clearly."""
+    monkeypatch.setattr("tower.effects.particle.HAS_NUMPY", False)
 
-    # Alpha should be proportional to remaining lifetime
-    expected_alpha = int((test_particle.lifetime / 30) * 255)
-    assert test_particle.alpha == expected_alpha
-    assert test_particle.alpha < 255
+    with pytest.raises(RuntimeError):
+        ParticleSystem(vectorized=True)
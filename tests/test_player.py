@@ -0,0 +1,321 @@
+"""
+Tests for the Player and PlayerManager classes.
+"""
+
+import json
+import time
+import pytest
+import tower.game.player_store as player_store_module
+from tower.game.player import PlayerManager
+from tower.game.player_store import JsonPlayerStore, PlayerStore, SqlitePlayerStore
+from tower.game.game_manager import GameManager
+
+
+@pytest.fixture
+def player(save_file):
+    """Create a saved player and log it in."""
+    assert PlayerManager.create_player("Alice", "secret")
+    assert PlayerManager.login_player("alice", "secret")
+    PlayerManager.flush()
+    PlayerManager.get_store().compact()
+    return PlayerManager.get_current_player()
+
+
+def test_save_file_is_read_once(player, monkeypatch):
+    """Test if the players are read from disk once and served from memory afterwards."""
+    PlayerManager.unload()
+    reads = []
+    read = JsonPlayerStore.read
+    monkeypatch.setattr(JsonPlayerStore, "read", lambda store: reads.append(1) or read(store))
+
+    assert PlayerManager.login_player("ALICE", "secret")
+    PlayerManager.save_score(120)
+    PlayerManager.get_high_scores("Alice")
+    assert not PlayerManager.create_player("alice", "other")
+
+    assert len(reads) == 1
+
+
+def test_scores_are_written_behind(player, save_file, monkeypatch):
+    """Test if scores reach the save files from the background writer."""
+    monkeypatch.setattr(player_store_module, "SAVE_DELAY", 0.01)
+    PlayerManager.save_score(300)
+    PlayerManager.save_score(450)
+
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline and JsonPlayerStore(str(save_file)).read()["Alice"]["scores"] != [300, 450]:
+        time.sleep(0.01)
+    assert JsonPlayerStore(str(save_file)).read()["Alice"]["scores"] == [300, 450]
+
+
+def test_write_waits_for_changes_to_settle(player, monkeypatch):
+    """Test if changes spanning the save delay are written once, after the last of them."""
+    monkeypatch.setattr(player_store_module, "SAVE_DELAY", 0.2)
+    writes = []
+    append = JsonPlayerStore.append
+    monkeypatch.setattr(JsonPlayerStore, "append", lambda store, changes: writes.append(changes) or append(store, changes))
+
+    PlayerManager.save_score(100)
+    time.sleep(0.12)
+    PlayerManager.save_score(200)
+    time.sleep(0.12)
+    assert writes == []
+
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline and not writes:
+        time.sleep(0.01)
+    assert [[change["score"] for change in changes] for changes in writes] == [[100, 200]]
+
+def test_unchanged_score_is_not_written(player, monkeypatch):
+    """Test if saving a score already recorded does not schedule a write."""
+    PlayerManager.save_score(200)
+    PlayerManager.flush()
+    writes = []
+    monkeypatch.setattr(JsonPlayerStore, "write", lambda store, players: writes.append(players))
+    monkeypatch.setattr(JsonPlayerStore, "append", lambda store, changes: writes.append(changes))
+
+    for _ in range(10):
+        assert PlayerManager.save_score(200)
+    PlayerManager.flush()
+
+    assert writes == []
+
+
+def test_game_over_saves_score_once(monkeypatch):
+    """Test if checking for game over every frame saves the score only once."""
+    saved = []
+    monkeypatch.setattr("tower.game.game_manager.save_high_score", lambda *args: saved.append(args))
+    manager = GameManager()
+    while manager.get_lives() > 0:
+        manager.lose_life()
+
+    for _ in range(60):
+        assert manager.is_game_over()
+    manager.reset_game()
+
+    assert len(saved) == 1
+
+
+def test_score_is_appended_to_journal(player, save_file, monkeypatch):
+    """Test if a new score is appended to the journal instead of rewriting the save file."""
+    writes = []
+    monkeypatch.setattr(JsonPlayerStore, "write", lambda store, players: writes.append(players))
+    saved = save_file.read_text()
+
+    PlayerManager.save_score(300)
+    PlayerManager.flush()
+
+    assert writes == []
+    assert save_file.read_text() == saved
+    assert json.loads(save_file.with_name("players.json.journal").read_text().splitlines()[-1]) == {
+        "type": "score",
+        "username": "Alice",
+        "score": 300,
+    }
+
+
+def test_journal_is_compacted(player, save_file, monkeypatch):
+    """Test if a full journal is folded into the save file."""
+    monkeypatch.setattr(player_store_module, "JOURNAL_COMPACT_SIZE", 3)
+    for score in (100, 200, 300):
+        PlayerManager.save_score(score)
+        PlayerManager.flush()
+
+    assert json.loads(save_file.read_text())["Alice"]["scores"] == [100, 200, 300]
+    assert save_file.with_name("players.json.journal").read_text() == ""
+    assert not list(save_file.parent.glob("*.tmp"))
+
+
+def test_torn_journal_entry_is_ignored(player, save_file):
+    """Test if a change cut short by a crash does not prevent loading the players."""
+    PlayerManager.save_score(100)
+    PlayerManager.flush()
+    with open(save_file.with_name("players.json.journal"), "a") as f:
+        f.write('{"type": "score", "username": "Ali')
+
+    assert JsonPlayerStore(str(save_file)).read()["Alice"]["scores"] == [100]
+
+
+def test_changes_after_torn_journal_entry_are_kept(player, save_file):
+    """Test if changes saved after a torn change survive compaction."""
+    PlayerManager.save_score(100)
+    PlayerManager.flush()
+    with open(save_file.with_name("players.json.journal"), "a") as f:
+        f.write('{"type": "score", "username": "Ali')
+
+    PlayerManager.save_score(200)
+    PlayerManager.save_score(300)
+    PlayerManager.flush()
+    PlayerManager.get_store().compact()
+
+    assert JsonPlayerStore(str(save_file)).read()["Alice"]["scores"] == [100, 200, 300]
+
+
+def test_failed_write_keeps_save_file(player, save_file, monkeypatch):
+    """Test if a write failing midway leaves the previous save file intact."""
+    saved = save_file.read_text()
+
+    def fail(players, f):
+        f.write("{")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(player_store_module.json, "dump", fail)
+    with pytest.raises(OSError):
+        JsonPlayerStore(str(save_file)).write({})
+
+    assert save_file.read_text() == saved
+    assert not list(save_file.parent.glob("*.tmp"))
+
+
+def test_instances_do_not_overwrite_each_other(save_file, monkeypatch):
+    """Test if two game instances sharing the save files keep each other's changes."""
+    monkeypatch.setattr(player_store_module, "JOURNAL_COMPACT_SIZE", 2)
+    first = JsonPlayerStore(str(save_file))
+    second = JsonPlayerStore(str(save_file))
+    first.load()
+    second.load()
+
+    assert first.add_player({"username": "Alice", "password": "hash", "scores": []})
+    assert second.add_player({"username": "Bob", "password": "hash", "scores": []})
+    first.add_score("Alice", 100)
+    second.add_score("Bob", 200)
+    first.flush()
+    second.flush()
+
+    players = JsonPlayerStore(str(save_file)).read()
+    assert players["Alice"]["scores"] == [100]
+    assert players["Bob"]["scores"] == [200]
+
+
+def test_leaderboard_is_served_from_index(player, monkeypatch):
+    """Test if leaderboards are read from the index and follow the saved scores."""
+    PlayerManager.save_score(300)
+    PlayerManager.get_leaderboard(5)
+    queries = []
+    monkeypatch.setattr(JsonPlayerStore, "get_high_scores", lambda store, limit=None: queries.append(limit) or [])
+
+    PlayerManager.save_score(700)
+
+    assert PlayerManager.get_leaderboard(5) == [{"username": "Alice", "high_score": 700}]
+    assert PlayerManager.get_best_score() == 700
+    assert PlayerManager.get_best_score("Alice") == 700
+    assert queries == []
+
+
+def test_best_score_is_saved_with_player(player, save_file):
+    """Test if the best score of a player is persisted in the save file."""
+    PlayerManager.save_score(300)
+    PlayerManager.save_score(200)
+    PlayerManager.flush()
+    PlayerManager.get_store().compact()
+
+    assert json.loads(save_file.read_text())["Alice"]["high_score"] == 300
+
+
+@pytest.fixture
+def database(save_file, tmp_path, monkeypatch):
+    """Switch the players to an SQLite database in the temporary directory."""
+    PlayerManager.unload()
+    path = tmp_path / "players.db"
+    monkeypatch.setattr(PlayerManager, "BACKEND", "sqlite")
+    monkeypatch.setattr(PlayerManager, "DATABASE_FILE", str(path))
+    return path
+
+
+def add_players(store, scores_by_player):
+    """Add players with their scores to a store, bypassing password hashing."""
+    for username, scores in scores_by_player.items():
+        assert store.add_player({"username": username, "password": "hash", "scores": []})
+        for wave, score in enumerate(scores, start=1):
+            assert store.add_score(username, score, wave)
+
+
+def test_incomplete_store_cannot_be_created():
+    """Test if a backend missing part of the interface fails when it is created."""
+
+    class IncompleteStore(PlayerStore):
+        def get_player(self, username):
+            return None
+
+    with pytest.raises(TypeError):
+        IncompleteStore()
+
+@pytest.mark.parametrize("store_class", [JsonPlayerStore, SqlitePlayerStore])
+def test_stores_answer_leaderboards(store_class, tmp_path):
+    """Test if both backends answer the leaderboard queries alike."""
+    store = store_class(str(tmp_path / "players"))
+    add_players(store, {"Alice": [300, 120, 450], "Bob": [500], "Carol": []})
+
+    assert store.get_high_scores() == [{"username": "Bob", "high_score": 500}, {"username": "Alice", "high_score": 450}]
+    assert store.get_high_scores(1) == [{"username": "Bob", "high_score": 500}]
+    assert store.get_scores("alice", 2) == [450, 300]
+    assert store.get_best_score() == 500
+    assert not store.add_player({"username": "ALICE", "password": "hash", "scores": []})
+    assert not store.add_score("Nobody", 300)
+    assert store.get_player("carol")["username"] == "Carol"
+    store.close()
+
+
+def test_sqlite_store_computes_wave_stats(tmp_path):
+    """Test if the database groups the scores by wave reached."""
+    store = SqlitePlayerStore(str(tmp_path / "players.db"))
+    add_players(store, {"Alice": [100, 300], "Bob": [200, 500]})
+
+    assert store.get_wave_stats() == [
+        {"wave": 1, "games": 2, "best_score": 200, "average_score": 150.0},
+        {"wave": 2, "games": 2, "best_score": 500, "average_score": 400.0},
+    ]
+    store.close()
+
+
+def test_sqlite_store_counts_equal_scores(tmp_path):
+    """Test if games ending on the same score are all counted, but listed once in leaderboards."""
+    store = SqlitePlayerStore(str(tmp_path / "players.db"))
+    add_players(store, {"Alice": []})
+
+    assert store.add_score("Alice", 300, 2)
+    assert store.add_score("Alice", 300, 2)
+
+    assert store.get_wave_stats() == [{"wave": 2, "games": 2, "best_score": 300, "average_score": 300.0}]
+    assert store.get_scores("Alice") == [300]
+    assert store.get_high_scores() == [{"username": "Alice", "high_score": 300}]
+    store.close()
+
+
+def test_json_store_keeps_one_copy_of_each_score(tmp_path):
+    """Test if the JSON save file keeps a single copy of each score of a player."""
+    store = JsonPlayerStore(str(tmp_path / "players.json"))
+    add_players(store, {"Alice": [300]})
+
+    assert not store.add_score("Alice", 300)
+    assert store.get_player("Alice")["scores"] == [300]
+    store.close()
+
+def test_sqlite_best_score_uses_index(tmp_path):
+    """Test if the best score is looked up in the score index instead of scanning the scores."""
+    store = SqlitePlayerStore(str(tmp_path / "players.db"))
+    plan = store.connection.execute("EXPLAIN QUERY PLAN SELECT MAX(score) FROM scores").fetchall()
+
+    assert any("scores_by_score" in row["detail"] for row in plan)
+    store.close()
+
+
+def test_sqlite_backend_imports_save_file(save_file, database):
+    """Test if a new database takes over the players of the JSON save file."""
+    save_file.write_text(json.dumps({"Alice": {"username": "Alice", "password": "hash", "scores": [300, 120]}}))
+
+    assert PlayerManager.get_leaderboard() == [{"username": "Alice", "high_score": 300}]
+    assert PlayerManager.get_high_scores("Alice") == [300, 120]
+    assert database.exists()
+
+
+def test_sqlite_backend_records_games(database):
+    """Test if players created and scores saved through the manager reach the database."""
+    assert PlayerManager.create_player("Alice", "secret")
+    assert not PlayerManager.create_player("alice", "other")
+    assert PlayerManager.login_player("ALICE", "secret")
+    PlayerManager.save_score(250, wave=3)
+    PlayerManager.unload()
+
+    assert PlayerManager.get_best_score() == 250
+    assert PlayerManager.get_wave_stats() == [{"wave": 3, "games": 1, "best_score": 250, "average_score": 250.0}]
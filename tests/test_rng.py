@@ -0,0 +1,59 @@
+"""
+Tests for the GameRandom class.
+"""
+
+import pytest
+import pygame
+from tower.game.rng import GameRandom
+from tower.game.game_manager import GameManager
+from tower.design.track import Track
+from tower.entities.enemy_base import EnemyBase
+from tower.effects.particle import particle_system
+
+
+@pytest.fixture
+def test_screen():
+    """Create a test screen surface."""
+    return pygame.Surface((800, 600))
+
+
+def test_same_seed_same_streams():
+    """Test if two generators with the same seed produce the same numbers."""
+    first = GameRandom(42)
+    second = GameRandom(42)
+
+    assert [first.gameplay.random() for _ in range(5)] == [second.gameplay.random() for _ in range(5)]
+    assert [first.cosmetic.random() for _ in range(5)] == [second.cosmetic.random() for _ in range(5)]
+    assert GameRandom(43).gameplay.random() != GameRandom(42).gameplay.random()
+
+
+def test_cosmetic_draws_do_not_perturb_gameplay():
+    """Test if drawing from the cosmetic stream leaves the gameplay stream untouched."""
+    quiet = GameRandom(7)
+    noisy = GameRandom(7)
+    for _ in range(100):
+        noisy.cosmetic.random()
+
+    assert quiet.gameplay.random() == noisy.gameplay.random()
+
+
+def test_seeded_track():
+    """Test if a seed determines the generated track."""
+    first = Track(None)
+    first.generate_random_track(GameRandom(3).gameplay)
+    second = Track(None)
+    second.generate_random_track(GameRandom(3).gameplay)
+
+    assert first.get_track() == second.get_track()
+
+
+def test_effects_disabled_skip_particles(test_screen):
+    """Test if a headless game emits no particles when an enemy dies."""
+    particle_system.clear()
+    game_manager = GameManager(rng=GameRandom(1, effects_enabled=False))
+    enemy = EnemyBase(test_screen, [(0, 0), (0, 1)], game_manager)
+
+    enemy.take_damage(enemy.health)
+
+    assert particle_system.count() == 0
+    assert game_manager.get_enemies_killed() == 1
@@ -0,0 +1,58 @@
+"""Tests for the sim.py module."""
+
+import argparse
+import pytest
+from tower.sim import main, parse_tower, place_towers, simulate
+from tower.design.grid import Grid
+from tower.game.game_manager import GameManager
+from tower.entities.tours.tower_types import TowerType
+from tower.config.constants import STARTING_POINTS
+
+
+def test_parse_tower():
+    """Test if tower specifications accept type names and grid type numbers."""
+    assert parse_tower("3,4,power") == (3, 4, TowerType.POWER)
+    assert parse_tower(" 1, 2, 3 ") == (1, 2, TowerType.SLOW)
+
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_tower("1,2")
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_tower("1,2,laser")
+
+
+def test_place_towers_skips_invalid_cells():
+    """Test if towers on the track, on occupied cells or outside the board are skipped."""
+    grid = Grid(None)
+    game_manager = GameManager()
+    layout = [(0, 0, TowerType.NORMAL), (1, 1, TowerType.NORMAL), (1, 1, TowerType.SLOW), (-1, 5, TowerType.NORMAL)]
+
+    placed = place_towers(grid, layout, [(0, 0)], game_manager)
+
+    assert placed == 1
+    assert grid.get_grid()[1][1] == TowerType.NORMAL.grid_type
+    assert game_manager.get_points() == STARTING_POINTS - TowerType.NORMAL.tower_class(None, 0, 0).cost
+
+
+def test_simulate_is_deterministic():
+    """Test if two games with the same seed and layout give the same results."""
+    layout = [(2, 2, TowerType.NORMAL), (5, 5, TowerType.POWER)]
+
+    first = simulate(7, layout, 1)
+    second = simulate(7, layout, 1)
+
+    assert first.waves_completed == second.waves_completed
+    assert first.lives_lost == second.lives_lost
+    assert first.enemies_killed == second.enemies_killed
+    assert first.points == second.points
+    assert first.ticks == second.ticks
+    assert first.ticks > 0
+
+
+def test_main_prints_results(capsys):
+    """Test if the command line runs a game and prints its results."""
+    main(["--seed", "3", "--waves", "1", "--tower", "2,2,normal"])
+
+    output = capsys.readouterr().out
+    assert "Seed: 3" in output
+    assert "Waves completed:" in output
+    assert "Ticks/second:" in output
@@ -0,0 +1,91 @@
+"""
+Tests for the SoundManager class.
+"""
+
+import pytest
+import pygame
+from tower.assets import SoundCache
+from tower.game.sound_manager import SoundManager
+from tower.entities.tours.tour_power import TourPower
+
+
+class FakeChannel:
+    """Stand-in for pygame.mixer.Channel recording what it plays."""
+
+    def __init__(self, index):
+        self.index = index
+        self.sound = None
+        self.loops = 0
+
+    def play(self, sound, loops=0):
+        self.sound = sound
+        self.loops = loops
+
+    def stop(self):
+        self.sound = None
+
+    def get_busy(self):
+        return self.sound is not None
+
+
+@pytest.fixture
+def fake_mixer(monkeypatch):
+    """Replace the mixer with fake channels and sounds."""
+    channels = {}
+    reserved = []
+
+    def get_channel(index):
+        return channels.setdefault(index, FakeChannel(index))
+
+    monkeypatch.setattr(pygame.mixer, "get_init", lambda: (44100, -16, 2))
+    monkeypatch.setattr(pygame.mixer, "Sound", lambda path: object())
+    monkeypatch.setattr(pygame.mixer, "Channel", get_channel)
+    monkeypatch.setattr(pygame.mixer, "set_num_channels", lambda count: None)
+    monkeypatch.setattr(pygame.mixer, "set_reserved", reserved.append)
+    SoundCache.clear()
+    SoundManager.init({"attack": 2, "death": 3}, music_channels=1)
+    yield channels, reserved
+    SoundManager.shutdown()
+    SoundCache.clear()
+
+
+def test_headless_ignores_sounds():
+    """Test if nothing plays before the manager is initialized."""
+    SoundManager.shutdown()
+    assert not SoundManager.play("attack", "sounds/crystal_laser_short.wav")
+
+
+def test_music_channel_is_reserved(fake_mixer):
+    """Test if music plays on the reserved channel and effects never use it."""
+    channels, reserved = fake_mixer
+    music = object()
+
+    SoundManager.play_music(music, loops=-1)
+
+    assert reserved == [1]
+    assert channels[0].sound is music and channels[0].loops == -1
+    assert all(channel.index != 0 for channel in SoundManager._channels["attack"] + SoundManager._channels["death"])
+
+    SoundManager.stop_music()
+    assert not channels[0].get_busy()
+
+
+def test_same_frame_sounds_are_coalesced(fake_mixer):
+    """Test if a sound triggered twice in a frame plays once."""
+    assert SoundManager.play("attack", "sounds/crystal_laser_short.wav")
+    assert not SoundManager.play("attack", "sounds/crystal_laser_short.wav")
+
+    SoundManager.end_frame()
+    assert SoundManager.play("attack", "sounds/crystal_laser_short.wav")
+
+
+def test_voices_are_capped_per_category(fake_mixer):
+    """Test if a category never plays more voices than its budget."""
+    for column in range(5):
+        TourPower(None, column, 0).play_attack_sound()
+        SoundManager.end_frame()
+
+    assert all(channel.get_busy() for channel in SoundManager._channels["attack"])
+    # The other categories keep their voices
+    assert SoundManager.play("death", "sounds/crystal_bubble_small.wav")
+    assert not SoundManager.play("attack", "sounds/crystal_laser_medium.wav")
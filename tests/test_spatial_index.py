@@ -0,0 +1,65 @@
+"""
+Tests for the SpatialHash class.
+"""
+
+import random
+import pytest
+import pygame
+from tower.design.spatial_index import SpatialHash
+from tower.entities.enemy_base import EnemyBase
+from tower.entities.tour_base import TourBase
+from tower.game.game_manager import GameManager
+from tower.config.constants import CELL_SIZE, BOARD_WIDTH, BOARD_HEIGHT
+
+
+@pytest.fixture
+def test_screen():
+    """Create a test screen surface."""
+    return pygame.Surface((800, 600))
+
+
+@pytest.fixture
+def test_enemies(test_screen):
+    """Create enemies scattered over the board."""
+    rng = random.Random(42)
+    enemies = []
+    for _ in range(200):
+        enemy = EnemyBase(test_screen, [(0, 0), (0, 1)], GameManager())
+        enemy.x = rng.uniform(0, BOARD_WIDTH)
+        enemy.y = rng.uniform(0, BOARD_HEIGHT)
+        enemies.append(enemy)
+    return enemies
+
+
+def test_index_contains_every_enemy(test_enemies):
+    """Test if every enemy is bucketed exactly once."""
+    index = SpatialHash(test_enemies)
+    assert len(index) == len(test_enemies)
+
+
+def test_query_matches_brute_force(test_enemies):
+    """Test if range queries find exactly the enemies a full scan finds."""
+    index = SpatialHash(test_enemies, CELL_SIZE)
+
+    for x, y, radius in [(100, 100, 50), (0, 0, 90), (BOARD_WIDTH, BOARD_HEIGHT, 45), (400, 200, 5)]:
+        expected = {id(e) for e in test_enemies if ((e.x - x) ** 2 + (e.y - y) ** 2) ** 0.5 <= radius}
+        assert {id(e) for e in index.query(x, y, radius)} == expected
+
+
+def test_rebuild_replaces_content(test_enemies):
+    """Test if rebuilding the index drops the previous frame's enemies."""
+    index = SpatialHash(test_enemies)
+    index.build(test_enemies[:10])
+    assert len(index) == 10
+
+
+def test_tower_uses_shared_index(test_screen):
+    """Test if a tower attacks through a shared index."""
+    tower = TourBase(test_screen, 1, 1)
+    enemy = EnemyBase(test_screen, [(1, 1), (1, 2)], GameManager())
+    initial_health = enemy.health
+
+    tower.update(16, SpatialHash([enemy]))
+
+    assert tower.current_target is enemy
+    assert enemy.health == initial_health - tower.damage
@@ -0,0 +1,101 @@
+"""
+Tests for the SpriteCache class.
+"""
+
+import pytest
+import pygame
+from tower.effects.sprite_cache import SpriteCache
+from tower.entities.tours.tour_normal import TourNormal
+from tower.entities.tours.tour_power import TourPower
+from tower.entities.enemies.enemy_normal import EnemyNormal
+from tower.game.game_manager import GameManager
+from tower.config.constants import CELL_SIZE, ENEMY_DAMAGED_COLOR, ENEMY_HEALTH_GRADIENT_STEPS, NORMAL_ENEMY_HEALTH
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start every test with an empty sprite cache."""
+    SpriteCache.clear()
+    yield
+    SpriteCache.clear()
+
+
+@pytest.fixture
+def test_screen():
+    """Create a test screen surface."""
+    return pygame.Surface((800, 600))
+
+
+def test_tower_sprite_is_built_once():
+    """Test if the same tower sprite is reused between calls."""
+    first = SpriteCache.get_tower_sprite(TourNormal, (10, 20, 30), CELL_SIZE)
+    second = SpriteCache.get_tower_sprite(TourNormal, (10, 20, 30), CELL_SIZE)
+
+    assert first is second
+    assert first.get_size() == (CELL_SIZE, CELL_SIZE)
+    assert SpriteCache.size() == 1
+
+
+def test_tower_sprite_key(test_screen):
+    """Test if tower class, color and cell size each get their own sprite."""
+    base = SpriteCache.get_tower_sprite(TourNormal, (10, 20, 30), CELL_SIZE)
+
+    assert SpriteCache.get_tower_sprite(TourPower, (10, 20, 30), CELL_SIZE) is not base
+    assert SpriteCache.get_tower_sprite(TourNormal, (40, 50, 60), CELL_SIZE) is not base
+    assert SpriteCache.get_tower_sprite(TourNormal, (10, 20, 30), CELL_SIZE * 2).get_size() == (
+        CELL_SIZE * 2,
+        CELL_SIZE * 2,
+    )
+    assert SpriteCache.size() == 4
+
+
+def test_towers_share_sprite(test_screen):
+    """Test if drawing many towers of one type only renders a single sprite."""
+    towers = [TourNormal(test_screen, column, 1) for column in range(10)]
+    for tower in towers:
+        tower.render(test_screen)
+
+    assert SpriteCache.size() == 1
+    # The cached body must end up on the screen at the tower's cell
+    assert test_screen.get_at((CELL_SIZE * 3 + CELL_SIZE // 2, CELL_SIZE + CELL_SIZE // 2))[:3] == towers[3].color
+
+
+def test_range_overlays_are_shared(test_screen):
+    """Test if every tower with the same range and color reuses one range overlay."""
+    towers = [TourNormal(test_screen, column, 1) for column in range(10)]
+    for tower in towers:
+        tower.render(test_screen, show_range=True)
+
+    # One body and one range overlay
+    assert SpriteCache.size() == 2
+    overlay = SpriteCache.get_range_overlay(TourNormal, towers[0].attack_range, towers[0].color)
+    assert overlay.get_size() == (towers[0].attack_range * 2, towers[0].attack_range * 2)
+
+    TourPower(test_screen, 0, 5).render(test_screen, show_range=True)
+    assert SpriteCache.size() == 4
+
+
+def test_enemy_stamps_are_bounded(test_screen):
+    """Test if enemy stamps are shared and bounded by the health gradient steps."""
+    track = [(0, 0), (0, 1)]
+    enemies = [EnemyNormal(test_screen, track, GameManager()) for _ in range(5)]
+    for health in range(1, NORMAL_ENEMY_HEALTH + 1):
+        for enemy in enemies:
+            enemy.health = health
+            enemy.render(test_screen)
+
+    assert SpriteCache.size() <= ENEMY_HEALTH_GRADIENT_STEPS + 1
+
+
+def test_enemy_health_color_quantization(test_screen):
+    """Test if close health values map to the same quantized color."""
+    enemy = EnemyNormal(test_screen, [(0, 0), (0, 1)], GameManager())
+
+    enemy.health = 100
+    assert enemy.get_health_color() == enemy.color
+    enemy.health = 0
+    assert enemy.get_health_color() == ENEMY_DAMAGED_COLOR
+    enemy.health = 51
+    color = enemy.get_health_color()
+    enemy.health = 53
+    assert enemy.get_health_color() == color
@@ -0,0 +1,61 @@
+"""
+Tests for the TextCache class.
+"""
+
+import pytest
+import pygame
+from tower.ui.text_cache import TextCache
+from tower.ui.game_ui import GameUI
+from tower.config.color import WHITE, RED
+
+
+@pytest.fixture
+def font():
+    """Create a font."""
+    return pygame.font.SysFont(None, 24)
+
+
+def test_text_is_rendered_once(font):
+    """Test if the same text, font and color reuse one surface."""
+    first = TextCache.render(font, "Points: 100", WHITE)
+    second = TextCache.render(font, "Points: 100", WHITE)
+
+    assert first is second
+    assert TextCache.size() == 1
+
+    # Another color or another text is rendered separately
+    assert TextCache.render(font, "Points: 100", RED) is not first
+    assert TextCache.render(font, "Points: 125", WHITE) is not first
+    assert TextCache.size() == 3
+
+
+def test_least_recently_used_text_is_evicted(font, monkeypatch):
+    """Test if the cache drops the least recently used text when full."""
+    monkeypatch.setattr(TextCache, "capacity", 2)
+    first = TextCache.render(font, "first", WHITE)
+    TextCache.render(font, "second", WHITE)
+
+    # Using the first text again makes the second one the oldest
+    assert TextCache.render(font, "first", WHITE) is first
+    TextCache.render(font, "third", WHITE)
+
+    assert TextCache.size() == 2
+    assert TextCache.render(font, "first", WHITE) is first
+
+
+def test_hud_renders_only_changed_values():
+    """Test if redrawing the HUD with the same values renders nothing new."""
+    game_ui = GameUI(pygame.Surface((950, 400)))
+    game_ui.draw_points(100)
+    game_ui.draw_lives(20)
+    game_ui.draw_high_score(500)
+    cached = TextCache.size()
+
+    for _ in range(10):
+        game_ui.draw_points(100)
+        game_ui.draw_lives(20)
+        game_ui.draw_high_score(500)
+    assert TextCache.size() == cached
+
+    game_ui.draw_points(125)
+    assert TextCache.size() == cached + 1
@@ -6,6 +6,7 @@ import pytest
 import pygame
 from tower.entities.tour_base import TourBase
 from tower.entities.enemy_base import EnemyBase
+from tower.design.spatial_index import SpatialHash
 from tower.game.game_manager import GameManager
 from tower.config.constants import CELL_SIZE
 
@@ -39,13 +40,13 @@ def test_tower_initialization(test_tower):
     assert not test_tower.is_attacking
 
 
-def test_tower_position(test_tower):
+def test_tower_position(test_tower, test_screen):
     """Test if tower position is correctly calculated."""
     expected_x = test_tower.column * CELL_SIZE
     expected_y = test_tower.row * CELL_SIZE
 
-    # Draw tower to test position calculation
-    test_tower.draw([], None)
+    # Render tower to test position calculation
+    test_tower.render(test_screen)
 
     assert test_tower.cell_size * test_tower.column == expected_x
     assert test_tower.cell_size * test_tower.row == expected_y
@@ -66,13 +67,8 @@ def test_tower_attack_range(test_tower, test_enemy):
     test_enemy.visible = True
     test_enemy.health = 100
 
-    # Set last attack time to allow immediate attack
-    current_time = pygame.time.get_ticks()
-    test_tower.last_attack_time = current_time - (1 / test_tower.attack_speed) * 2000
-
-    enemies = [test_enemy]
-    game_manager = GameManager()
-    test_tower.draw(enemies, game_manager)
+    # A new tower can attack immediately
+    test_tower.update(16, SpatialHash([test_enemy]))
 
     # Enemy should be in range and tower should be attacking
     assert test_tower.is_attacking
@@ -90,13 +86,52 @@ def test_tower_attack_animation(test_tower, test_enemy):
     assert not test_tower.is_attacking
     test_tower.current_target = None  # Set current target to None explicitly
 
-    # Set last attack time to allow immediate attack
-    current_time = pygame.time.get_ticks()
-    test_tower.last_attack_time = current_time - (1 / test_tower.attack_speed) * 2000
-
-    # Draw tower with enemy in range
-    test_tower.draw([test_enemy], GameManager())
+    # Update tower with enemy in range
+    test_tower.update(16, SpatialHash([test_enemy]))
 
     # Check attack state
     assert test_tower.is_attacking
     assert test_tower.current_target == test_enemy
+
+
+def test_tower_update_without_surface(test_enemy):
+    """Test if the attack logic runs without any surface."""
+    tower = TourBase(None, 1, 1)
+    test_enemy.x = tower.column * CELL_SIZE
+    test_enemy.y = tower.row * CELL_SIZE
+    initial_health = test_enemy.health
+
+    tower.update(16, SpatialHash([test_enemy]))
+
+    assert test_enemy.health == initial_health - tower.damage
+
+
+def test_tower_render_with_range(test_tower, test_screen):
+    """Test if the tower renders its range and attack beam."""
+    test_tower.render(test_screen, show_range=True)
+    assert True  # If we got here without errors, the drawing worked
+
+
+def test_tower_attack_cooldown(test_tower, test_enemy):
+    """Test if the tower waits for its attack delay in simulation time."""
+    test_enemy.x = test_tower.column * CELL_SIZE
+    test_enemy.y = test_tower.row * CELL_SIZE
+    enemy_index = SpatialHash([test_enemy])
+    attack_delay = 1000 / test_tower.attack_speed
+
+    test_tower.update(16, enemy_index)
+    health_after_first_attack = test_enemy.health
+
+    test_tower.update(attack_delay / 2, enemy_index)
+    assert test_enemy.health == health_after_first_attack
+
+    test_tower.update(attack_delay / 2, enemy_index)
+    assert test_enemy.health < health_after_first_attack
+
+
+def test_tower_is_slotted(test_tower):
+    """Test if towers keep no per-instance dictionary and share their stats through the class."""
+    assert not hasattr(test_tower, "__dict__")
+    assert not hasattr(test_tower, "screen")
+    assert TourBase.attack_range == test_tower.attack_range
+    assert TourBase.cost == test_tower.cost
@@ -4,7 +4,7 @@ Tests for the Track class.
 
 import pytest
 import pygame
-from tower.design.track import Track
+from tower.design.track import Track, TrackPath
 from tower.config.constants import CELL_SIZE, BOARD_WIDTH, BOARD_HEIGHT
 
 
@@ -67,11 +67,39 @@ def test_track_progress(test_track):
     assert end_col > start_col  # Track should progress to the right
 
 
-def test_track_drawing(test_track):
+def test_track_drawing(test_track, test_screen):
     """Test if track can be drawn."""
     test_track.generate_random_track()
-    test_track.draw()  # Should not raise any exceptions
+    test_track.render(test_screen)  # Should not raise any exceptions
 
     # Get track data
     track_points = test_track.get_track()
     assert len(track_points) > 0
+
+
+def test_path_is_computed_on_generation(test_track):
+    """Test if the pixel polyline follows the generated track."""
+    test_track.generate_random_track()
+    path = test_track.path
+
+    assert len(path.waypoints) == len(test_track.get_track())
+    # Every move goes to a neighboring cell
+    assert path.total_length == pytest.approx(CELL_SIZE * (len(path.waypoints) - 1))
+
+
+def test_path_positions():
+    """Test if a distance along the path maps to the expected coordinates."""
+    path = TrackPath([(0, 0), (0, 2), (3, 2)])
+    half = CELL_SIZE // 2
+
+    assert path.starts == [0, 2 * CELL_SIZE, 5 * CELL_SIZE]
+    assert path.directions == [(1.0, 0.0), (0.0, 1.0)]
+
+    segment = path.get_segment(CELL_SIZE)
+    assert segment == 0
+    assert path.get_position(CELL_SIZE, segment) == (half + CELL_SIZE, half)
+
+    # Walking forward from an earlier segment finds the same one
+    segment = path.get_segment(3 * CELL_SIZE, hint=0)
+    assert segment == path.get_segment(3 * CELL_SIZE, hint=1) == 1
+    assert path.get_position(3 * CELL_SIZE, segment) == (half + 2 * CELL_SIZE, half + CELL_SIZE)